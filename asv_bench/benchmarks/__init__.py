@@ -0,0 +1,3 @@
+"""
+Benchmarks, run with `airspeed velocity <https://asv.readthedocs.io>`_
+"""
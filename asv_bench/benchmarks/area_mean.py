@@ -0,0 +1,165 @@
+"""
+Benchmarks of area-weighted means
+"""
+import cf_xarray  # noqa: F401 # required to add cf accessors
+import numpy as np
+import pint_xarray
+import xarray as xr
+from openscm_units import unit_registry
+
+from carpet_concentrations.xarray_utils import (
+    calculate_regional_means,
+    calculate_weighted_area_mean,
+    calculate_weighted_area_mean_latitude_only,
+)
+
+pint_xarray.accessors.default_registry = pint_xarray.setup_registry(unit_registry)
+
+
+class CalculateWeightedAreaMeanLatitudeOnly:
+    """
+    Benchmark :func:`calculate_weighted_area_mean_latitude_only`
+    """
+
+    params = [[100, 750], [36, 96], [True, False]]
+    param_names = ["n_years", "n_lats", "keep_other_variables"]
+
+    def setup(self, n_years, n_lats, keep_other_variables):
+        """
+        Create monthly data with ``n_years`` years and ``n_lats`` latitudes
+        """
+        rng = np.random.default_rng(0)
+
+        self.ds = (
+            xr.Dataset(
+                {
+                    "co2": (
+                        ("year", "month", "lat"),
+                        rng.random((n_years, 12, n_lats)),
+                        {"units": "ppm"},
+                    )
+                },
+                coords={
+                    "year": np.arange(1750, 1750 + n_years),
+                    "month": np.arange(1, 13),
+                    "lat": np.linspace(-90, 90, n_lats + 1)[:-1] + 90 / n_lats,
+                },
+            )
+            .cf.add_bounds("lat")
+            .pint.quantify({"lat_bounds": "deg"})
+        )
+
+    def time_calculate_weighted_area_mean_latitude_only(
+        self, n_years, n_lats, keep_other_variables
+    ):
+        """
+        Time calculating the area-weighted mean
+        """
+        calculate_weighted_area_mean_latitude_only(
+            self.ds, ["co2"], keep_other_variables=keep_other_variables
+        )
+
+    def peakmem_calculate_weighted_area_mean_latitude_only(
+        self, n_years, n_lats, keep_other_variables
+    ):
+        """
+        Peak memory when calculating the area-weighted mean
+        """
+        calculate_weighted_area_mean_latitude_only(
+            self.ds, ["co2"], keep_other_variables=keep_other_variables
+        )
+
+
+class CalculateWeightedAreaMeanLatLon:
+    """
+    Benchmark :func:`calculate_weighted_area_mean` on a latitude-longitude grid
+    """
+
+    params = [[10, 100], [False, True]]
+    param_names = ["n_years", "masked"]
+
+    def setup(self, n_years, masked):
+        """
+        Create monthly data on a 1.875 degree grid with ``n_years`` years
+        """
+        rng = np.random.default_rng(0)
+        n_lats = 96
+        n_lons = 192
+
+        self.ds = (
+            xr.Dataset(
+                {
+                    "co2": (
+                        ("year", "month", "lat", "lon"),
+                        rng.random((n_years, 12, n_lats, n_lons)),
+                        {"units": "ppm"},
+                    )
+                },
+                coords={
+                    "year": np.arange(1750, 1750 + n_years),
+                    "month": np.arange(1, 13),
+                    "lat": np.linspace(-90, 90, n_lats + 1)[:-1] + 90 / n_lats,
+                    "lon": np.linspace(0, 360, n_lons + 1)[:-1] + 180 / n_lons,
+                },
+            )
+            .cf.add_bounds(["lat", "lon"])
+            .pint.quantify({"lat_bounds": "deg", "lon_bounds": "deg"})
+        )
+        self.mask = (self.ds["lat"] > 0) if masked else None
+
+    def time_calculate_weighted_area_mean(self, n_years, masked):
+        """
+        Time calculating the area-weighted mean
+        """
+        calculate_weighted_area_mean(self.ds, ["co2"], mask=self.mask)
+
+    def peakmem_calculate_weighted_area_mean(self, n_years, masked):
+        """
+        Peak memory when calculating the area-weighted mean
+        """
+        calculate_weighted_area_mean(self.ds, ["co2"], mask=self.mask)
+
+
+class CalculateRegionalMeans:
+    """
+    Benchmark calculating global, northern and southern hemisphere means
+    """
+
+    params = [[100, 750], ["single_pass", "masked"]]
+    param_names = ["n_years", "method"]
+
+    def setup(self, n_years, method):
+        """
+        Create monthly data with ``n_years`` years and 96 latitudes
+        """
+        rng = np.random.default_rng(0)
+        n_lats = 96
+
+        self.ds = (
+            xr.Dataset(
+                {
+                    "co2": (
+                        ("year", "month", "lat"),
+                        rng.random((n_years, 12, n_lats)),
+                        {"units": "ppm"},
+                    )
+                },
+                coords={
+                    "year": np.arange(1750, 1750 + n_years),
+                    "month": np.arange(1, 13),
+                    "lat": np.linspace(-90, 90, n_lats + 1)[:-1] + 90 / n_lats,
+                },
+            )
+            .cf.add_bounds("lat")
+            .pint.quantify({"lat_bounds": "deg"})
+        )
+
+    def time_calculate_regional_means(self, n_years, method):
+        """
+        Time calculating the regional means
+        """
+        if method == "single_pass":
+            calculate_regional_means(self.ds, ["co2"])
+        else:
+            for mask in (None, self.ds["lat"] > 0, self.ds["lat"] < 0):
+                calculate_weighted_area_mean(self.ds, ["co2"], mask=mask)
@@ -0,0 +1,236 @@
+"""
+Benchmarks of gridding
+"""
+import cf_xarray  # noqa: F401 # required to add cf accessors
+import numpy as np
+import pint_xarray
+import xarray as xr
+from openscm_units import unit_registry
+
+from carpet_concentrations.gridders import LatitudeSeasonalityGridder
+from carpet_concentrations.xarray_utils import (
+    calculate_weighted_area_mean_latitude_only,
+)
+
+pint_xarray.accessors.default_registry = pint_xarray.setup_registry(unit_registry)
+
+
+def create_gridding_values(n_years, n_lats):
+    """
+    Create valid gridding values with ``n_years`` years and ``n_lats`` latitudes
+    """
+    rng = np.random.default_rng(0)
+
+    seasonality = rng.random((n_years, 12, n_lats))
+    seasonality -= seasonality.mean(axis=1, keepdims=True)
+
+    return (
+        xr.Dataset(
+            {
+                "seasonality": (
+                    ("year", "month", "lat"),
+                    seasonality,
+                    {"units": "ppm"},
+                ),
+                "latitudinal_gradient": (
+                    ("year", "month", "lat"),
+                    np.zeros((n_years, 12, n_lats)),
+                    {"units": "ppb"},
+                ),
+            },
+            coords={
+                "year": np.arange(1750, 1750 + n_years),
+                "month": np.arange(1, 13),
+                "lat": np.linspace(-90, 90, n_lats + 1)[:-1] + 90 / n_lats,
+            },
+        )
+        .cf.add_bounds("lat")
+        .pint.quantify({"lat_bounds": "deg"})
+    )
+
+
+def create_global_means(n_years, n_scenarios):
+    """
+    Create global-means with ``n_years`` years and ``n_scenarios`` scenarios
+    """
+    rng = np.random.default_rng(0)
+
+    return xr.Dataset(
+        {
+            "co2": (
+                ("scenario", "year", "month"),
+                280 + rng.random((n_scenarios, n_years, 12)),
+                {"units": "ppm"},
+            )
+        },
+        coords={
+            "scenario": np.arange(n_scenarios),
+            "year": np.arange(1750, 1750 + n_years),
+            "month": np.arange(1, 13),
+        },
+    ).pint.quantify()
+
+
+class LatitudeSeasonalityGridderCalculate:
+    """
+    Benchmark :meth:`LatitudeSeasonalityGridder.calculate`
+    """
+
+    params = [[1, 10], ["ppm", "ppb"], [False, True]]
+    param_names = ["n_scenarios", "global_means_units", "strip_units"]
+
+    def setup(self, n_scenarios, global_means_units, strip_units):
+        """
+        Create a gridder and global-means with 750 years and 96 latitudes
+        """
+        n_years = 750
+
+        self.gridder = LatitudeSeasonalityGridder(create_gridding_values(n_years, 96))
+        self.global_means = create_global_means(n_years, n_scenarios).pint.to(
+            global_means_units
+        )
+        # Fill the caches, we're interested in repeated calls
+        self.gridder.calculate(self.global_means, strip_units=strip_units)
+
+    def time_calculate(self, n_scenarios, global_means_units, strip_units):
+        """
+        Time gridding
+        """
+        self.gridder.calculate(self.global_means, strip_units=strip_units)
+
+
+class LatitudeSeasonalityGridderScaling:
+    """
+    Benchmark :meth:`LatitudeSeasonalityGridder.calculate` as the inputs grow
+    """
+
+    params = [[100, 750], [36, 96], [1, 10]]
+    param_names = ["n_years", "n_lats", "n_scenarios"]
+
+    def setup(self, n_years, n_lats, n_scenarios):
+        """
+        Create a gridder and global-means
+        """
+        self.gridder = LatitudeSeasonalityGridder(
+            create_gridding_values(n_years, n_lats)
+        )
+        self.global_means = create_global_means(n_years, n_scenarios)
+        # Fill the caches, we're interested in repeated calls
+        self.gridder.calculate(self.global_means)
+
+    def time_calculate(self, n_years, n_lats, n_scenarios):
+        """
+        Time gridding
+        """
+        self.gridder.calculate(self.global_means)
+
+    def peakmem_calculate(self, n_years, n_lats, n_scenarios):
+        """
+        Peak memory when gridding
+        """
+        self.gridder.calculate(self.global_means)
+
+
+class LatitudeSeasonalityGridderInit:
+    """
+    Benchmark initialising :class:`LatitudeSeasonalityGridder`
+    """
+
+    params = [[100, 750], ["full", "sampled", "trusted"]]
+    param_names = ["n_years", "validation"]
+
+    def setup(self, n_years, validation):
+        """
+        Create gridding values with 96 latitudes
+        """
+        self.gridding_values = create_gridding_values(n_years, 96)
+        # Record the gridding values as validated, so "trusted" can skip checks
+        LatitudeSeasonalityGridder(self.gridding_values, validation="trusted")
+
+    def time_init(self, n_years, validation):
+        """
+        Time initialising (and hence validating)
+        """
+        LatitudeSeasonalityGridder(self.gridding_values, validation=validation)
+
+
+class LatitudeSeasonalityGridderAreaMean:
+    """
+    Benchmark the area-mean of gridded values, calculated in different ways
+    """
+
+    params = [[1, 10], ["grid", "lazy", "invariant"]]
+    param_names = ["n_scenarios", "method"]
+
+    def setup(self, n_scenarios, method):
+        """
+        Create a gridder and global-means with 750 years and 96 latitudes
+        """
+        n_years = 750
+
+        self.gridder = LatitudeSeasonalityGridder(create_gridding_values(n_years, 96))
+        self.global_means = create_global_means(n_years, n_scenarios)
+        # Fill the caches, we're interested in repeated calls
+        self.time_area_mean(n_scenarios, method)
+
+    def time_area_mean(self, n_scenarios, method):
+        """
+        Time gridding then taking the area-mean
+        """
+        if method == "invariant":
+            self.gridder.calculate_area_mean(self.global_means)
+        elif method == "lazy":
+            self.gridder.calculate_lazy(self.global_means).area_mean()
+        else:
+            calculate_weighted_area_mean_latitude_only(
+                self.gridder.calculate(self.global_means).assign_coords(
+                    lat_bounds=self.gridder.gridding_values["lat_bounds"]
+                ),
+                ["co2"],
+                keep_other_variables=False,
+            )
+
+
+class LatitudeSeasonalityGridderGases:
+    """
+    Benchmark gridding many gases, one at a time or batched
+    """
+
+    params = [[10, 40], ["loop", "batched"]]
+    param_names = ["n_gases", "method"]
+
+    def setup(self, n_gases, method):
+        """
+        Create gridding values and global-means with 100 years and 96 latitudes
+        """
+        n_years = 100
+
+        gridding_values = create_gridding_values(n_years, 96)
+        global_means = create_global_means(n_years, 1)["co2"]
+        gases = [f"gas_{i}" for i in range(n_gases)]
+
+        if method == "loop":
+            self.gridders = {
+                gas: LatitudeSeasonalityGridder(gridding_values) for gas in gases
+            }
+            self.global_means = {
+                gas: global_means.to_dataset(name=gas) for gas in gases
+            }
+        else:
+            self.gridder = LatitudeSeasonalityGridder.from_gases(
+                {gas: gridding_values for gas in gases}
+            )
+            self.global_means = xr.Dataset({gas: global_means for gas in gases})
+
+        # Fill the caches, we're interested in repeated calls
+        self.time_calculate(n_gases, method)
+
+    def time_calculate(self, n_gases, method):
+        """
+        Time gridding all the gases
+        """
+        if method == "loop":
+            for gas, gridder in self.gridders.items():
+                gridder.calculate(self.global_means[gas])
+        else:
+            self.gridder.calculate_gases(self.global_means)
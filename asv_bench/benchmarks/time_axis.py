@@ -0,0 +1,149 @@
+"""
+Benchmarks of time axis handling
+"""
+import cftime
+import numpy as np
+import xarray as xr
+
+from carpet_concentrations.input4MIPs.dataset import add_time_bounds
+from carpet_concentrations.time import (
+    convert_time_to_year_month,
+    convert_year_month_to_time,
+    interpolate_annual_mean_to_monthly_values,
+)
+
+
+class AddTimeBounds:
+    """
+    Benchmark :func:`carpet_concentrations.input4MIPs.dataset.add_time_bounds`
+    """
+
+    params = [10_000, 30_000, 100_000]
+    param_names = ["n_timesteps"]
+
+    def setup(self, n_timesteps):
+        """
+        Create a monthly dataset with ``n_timesteps`` timesteps
+        """
+        codes = np.arange(n_timesteps)
+        time = [cftime.datetime(1 + c // 12, c % 12 + 1, 15) for c in codes]
+
+        self.ds = xr.Dataset(
+            {"co2": (("time",), np.zeros(n_timesteps))},
+            coords={"time": time},
+        )
+
+    def time_add_time_bounds(self, n_timesteps):
+        """
+        Time adding monthly time bounds
+        """
+        # add_time_bounds works in place, hence copy
+        add_time_bounds(self.ds.copy(), monthly_time_bounds=True)
+
+    def peakmem_add_time_bounds(self, n_timesteps):
+        """
+        Peak memory when adding monthly time bounds
+        """
+        add_time_bounds(self.ds.copy(), monthly_time_bounds=True)
+
+
+class ConvertYearMonthToTime:
+    """
+    Benchmark :func:`carpet_concentrations.time.convert_year_month_to_time`
+    """
+
+    params = [[100, 750], [1, 100]]
+    param_names = ["n_years", "n_scenarios"]
+
+    def setup(self, n_years, n_scenarios):
+        """
+        Create a dataset with ``n_years`` years of monthly data
+        """
+        self.ds = xr.Dataset(
+            {
+                "co2": (
+                    ("scenario", "year", "month"),
+                    np.zeros((n_scenarios, n_years, 12)),
+                )
+            },
+            coords={
+                "scenario": range(n_scenarios),
+                "year": np.arange(1750, 1750 + n_years),
+                "month": np.arange(1, 13),
+            },
+        )
+
+    def time_convert_year_month_to_time(self, n_years, n_scenarios):
+        """
+        Time converting year and month to a time axis
+        """
+        convert_year_month_to_time(self.ds)
+
+    def peakmem_convert_year_month_to_time(self, n_years, n_scenarios):
+        """
+        Peak memory when converting year and month to a time axis
+        """
+        convert_year_month_to_time(self.ds)
+
+
+class ConvertTimeToYearMonth:
+    """
+    Benchmark :func:`carpet_concentrations.time.convert_time_to_year_month`
+    """
+
+    params = [[100, 750], [1, 100]]
+    param_names = ["n_years", "n_scenarios"]
+
+    def setup(self, n_years, n_scenarios):
+        """
+        Create a dataset with ``n_years`` years of monthly data
+        """
+        self.ds = convert_year_month_to_time(
+            xr.Dataset(
+                {
+                    "co2": (
+                        ("scenario", "year", "month"),
+                        np.zeros((n_scenarios, n_years, 12)),
+                    )
+                },
+                coords={
+                    "scenario": range(n_scenarios),
+                    "year": np.arange(1750, 1750 + n_years),
+                    "month": np.arange(1, 13),
+                },
+            ),
+            day=15,
+        )
+
+    def time_convert_time_to_year_month(self, n_years, n_scenarios):
+        """
+        Time converting a time axis to year and month
+        """
+        convert_time_to_year_month(self.ds)
+
+    def peakmem_convert_time_to_year_month(self, n_years, n_scenarios):
+        """
+        Peak memory when converting a time axis to year and month
+        """
+        convert_time_to_year_month(self.ds)
+
+
+class InterpolateAnnualMeanToMonthly:
+    """
+    Benchmark :func:`interpolate_annual_mean_to_monthly_values`
+    """
+
+    params = [[100, 750], [1, 1000]]
+    param_names = ["n_years", "n_scenarios"]
+
+    def setup(self, n_years, n_scenarios):
+        """
+        Create annual-means with ``n_years`` years and ``n_scenarios`` scenarios
+        """
+        self.annual = 280 + np.random.default_rng(0).random((n_years, n_scenarios))
+
+    def time_interpolate(self, n_years, n_scenarios):
+        """
+        Time interpolating
+        """
+        interpolate_annual_mean_to_monthly_values(self.annual)
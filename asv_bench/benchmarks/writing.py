@@ -0,0 +1,266 @@
+"""
+Benchmarks of writing to disk
+"""
+import shutil
+import tempfile
+from pathlib import Path
+
+import cf_xarray.units
+import numpy as np
+import pint_xarray  # noqa: F401 # required to enable pint accessors
+import xarray as xr
+
+from carpet_concentrations.input4MIPs.dataset import (
+    Input4MIPsDataset,
+    Input4MIPsGrid,
+    Input4MIPsMetadata,
+)
+from carpet_concentrations.input4MIPs.parallel import write_periods_in_parallel
+from carpet_concentrations.time import convert_year_month_to_time
+
+METADATA = Input4MIPsMetadata(
+    contact="contact test (test@address.com)",
+    dataset_category="GHGConcentrations",
+    frequency="mon",
+    further_info_url="cmip6.science.unimelb.edu.au",
+    grid_label="gn",
+    Conventions="CF-1.6",
+    activity_id="input4MIPs",
+    institution="Climate Resource",
+    institution_id="CR",
+    mip_era="CMIP6",
+    nominal_resolution="10000 km",
+    realm="atmos",
+    source_version="1.2.1",
+    source_id="CR-1-2-1",
+    source="CR 1.2.1: Benchmark file",
+    target_mip="ScenarioMIP",
+    title="CR 1.2.1 benchmark dataset",
+)
+
+
+def create_monthly_dataset(n_years, n_lats):
+    """
+    Create a monthly dataset with ``n_years`` years and ``n_lats`` latitudes
+    """
+    rng = np.random.default_rng(0)
+
+    ds = convert_year_month_to_time(
+        xr.Dataset(
+            {
+                "mole_fraction_of_carbon_dioxide_in_air": (
+                    ("lat", "year", "month"),
+                    280 + rng.random((n_lats, n_years, 12)),
+                    {"units": "ppm"},
+                )
+            },
+            coords={
+                "year": np.arange(1750, 1750 + n_years),
+                "month": np.arange(1, 13),
+                "lat": np.linspace(-90, 90, n_lats + 1)[:-1] + 90 / n_lats,
+            },
+        ),
+        day=15,
+    ).pint.quantify(unit_registry=cf_xarray.units.units)
+    ds["time"].encoding = {
+        "calendar": "standard",
+        "units": "days since 1750-01-01",
+    }
+
+    return ds
+
+
+class Input4MIPsDatasetWrite:
+    """
+    Benchmark :meth:`Input4MIPsDataset.write`
+    """
+
+    params = [[100, 750], [36, 96], ["float64", "float32"]]
+    param_names = ["n_years", "n_lats", "dtype"]
+
+    def setup(self, n_years, n_lats, dtype):
+        """
+        Create a monthly dataset with ``n_years`` years and ``n_lats`` latitudes
+        """
+        ds = create_monthly_dataset(n_years, n_lats)
+
+        self.input4mips_ds = (
+            Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+                ds,
+                ("time", "lat"),
+                metadata=METADATA,
+            )
+        )
+        self.root_data_dir = Path(tempfile.mkdtemp())
+
+    def teardown(self, n_years, n_lats, dtype):
+        """
+        Remove the written files
+        """
+        shutil.rmtree(self.root_data_dir)
+
+    def time_write(self, n_years, n_lats, dtype):
+        """
+        Time writing
+        """
+        self.input4mips_ds.write(self.root_data_dir, dtype=dtype)
+
+    def peakmem_write(self, n_years, n_lats, dtype):
+        """
+        Peak memory when writing
+        """
+        self.input4mips_ds.write(self.root_data_dir, dtype=dtype)
+
+
+class Input4MIPsDatasetWritePeriods:
+    """
+    Benchmark writing one file against writing a file per period in parallel
+    """
+
+    params = [[None, 50, 250]]
+    param_names = ["years_per_period"]
+
+    def setup(self, years_per_period):
+        """
+        Create a monthly dataset with 750 years and 96 latitudes
+        """
+        ds = create_monthly_dataset(750, 96)
+
+        self.input4mips_ds = (
+            Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+                ds,
+                ("time", "lat"),
+                metadata=METADATA,
+            )
+        )
+        self.root_data_dir = Path(tempfile.mkdtemp())
+
+    def teardown(self, years_per_period):
+        """
+        Remove the written files
+        """
+        shutil.rmtree(self.root_data_dir)
+
+    def time_write(self, years_per_period):
+        """
+        Time writing
+        """
+        if years_per_period is None:
+            self.input4mips_ds.write(self.root_data_dir)
+        else:
+            write_periods_in_parallel(
+                self.input4mips_ds, self.root_data_dir, years_per_period
+            )
+
+
+class Input4MIPsDatasetWriteZarr:
+    """
+    Benchmark :meth:`Input4MIPsDataset.write_zarr` against writing netCDF
+    """
+
+    params = [[100, 750], ["netcdf", "zarr"]]
+    param_names = ["n_years", "backend"]
+
+    def setup(self, n_years, backend):
+        """
+        Create a monthly dataset with ``n_years`` years and 96 latitudes
+        """
+        if backend == "zarr":
+            try:
+                import zarr  # noqa: F401
+            except ImportError as exc:
+                raise NotImplementedError("zarr not installed") from exc  # noqa: TRY003
+
+        ds = create_monthly_dataset(n_years, 96)
+
+        self.input4mips_ds = (
+            Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+                ds,
+                ("time", "lat"),
+                metadata=METADATA,
+            )
+        )
+        self.root_data_dir = Path(tempfile.mkdtemp())
+
+    def teardown(self, n_years, backend):
+        """
+        Remove the written files
+        """
+        shutil.rmtree(self.root_data_dir)
+
+    def time_write(self, n_years, backend):
+        """
+        Time writing
+        """
+        if backend == "zarr":
+            self.input4mips_ds.write_zarr(self.root_data_dir, time_chunk_size=120)
+        else:
+            self.input4mips_ds.write(self.root_data_dir)
+
+
+class Input4MIPsDatasetFromMetadata:
+    """
+    Benchmark :meth:`Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions`
+    """
+
+    params = [[96, 720], [True, False]]
+    param_names = ["n_lats", "copy"]
+
+    def setup(self, n_lats, copy):
+        """
+        Create a monthly dataset with 750 years and ``n_lats`` latitudes
+        """
+        self.ds = create_monthly_dataset(750, n_lats)
+
+    def time_from_metadata(self, n_lats, copy):
+        """
+        Time preparing the dataset
+        """
+        Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+            self.ds, ("time", "lat"), metadata=METADATA, copy=copy
+        )
+
+    def peakmem_from_metadata(self, n_lats, copy):
+        """
+        Peak memory when preparing the dataset
+        """
+        Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+            self.ds, ("time", "lat"), metadata=METADATA, copy=copy
+        )
+
+
+class Input4MIPsDatasetFromMetadataManyVariables:
+    """
+    Benchmark preparing many variables which share the same grid
+    """
+
+    params = [[10, 40], [False, True]]
+    param_names = ["n_variables", "shared_grid"]
+
+    def setup(self, n_variables, shared_grid):
+        """
+        Create monthly datasets with 750 years and 96 latitudes
+        """
+        ds = create_monthly_dataset(750, 96)
+        self.datasets = [
+            ds.rename({"mole_fraction_of_carbon_dioxide_in_air": f"variable_{i}"})
+            for i in range(n_variables)
+        ]
+        # Warm up cf-xarray's attribute handling
+        self.time_from_metadata(n_variables, shared_grid)
+
+    def time_from_metadata(self, n_variables, shared_grid):
+        """
+        Time preparing all the datasets
+        """
+        dimensions = ("time", "lat")
+        grid = (
+            Input4MIPsGrid.from_dataset(self.datasets[0], dimensions)
+            if shared_grid
+            else None
+        )
+
+        for ds in self.datasets:
+            Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+                ds, dimensions, metadata=METADATA, copy=False, grid=grid
+            )
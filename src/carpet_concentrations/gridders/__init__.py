@@ -4,3 +4,6 @@ Gridders
 from carpet_concentrations.gridders.latitude_seasonality_gridder import (
     LatitudeSeasonalityGridder,  # noqa: F401
 )
+from carpet_concentrations.gridders.lazy_result import (
+    LazyGriddedResult,  # noqa: F401
+)
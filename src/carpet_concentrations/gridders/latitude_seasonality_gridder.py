@@ -4,15 +4,19 @@ Gridder based on pre-calculated latitudinal gradient and seasonality
 from __future__ import annotations
 
 from functools import partial
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, overload
 
 import numpy as np
+import xarray as xr
 from attrs import define, field
+from attrs.validators import ge, in_
 
 from carpet_concentrations.attrs_utils import (
     make_attrs_validator_compatible_value_instance_input,
 )
+from carpet_concentrations.gridders.lazy_result import LazyGriddedResult
 from carpet_concentrations.xarray_pint_utils import (
+    check_pint_quantified_array,
     check_pint_quantified_dataset,
     check_pint_quantified_dataset_attrs,
 )
@@ -20,10 +24,88 @@ from carpet_concentrations.xarray_utils import (
     calculate_weighted_area_mean_latitude_only,
     check_all_units_compatible_attrs,
     check_dimensions,
+    get_area_weights,
+    get_chunk_indexers,
+    get_dataset_fingerprint,
 )
 
 if TYPE_CHECKING:
-    import xarray as xr
+    from collections.abc import Iterator, Mapping
+
+    import numpy.typing as npt
+    import pint
+
+VALIDATION_LEVELS: tuple[str, ...] = ("full", "sampled", "trusted")
+"""
+Options for the level of validation of gridding values
+
+See :attr:`LatitudeSeasonalityGridder.validation`
+"""
+
+
+@define
+class ValidatedFingerprintCache:
+    """
+    Cache of the fingerprints of gridding values which have passed validation
+
+    This is what allows :attr:`LatitudeSeasonalityGridder.validation` of
+    ``"trusted"`` to skip checks. Only the :attr:`max_size` most recently
+    used fingerprints are kept. Use :meth:`clear` to reset the cache (e.g. to
+    force all gridding values to be checked again).
+    """
+
+    max_size: int = field(default=128, validator=ge(1))
+    """Maximum number of fingerprints to keep"""
+
+    _fingerprints: dict[str, None] = field(factory=dict, init=False, repr=False)
+    """Fingerprints, from least to most recently used"""
+
+    def __contains__(self, fingerprint: object) -> bool:
+        """
+        Check whether a fingerprint is in the cache (marking it as used)
+        """
+        if fingerprint not in self._fingerprints:
+            return False
+
+        # Mark as most recently used
+        self._fingerprints[str(fingerprint)] = self._fingerprints.pop(str(fingerprint))
+
+        return True
+
+    def __len__(self) -> int:
+        """
+        Get the number of fingerprints in the cache
+        """
+        return len(self._fingerprints)
+
+    def add(self, fingerprint: str) -> None:
+        """
+        Record that gridding values with a given fingerprint are valid
+
+        Parameters
+        ----------
+        fingerprint
+            Fingerprint to record
+        """
+        self._fingerprints.pop(fingerprint, None)
+        self._fingerprints[fingerprint] = None
+
+        while len(self._fingerprints) > self.max_size:
+            del self._fingerprints[next(iter(self._fingerprints))]
+
+    def clear(self) -> None:
+        """
+        Clear the cache
+        """
+        self._fingerprints.clear()
+
+
+VALIDATED_FINGERPRINTS = ValidatedFingerprintCache()
+"""
+Fingerprints of gridding values which have passed validation in this session
+
+See :class:`ValidatedFingerprintCache`
+"""
 
 
 def _attribute_has_year_month_lat_coords(
@@ -53,34 +135,59 @@ _latitudinal_gradient_has_year_month_lat_coords = (
 )
 
 
+VALIDATION_RTOL: float = 1e-8
+"""
+Tolerance of the checks of the seasonality's and latitudinal gradient's means
+
+The means must be zero to within this tolerance relative to the largest
+absolute value of the variable. The largest absolute value is taken
+separately for each value of any dimensions other than
+``("year", "month", "lat")`` (e.g. for each gas, see
+:meth:`LatitudeSeasonalityGridder.from_gases`). Hence the check is equally
+strict whatever the units of the variable.
+"""
+
+
+def _get_relative_magnitude(mean: xr.DataArray, values: xr.DataArray) -> Any:
+    scale = abs(values.copy(data=values.data.magnitude)).max(("year", "month", "lat"))
+    # All zero values have a mean of exactly zero anyway
+    scale = scale.where(scale > 0, 1)
+
+    # If the values are lazy, so is this. Both reductions are then done in the
+    # same pass through the values.
+    return (mean.copy(data=mean.data.to(values.data.units).magnitude) / scale).data
+
+
 def _seasonality_annual_mean_zero(
     instance: Any,
     value: xr.Dataset,
 ) -> None:
     seasonality = value[instance.seasonality_name]
     np.testing.assert_allclose(
-        seasonality.mean("month").data.magnitude,
+        _get_relative_magnitude(seasonality.mean("month"), seasonality),
         0,
-        atol=1e-8,
+        atol=VALIDATION_RTOL,
         err_msg="seasonality must have an annual-mean of zero in all years",
     )
 
 
-_seasonality_annual_mean_zero_attrs = (
-    make_attrs_validator_compatible_value_instance_input(_seasonality_annual_mean_zero)
-)
-
-
 def _latitudinal_gradient_spatial_mean(
     instance: Any,
     value: xr.Dataset,
 ) -> None:
+    latitudinal_gradient = value[instance.latitudinal_gradient_name]
     np.testing.assert_allclose(
-        calculate_weighted_area_mean_latitude_only(
-            value, [instance.latitudinal_gradient_name]
-        )[instance.latitudinal_gradient_name].data.magnitude,
+        _get_relative_magnitude(
+            calculate_weighted_area_mean_latitude_only(
+                value,
+                [instance.latitudinal_gradient_name],
+                lat_bounds_name=instance.lat_bounds_name,
+                keep_other_variables=False,
+            )[instance.latitudinal_gradient_name],
+            latitudinal_gradient,
+        ),
         0,
-        atol=1e-8,
+        atol=VALIDATION_RTOL,
         err_msg=(
             "latitudinal gradient must have an area-weighted spatial-mean "
             "of zero in all timesteps"
@@ -88,13 +195,60 @@ def _latitudinal_gradient_spatial_mean(
     )
 
 
-_latitudinal_gradient_spatial_mean_zero_attrs = (
-    make_attrs_validator_compatible_value_instance_input(
-        _latitudinal_gradient_spatial_mean
+def _gridding_values_values_valid(
+    instance: Any,
+    value: xr.Dataset,
+) -> None:
+    if instance.validation == "sampled":
+        n_years = value.sizes["year"]
+        sample_idx = np.unique(
+            np.linspace(0, n_years - 1, min(instance.n_validation_samples, n_years))
+            .round()
+            .astype(int)
+        )
+        sampled = value.isel(year=sample_idx)
+        _seasonality_annual_mean_zero(instance, sampled)
+        _latitudinal_gradient_spatial_mean(instance, sampled)
+
+        return
+
+    if instance.validation == "full":
+        _seasonality_annual_mean_zero(instance, value)
+        _latitudinal_gradient_spatial_mean(instance, value)
+
+        return
+
+    # Only fingerprint what is checked. The fingerprint includes the names of
+    # the variables, so a different selection of variables from the same
+    # dataset is never trusted.
+    fingerprint = get_dataset_fingerprint(
+        value[
+            [
+                instance.seasonality_name,
+                instance.latitudinal_gradient_name,
+                instance.lat_bounds_name,
+            ]
+        ]
     )
+    if fingerprint in VALIDATED_FINGERPRINTS:
+        return
+
+    _seasonality_annual_mean_zero(instance, value)
+    _latitudinal_gradient_spatial_mean(instance, value)
+    VALIDATED_FINGERPRINTS.add(fingerprint)
+
+
+_gridding_values_values_valid_attrs = (
+    make_attrs_validator_compatible_value_instance_input(_gridding_values_values_valid)
 )
 
 
+def _check_global_means(global_means: xr.Dataset) -> None:
+    check_pint_quantified_dataset(global_means)
+    for darray in global_means.values():
+        check_dimensions(darray, ("year", "month"), extras_ok=True)
+
+
 @define
 class LatitudeSeasonalityGridder:
     """
@@ -105,9 +259,8 @@ class LatitudeSeasonalityGridder:
         validator=[
             check_pint_quantified_dataset_attrs,
             _seasonality_has_year_month_lat_coords,
-            _seasonality_annual_mean_zero_attrs,
             _latitudinal_gradient_has_year_month_lat_coords,
-            _latitudinal_gradient_spatial_mean_zero_attrs,
+            _gridding_values_values_valid_attrs,
             check_all_units_compatible_attrs,
         ]
     )
@@ -119,7 +272,18 @@ class LatitudeSeasonalityGridder:
     the value of ``seasonality_name`` and ``latitudinal_gradient_name``. Both
     the variables must have at least the dimensions ("year", "month", "lat").
     The seasonality variable must have an annual-mean of zero. The latitudinal
-    gradient must have a spatial-mean of zero.
+    gradient must have a spatial-mean of zero. These two conditions are
+    checked to within a relative tolerance (see :data:`VALIDATION_RTOL`). How
+    thoroughly they are checked is controlled by :attr:`validation`.
+
+    The values can be file-backed and lazy, e.g. from
+    ``xr.open_dataset(path, chunks={"year": 50}).pint.quantify()`` (this
+    requires dask). Validation then reads the values chunk by chunk, rather
+    than loading them into memory, and the perturbation and the output of
+    :meth:`calculate` are lazy too. They are only computed when needed
+    (e.g. chunk by chunk, if using :meth:`calculate_chunked` and writing the
+    output). Memory-mapped arrays should be wrapped with
+    ``dask.array.from_array`` to get the same behaviour.
     """
 
     seasonality_name: str = "seasonality"
@@ -134,7 +298,236 @@ class LatitudeSeasonalityGridder:
     used elsewhere)
     """
 
-    def calculate(self, global_means: xr.Dataset) -> xr.Dataset:
+    lat_bounds_name: str = "lat_bounds"
+    """
+    Name of the latitude bounds variable in ``gridding_values``
+
+    The bounds are used to check the latitudinal gradient's spatial-mean
+    and to calculate area-weighted means.
+    """
+
+    validation: str = field(default="full", validator=in_(VALIDATION_LEVELS))
+    """
+    How thoroughly to check the values in ``gridding_values``
+
+    The dimensions and units are always checked. The checks of the
+    seasonality's annual-mean and the latitudinal gradient's spatial-mean
+    depend on the level:
+
+    - ``"full"``: check all years
+    - ``"sampled"``: only check :attr:`n_validation_samples` years, spread
+      evenly through the data. This is cheap but could miss problems.
+    - ``"trusted"``: skip the checks if the same gridding values have
+      already passed validation with this level in this session, otherwise
+      check all years (as for ``"full"``) and, if the checks pass, record
+      the values as validated. The values are identified by the fingerprint
+      (see
+      :func:`carpet_concentrations.xarray_utils.get_dataset_fingerprint`)
+      of the seasonality, latitudinal gradient and latitude bounds variables
+      (including their names). The fingerprints are kept in
+      :data:`VALIDATED_FINGERPRINTS`.
+    """
+
+    n_validation_samples: int = field(default=10, validator=ge(1))
+    """
+    Number of years to check if :attr:`validation` is ``"sampled"``
+    """
+
+    _perturbation_cache: tuple[xr.Dataset, str, str, xr.DataArray] | None = field(
+        default=None, init=False, repr=False, eq=False
+    )
+    """
+    Cache of :attr:`perturbation` and the inputs from which it was calculated
+    """
+
+    _perturbation_magnitude_cache: dict[str, xr.DataArray] = field(
+        factory=dict, init=False, repr=False, eq=False
+    )
+    """
+    Cache of the magnitude of :attr:`perturbation` in different units
+    """
+
+    _seasonality_area_mean_cache: tuple[
+        xr.Dataset, str, str, xr.DataArray
+    ] | None = field(default=None, init=False, repr=False, eq=False)
+    """
+    Cache of the area-weighted mean of the seasonality and the inputs from
+    which it was calculated
+    """
+
+    @classmethod
+    def from_gases(
+        cls,
+        gridding_values: Mapping[str, xr.Dataset],
+        gas_dim: str = "gas",
+        **kwargs: Any,
+    ) -> LatitudeSeasonalityGridder:
+        """
+        Create a single gridder for many gases
+
+        The gridding values of each gas are stacked along ``gas_dim``, so
+        they are all validated in one pass and all gases can be gridded at
+        once with :meth:`calculate_gases`.
+
+        Parameters
+        ----------
+        gridding_values
+            Gridding values for each gas. See :attr:`gridding_values` for
+            requirements. All gases must be on the same latitude grid. The
+            values of each gas are converted to the units of the first gas'
+            seasonality before stacking. The validation tolerance is relative
+            to each gas' values (see :data:`VALIDATION_RTOL`), so this
+            doesn't weaken the checks of gases with very different
+            concentrations.
+
+        gas_dim
+            Name of the gas dimension to create
+
+        **kwargs
+            Passed to the initialiser (e.g. ``seasonality_name`` or
+            ``lat_bounds_name``, which apply to each of ``gridding_values``)
+
+        Returns
+        -------
+            Initialised gridder
+
+        Raises
+        ------
+        ValueError
+            ``gridding_values`` is empty or the gases aren't all on the same
+            latitude grid (including the same latitude bounds)
+        """
+        seasonality_name = kwargs.get("seasonality_name", "seasonality")
+        latitudinal_gradient_name = kwargs.get(
+            "latitudinal_gradient_name", "latitudinal_gradient"
+        )
+        lat_bounds_name = kwargs.get("lat_bounds_name", "lat_bounds")
+
+        if not gridding_values:
+            raise ValueError("No gridding values supplied")  # noqa: TRY003
+
+        gases = list(gridding_values)
+        first = gridding_values[gases[0]]
+        lat_bounds = first[lat_bounds_name]
+        different_bounds = [
+            gas
+            for gas in gases[1:]
+            if not gridding_values[gas][lat_bounds_name].equals(lat_bounds)
+        ]
+        if different_bounds:
+            raise ValueError(  # noqa: TRY003
+                f"The {lat_bounds_name!r} of these gases differ from those of "
+                f"{gases[0]!r}: {different_bounds}"
+            )
+
+        seasonality = first[seasonality_name].data
+        units = seasonality.units
+
+        def stack(name: str) -> xr.DataArray:
+            converted = [gridding_values[gas][name].pint.to(units) for gas in gases]
+            stacked: xr.DataArray = xr.concat(
+                [darray.copy(data=darray.data.magnitude) for darray in converted],
+                dim=xr.DataArray(gases, dims=gas_dim, name=gas_dim),
+                join="exact",
+                coords="minimal",
+                compat="override",
+            )
+
+            # Attach units directly, quantifying with pint-xarray is much slower
+            return stacked.copy(data=type(seasonality)(stacked.data, units))
+
+        stacked = xr.Dataset(
+            {
+                seasonality_name: stack(seasonality_name),
+                latitudinal_gradient_name: stack(latitudinal_gradient_name),
+            }
+        ).assign_coords({lat_bounds_name: lat_bounds})
+
+        return cls(stacked, **kwargs)
+
+    @property
+    def perturbation(self) -> xr.DataArray:
+        """
+        Combined seasonality and latitudinal gradient
+
+        This is the sum of the seasonality and the latitudinal gradient, in
+        the seasonality's units, with dimensions ``("year", "month", "lat")``
+        (plus any other dimensions in ``gridding_values``). If the gridding
+        values are in memory, the data is a contiguous array. If they are
+        lazy (e.g. dask arrays), so is the perturbation.
+
+        It is calculated once then cached. The cache is invalidated if
+        :attr:`gridding_values`, :attr:`seasonality_name` or
+        :attr:`latitudinal_gradient_name` are replaced, but not if
+        :attr:`gridding_values` is modified in place.
+        """
+        cache_key = (
+            self.gridding_values,
+            self.seasonality_name,
+            self.latitudinal_gradient_name,
+        )
+        if self._perturbation_cache is not None and all(
+            cached is current
+            for cached, current in zip(self._perturbation_cache[:3], cache_key)
+        ):
+            return self._perturbation_cache[3]
+
+        seasonality = self.gridding_values[self.seasonality_name]
+        units = seasonality.data.units
+        latitudinal_gradient = self.gridding_values[
+            self.latitudinal_gradient_name
+        ].pint.to(units)
+
+        combined = (seasonality + latitudinal_gradient).transpose(
+            "year", "month", "lat", ...
+        )
+        magnitude = combined.data.magnitude
+        if isinstance(magnitude, np.ndarray):
+            # Lazy (e.g. file-backed dask) arrays are left as they are, so
+            # they aren't loaded into memory
+            magnitude = np.ascontiguousarray(magnitude)
+
+        perturbation: xr.DataArray = combined.copy(
+            data=type(combined.data)(magnitude, units)
+        ).rename(None)
+
+        self._perturbation_cache = (*cache_key, perturbation)
+        self._perturbation_magnitude_cache.clear()
+
+        return perturbation
+
+    def get_perturbation_magnitude(self, units: pint.Unit) -> xr.DataArray:
+        """
+        Get the magnitude of :attr:`perturbation` in given units
+
+        The result is cached for each unit (and invalidated along with
+        :attr:`perturbation`), so the unit conversion is only done once.
+
+        Parameters
+        ----------
+        units
+            Units in which to get the magnitude
+
+        Returns
+        -------
+            Magnitude of :attr:`perturbation` in ``units`` (not quantified)
+        """
+        perturbation = self.perturbation
+
+        cache_key = str(units)
+        if cache_key not in self._perturbation_magnitude_cache:
+            self._perturbation_magnitude_cache[cache_key] = perturbation.copy(
+                data=perturbation.data.to(units).magnitude
+            )
+
+        return self._perturbation_magnitude_cache[cache_key]
+
+    def calculate(
+        self,
+        global_means: xr.Dataset,
+        strip_units: bool = False,
+        dtype: npt.DTypeLike | None = None,
+    ) -> xr.Dataset:
         r"""
         Calculate gridded values
 
@@ -148,6 +541,25 @@ class LatitudeSeasonalityGridder:
             ``global_means`` should have also already been turned into a
             pint-compatiable quantity using ``pint.quantify`` or similar.
 
+        strip_units
+            If ``True``, the calculation is done on plain arrays rather than
+            with pint. :attr:`perturbation` is converted to the units of each
+            variable in ``global_means`` up front (see
+            :meth:`get_perturbation_magnitude`), the values are added without
+            any unit handling and the units are reattached to the result. This
+            gives the same result, but avoids pint's overhead on every
+            operation.
+
+        dtype
+            Data type of the output (e.g. ``np.float32``). If not supplied,
+            the output's data type follows from the inputs (normally
+            ``np.float64``). The seasonality and latitudinal gradient are
+            always combined at the precision of ``gridding_values`` (see
+            :attr:`perturbation`), the result of that and ``global_means``
+            are then cast to ``dtype`` before the final addition. Hence the
+            output is created directly with type ``dtype``, without any
+            intermediate array of the output's size in higher precision.
+
         Returns
         -------
             Gridded values on a ``("latitude", "year", "month")`` grid (plus
@@ -183,21 +595,433 @@ class LatitudeSeasonalityGridder:
         have monthly information to avoid step changes in output). Note that
         the global-, annual-mean concentrations :math:`C(y, m)` must be
         pre-interpolated onto monthly steps using a mean-preserving alogrithm
-        [#11 for function which will do this] to avoid spurious steps
-        in the outputs.
+        (e.g. :func:`carpet_concentrations.time.interpolate_annual_mean_to_monthly`)
+        to avoid spurious steps in the outputs.
 
         The ellipses represent extra dimensions (e.g. scenario, greenhouse
         gas) that might be in :math:`C(y, m)`. Any such dimensions are
         preserved in the output.
         """
-        check_pint_quantified_dataset(global_means)
-        for darray in global_means.values():
-            check_dimensions(darray, ("year", "month"), extras_ok=True)
+        if not strip_units:
+            return self.calculate_lazy(global_means, dtype=dtype).compute()
+
+        _check_global_means(global_means)
+
+        if dtype is not None:
+            global_means = global_means.astype(dtype)
+
+        res = {}
+        for name, darray in global_means.data_vars.items():
+            units = darray.data.units
+            perturbation_magnitude = self.get_perturbation_magnitude(units)
+            if dtype is not None:
+                perturbation_magnitude = perturbation_magnitude.astype(dtype)
+
+            res_magnitude = (
+                darray.copy(data=darray.data.magnitude) + perturbation_magnitude
+            )
+            # Attach units directly, quantifying with pint-xarray is much slower
+            res[name] = res_magnitude.copy(
+                data=type(darray.data)(res_magnitude.data, units)
+            )
+
+        res_stripped = xr.Dataset(res)
+
+        return res_stripped
+
+    @overload
+    def calculate_gases(
+        self,
+        global_means: xr.Dataset,
+        gas_dim: str = ...,
+        dtype: npt.DTypeLike | None = ...,
+    ) -> xr.Dataset:
+        ...
+
+    @overload
+    def calculate_gases(
+        self,
+        global_means: xr.DataArray,
+        gas_dim: str = ...,
+        dtype: npt.DTypeLike | None = ...,
+    ) -> xr.DataArray:
+        ...
+
+    def calculate_gases(
+        self,
+        global_means: xr.Dataset | xr.DataArray,
+        gas_dim: str = "gas",
+        dtype: npt.DTypeLike | None = None,
+    ) -> xr.Dataset | xr.DataArray:
+        """
+        Calculate gridded values for many gases at once
+
+        This requires gridding values with a ``gas_dim`` dimension (see
+        :meth:`from_gases`). The global-means of all gases are gridded with a
+        single vectorised addition, rather than one gridder per gas.
+
+        Parameters
+        ----------
+        global_means
+            Global-mean values of each gas. Either an :obj:`xr.DataArray`,
+            with the gases stacked along ``gas_dim`` (hence all in the same
+            units), or an :obj:`xr.Dataset` with one variable per gas (in
+            which case each gas can have different units and the variables
+            are stacked internally). The gases (values of the ``gas_dim``
+            co-ordinate or variable names) must be values of the ``gas_dim``
+            co-ordinate of :attr:`gridding_values`. See :meth:`calculate`
+            for other requirements.
+
+        gas_dim
+            Name of the gas dimension
+
+        dtype
+            Data type of the output. See :meth:`calculate`.
 
-        res = (
-            global_means
-            + self.gridding_values["seasonality"]
-            + self.gridding_values["latitudinal_gradient"]
+        Returns
+        -------
+            Gridded values, of the same type as ``global_means``. If
+            ``global_means`` is an :obj:`xr.DataArray`, the output has
+            ``gas_dim`` as its first dimension. Otherwise, there is one
+            variable per gas. Either way, each gas is in the same units as its
+            global-means and the values are the same as the result of
+            gridding each gas separately.
+
+        Raises
+        ------
+        CoordinateError
+            ``global_means`` does not have at least the dimensions of
+            ``("year", "month")`` (plus ``gas_dim`` if ``global_means`` is an
+            :obj:`xr.DataArray`) or :attr:`perturbation` does not have a
+            ``gas_dim`` dimension
+
+        NotPintQuantifiedError
+            ``global_means`` has not been quantified using ``pint.quantify`` or
+            similar
+
+        ValueError
+            Some gases in ``global_means`` aren't in :attr:`gridding_values`
+        """
+        if isinstance(global_means, xr.DataArray):
+            check_pint_quantified_array(global_means)
+            check_dimensions(global_means, ("year", "month", gas_dim), extras_ok=True)
+
+            gases = list(global_means[gas_dim].to_numpy())
+            units = {gas: global_means.data.units for gas in gases}
+            global_means_magnitude = global_means.copy(data=global_means.data.magnitude)
+
+        else:
+            _check_global_means(global_means)
+
+            gases = list(global_means.data_vars)
+            units = {gas: global_means[gas].data.units for gas in gases}
+            global_means_magnitude = xr.Dataset(
+                {
+                    gas: darray.copy(data=darray.data.magnitude)
+                    for gas, darray in global_means.items()
+                }
+            ).to_array(gas_dim)
+
+        perturbation = self.perturbation
+        check_dimensions(perturbation, (gas_dim,), extras_ok=True)
+
+        missing = set(gases) - set(perturbation[gas_dim].to_numpy())
+        if missing:
+            raise ValueError(  # noqa: TRY003
+                f"No gridding values for these gases: {sorted(missing, key=str)}"
+            )
+
+        # Convert the perturbation of each gas to the units of its
+        # global-means, a scaling of the (small) perturbation array
+        perturbation_data = perturbation.data
+        conversion_factors = xr.DataArray(
+            [
+                type(perturbation_data)(1.0, perturbation_data.units)
+                .to(units[gas])
+                .magnitude
+                for gas in gases
+            ],
+            dims=gas_dim,
+            coords={gas_dim: gases},
+        )
+        perturbation_magnitude = (
+            perturbation.copy(data=perturbation_data.magnitude).sel({gas_dim: gases})
+            * conversion_factors
+        )
+
+        if dtype is not None:
+            global_means_magnitude = global_means_magnitude.astype(dtype)
+            perturbation_magnitude = perturbation_magnitude.astype(dtype)
+
+        res_magnitude = (global_means_magnitude + perturbation_magnitude).transpose(
+            gas_dim, ...
+        )
+
+        # Attach units directly, quantifying with pint-xarray is much slower
+        if isinstance(global_means, xr.DataArray):
+            return res_magnitude.copy(
+                data=type(perturbation_data)(
+                    res_magnitude.data, global_means.data.units
+                )
+            )
+
+        res_dims = res_magnitude.dims[1:]
+        res: xr.Dataset = xr.Dataset(
+            {
+                gas: (res_dims, type(perturbation_data)(magnitude, units[gas]))
+                for gas, magnitude in zip(gases, res_magnitude.data)
+            },
+            coords={
+                k: v for k, v in res_magnitude.coords.items() if gas_dim not in v.dims
+            },
+        )
+
+        return res
+
+    def calculate_lazy(
+        self,
+        global_means: xr.Dataset,
+        dtype: npt.DTypeLike | None = None,
+    ) -> LazyGriddedResult:
+        """
+        Calculate gridded values lazily
+
+        The gridded values aren't created until
+        :meth:`LazyGriddedResult.compute` is called. Until then, selections
+        (e.g. of a latitude range or a scenario) and reductions (e.g.
+        area-weighted means) are applied to the global-means and
+        :attr:`perturbation` separately, which is much cheaper than applying
+        them to the gridded values.
+
+        Parameters
+        ----------
+        global_means
+            Global-mean values. See :meth:`calculate` for requirements.
+
+        dtype
+            Data type of the output. See :meth:`calculate`.
+
+        Returns
+        -------
+            Lazy gridded values. Once computed, these are the same as the
+            output of :meth:`calculate`.
+
+        Raises
+        ------
+        CoordinateError
+            ``global_means`` does not have at least the dimensions of
+            ``("year", "month")`` (other dimensions e.g. ``"scenario"`` are
+            also ok)
+
+        NotPintQuantifiedError
+            ``global_means`` has not been quantified using ``pint.quantify`` or
+            similar
+        """
+        _check_global_means(global_means)
+
+        return LazyGriddedResult(
+            global_means=global_means,
+            perturbation=self.perturbation,
+            lat_bounds=self.gridding_values.get(self.lat_bounds_name),
+            dtype=dtype,
         )
 
+    def calculate_area_mean(self, global_means: xr.Dataset) -> xr.Dataset:
+        """
+        Calculate the area-weighted mean of the gridded values
+
+        This uses the fact that the latitudinal gradient has an
+        area-weighted mean of zero, so the result is simply
+        ``global_means`` plus the area-weighted mean of the seasonality. The
+        gridded values are never created so the cost scales with the size of
+        the inputs, not the output of :meth:`calculate`.
+
+        The result is only exact if the gridding values satisfy the
+        conditions in :attr:`gridding_values` (which are only fully checked
+        if :attr:`validation` is ``"full"``).
+
+        Parameters
+        ----------
+        global_means
+            Global-mean values. See :meth:`calculate` for requirements.
+
+        Returns
+        -------
+            Area-weighted mean of the gridded values, with the same
+            dimensions as ``global_means``
+
+        Raises
+        ------
+        CoordinateError
+            ``global_means`` does not have at least the dimensions of
+            ``("year", "month")``
+
+        NotPintQuantifiedError
+            ``global_means`` has not been quantified using ``pint.quantify`` or
+            similar
+        """
+        _check_global_means(global_means)
+
+        res: xr.Dataset = global_means + self._get_seasonality_area_mean()
+
         return res
+
+    def _get_seasonality_area_mean(self) -> xr.DataArray:
+        # Cached in the same way as `perturbation`
+        cache_key = (self.gridding_values, self.seasonality_name, self.lat_bounds_name)
+        if self._seasonality_area_mean_cache is not None and all(
+            cached is current
+            for cached, current in zip(self._seasonality_area_mean_cache[:3], cache_key)
+        ):
+            return self._seasonality_area_mean_cache[3]
+
+        seasonality_area_mean = (
+            get_area_weights(self.gridding_values[self.lat_bounds_name])
+            .area_mean(self.gridding_values[self.seasonality_name])
+            .rename(None)
+        )
+        self._seasonality_area_mean_cache = (*cache_key, seasonality_area_mean)
+
+        return seasonality_area_mean
+
+    def calculate_annual_mean(self, global_means: xr.Dataset) -> xr.Dataset:
+        """
+        Calculate the annual-mean of the gridded values
+
+        This uses the fact that the seasonality has an annual-mean of zero,
+        so the result is simply the annual-mean of ``global_means`` plus the
+        annual-mean of the latitudinal gradient. The gridded values are
+        never created.
+
+        The result is only exact if the gridding values satisfy the
+        conditions in :attr:`gridding_values` (which are only fully checked
+        if :attr:`validation` is ``"full"``).
+
+        Parameters
+        ----------
+        global_means
+            Global-mean values. See :meth:`calculate` for requirements.
+
+        Returns
+        -------
+            Annual-mean of the gridded values (each month has equal weight)
+
+        Raises
+        ------
+        CoordinateError
+            ``global_means`` does not have at least the dimensions of
+            ``("year", "month")``
+
+        NotPintQuantifiedError
+            ``global_means`` has not been quantified using ``pint.quantify`` or
+            similar
+        """
+        _check_global_means(global_means)
+
+        latitudinal_gradient_annual_mean = self.gridding_values[
+            self.latitudinal_gradient_name
+        ].mean("month")
+
+        res: xr.Dataset = global_means.mean(
+            "month"
+        ) + latitudinal_gradient_annual_mean.rename(None)
+
+        return res
+
+    def calculate_annual_area_mean(self, global_means: xr.Dataset) -> xr.Dataset:
+        """
+        Calculate the annual-, area-weighted mean of the gridded values
+
+        Both the seasonality and the latitudinal gradient average out, so
+        this is simply the annual-mean of ``global_means``.
+
+        The result is only exact if the gridding values satisfy the
+        conditions in :attr:`gridding_values` (which are only fully checked
+        if :attr:`validation` is ``"full"``).
+
+        Parameters
+        ----------
+        global_means
+            Global-mean values. See :meth:`calculate` for requirements.
+
+        Returns
+        -------
+            Annual-, area-weighted mean of the gridded values (each month has
+            equal weight)
+
+        Raises
+        ------
+        CoordinateError
+            ``global_means`` does not have at least the dimensions of
+            ``("year", "month")``
+
+        NotPintQuantifiedError
+            ``global_means`` has not been quantified using ``pint.quantify`` or
+            similar
+        """
+        _check_global_means(global_means)
+
+        return global_means.mean("month")
+
+    def calculate_chunked(
+        self,
+        global_means: xr.Dataset,
+        chunks: dict[str, int],
+        strip_units: bool = False,
+        dtype: npt.DTypeLike | None = None,
+    ) -> Iterator[xr.Dataset]:
+        """
+        Calculate gridded values, one chunk at a time
+
+        This avoids ever holding the full gridded output in memory. Peak
+        memory use is instead set by the size of each chunk.
+
+        Parameters
+        ----------
+        global_means
+            Global-mean values. See :meth:`calculate` for requirements.
+
+        chunks
+            Maximum size of each chunk along each dimension of
+            ``global_means`` (e.g. ``{"year": 50, "scenario": 10}``).
+            Dimensions which aren't in ``chunks`` aren't split.
+
+        strip_units
+            Passed to :meth:`calculate`
+
+        dtype
+            Passed to :meth:`calculate`
+
+        Returns
+        -------
+            Iterator which yields the gridded values for each chunk in turn.
+            Each chunk is the same as the equivalent selection from the
+            output of :meth:`calculate`.
+
+        Raises
+        ------
+        CoordinateError
+            ``global_means`` does not have at least the dimensions of
+            ``("year", "month")`` or does not have all the dimensions in
+            ``chunks``
+
+        NotPintQuantifiedError
+            ``global_means`` has not been quantified using ``pint.quantify`` or
+            similar
+
+        ValueError
+            Any of the chunk sizes are less than one
+        """
+        # Check up front, rather than on the first iteration
+        check_pint_quantified_dataset(global_means)
+        for darray in global_means.values():
+            check_dimensions(darray, ("year", "month", *chunks), extras_ok=True)
+
+        chunk_indexers = get_chunk_indexers(global_means.sizes, chunks)
+
+        return (
+            self.calculate(
+                global_means.isel(indexers), strip_units=strip_units, dtype=dtype
+            )
+            for indexers in chunk_indexers
+        )
@@ -0,0 +1,251 @@
+"""
+Gridded results which are only calculated when needed
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from attrs import define
+
+from carpet_concentrations.xarray_utils import get_area_weights
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Mapping
+
+    import numpy.typing as npt
+    import xarray as xr
+
+
+@define
+class LazyGriddedResult:
+    """
+    Gridded result, stored as its components rather than the full grid
+
+    The gridded values are the sum of :attr:`global_means` and
+    :attr:`perturbation`. Selections and (linear) reductions are applied to
+    each component, so e.g. the global-mean of one scenario is calculated
+    without ever creating the gridded values. The full gridded values are
+    only created by :meth:`compute`.
+    """
+
+    global_means: xr.Dataset
+    """Global-mean values, one variable per output variable"""
+
+    perturbation: xr.DataArray
+    """
+    Perturbation from the global-mean at each point on the grid
+
+    See :attr:`LatitudeSeasonalityGridder.perturbation`
+    """
+
+    lat_bounds: xr.DataArray | None = None
+    """
+    Latitude bounds of the grid, used for area-weighted means
+
+    These are selected along with the other components. If ``None``,
+    :meth:`area_mean` can't be used.
+    """
+
+    dtype: npt.DTypeLike | None = None
+    """
+    Data type of the output
+
+    See :meth:`LatitudeSeasonalityGridder.calculate`
+    """
+
+    def isel(
+        self,
+        indexers: Mapping[Any, Any] | None = None,
+        **indexers_kwargs: Any,
+    ) -> LazyGriddedResult:
+        """
+        Select by index
+
+        Each indexer is applied to the components which have its dimension.
+
+        Parameters
+        ----------
+        indexers
+            Indexers, see :meth:`xr.Dataset.isel`
+
+        **indexers_kwargs
+            Indexers, specified as keyword arguments
+
+        Returns
+        -------
+            Selected result (still lazy)
+
+        Raises
+        ------
+        ValueError
+            A dimension in the indexers isn't in the gridded values
+        """
+        return self._apply_indexers("isel", {**(indexers or {}), **indexers_kwargs})
+
+    def sel(
+        self,
+        indexers: Mapping[Any, Any] | None = None,
+        **indexers_kwargs: Any,
+    ) -> LazyGriddedResult:
+        """
+        Select by label
+
+        Each indexer is applied to the components which have its dimension.
+
+        Parameters
+        ----------
+        indexers
+            Indexers, see :meth:`xr.Dataset.sel`
+
+        **indexers_kwargs
+            Indexers, specified as keyword arguments
+
+        Returns
+        -------
+            Selected result (still lazy)
+
+        Raises
+        ------
+        ValueError
+            A dimension in the indexers isn't in the gridded values
+        """
+        return self._apply_indexers("sel", {**(indexers or {}), **indexers_kwargs})
+
+    def _apply_indexers(
+        self, method: str, indexers: Mapping[Any, Any]
+    ) -> LazyGriddedResult:
+        missing = set(indexers) - set(self.dims)
+        if missing:
+            raise ValueError(  # noqa: TRY003
+                f"Dimensions {sorted(missing, key=str)} do not exist. "
+                f"Available dimensions: {self.dims}"
+            )
+
+        def select(obj: Any) -> Any:
+            obj_indexers = {k: v for k, v in indexers.items() if k in obj.dims}
+            if not obj_indexers:
+                return obj
+
+            return getattr(obj, method)(obj_indexers)
+
+        return LazyGriddedResult(
+            global_means=select(self.global_means),
+            perturbation=select(self.perturbation),
+            lat_bounds=None if self.lat_bounds is None else select(self.lat_bounds),
+            dtype=self.dtype,
+        )
+
+    @property
+    def dims(self) -> tuple[Hashable, ...]:
+        """
+        Dimensions of the gridded values
+
+        Unlike the order of dimensions in the output of :meth:`compute`, the
+        order is not meaningful.
+        """
+        return tuple(
+            {
+                **{d: None for d in self.global_means.dims},
+                **{d: None for d in self.perturbation.dims},
+            }
+        )
+
+    def mean(self, dim: str | Iterable[str]) -> LazyGriddedResult:
+        """
+        Take the (unweighted) mean over one or more dimensions
+
+        The mean is taken of each component which has the dimension(s), the
+        other components are unaffected.
+
+        Parameters
+        ----------
+        dim
+            Dimension(s) over which to take the mean
+
+        Returns
+        -------
+            Mean (still lazy)
+        """
+        dims = {dim} if isinstance(dim, str) else set(dim)
+
+        def reduce(obj: Any) -> Any:
+            obj_dims = [d for d in obj.dims if d in dims]
+            if not obj_dims:
+                return obj
+
+            return obj.mean(obj_dims)
+
+        return LazyGriddedResult(
+            global_means=reduce(self.global_means),
+            perturbation=reduce(self.perturbation),
+            # Once latitude is averaged out, the bounds no longer apply
+            lat_bounds=None if "lat" in dims else self.lat_bounds,
+            dtype=self.dtype,
+        )
+
+    def annual_mean(self) -> LazyGriddedResult:
+        """
+        Take the annual-mean
+
+        Each month is given equal weight.
+
+        Returns
+        -------
+            Annual-mean (still lazy)
+        """
+        return self.mean("month")
+
+    def area_mean(self) -> xr.Dataset:
+        """
+        Calculate the area-weighted mean
+
+        The area-weighted mean of :attr:`perturbation` is added to
+        :attr:`global_means`. The gridded values are never created.
+
+        Returns
+        -------
+            Area-weighted mean
+
+        Raises
+        ------
+        ValueError
+            The gridded values no longer have a latitude dimension (e.g.
+            because of a previous :meth:`mean` over latitude or selection of a
+            single latitude) or :attr:`lat_bounds` is ``None``
+        """
+        if "lat" not in self.perturbation.dims:
+            raise ValueError(  # noqa: TRY003
+                "Cannot calculate the area-weighted mean, the gridded values "
+                f"have no latitude dimension. Available dimensions: {self.dims}"
+            )
+
+        if self.lat_bounds is None:
+            raise ValueError(  # noqa: TRY003
+                "Cannot calculate the area-weighted mean without latitude bounds"
+            )
+
+        perturbation_area_mean = get_area_weights(self.lat_bounds).area_mean(
+            self.perturbation
+        )
+
+        return self._combine(perturbation_area_mean)
+
+    def compute(self) -> xr.Dataset:
+        """
+        Calculate the gridded values
+
+        Returns
+        -------
+            Gridded values
+        """
+        return self._combine(self.perturbation)
+
+    def _combine(self, perturbation: xr.DataArray) -> xr.Dataset:
+        global_means = self.global_means
+        if self.dtype is not None:
+            global_means = global_means.astype(self.dtype)
+            perturbation = perturbation.astype(self.dtype)
+
+        res: xr.Dataset = global_means + perturbation
+
+        return res
@@ -3,6 +3,7 @@
 """
 from __future__ import annotations
 
+import concurrent.futures
 import datetime as dt
 import os.path
 import uuid
@@ -10,6 +11,7 @@ from functools import partial
 from typing import TYPE_CHECKING, Any
 
 import cftime
+import numpy as np
 import xarray as xr
 from attrs import asdict, define, field
 from attrs.validators import in_, matches_re
@@ -23,11 +25,18 @@ from carpet_concentrations.input4MIPs.metadata_options import (
     INCLUDES_EMAIL_REGEX,
     UUID_REGEX,
 )
-from carpet_concentrations.time import get_start_of_next_month, split_time_to_year_month
+from carpet_concentrations.time import (
+    check_year_month_codes_unique,
+    convert_year_month_codes_to_datetimes,
+    get_year_month_codes,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator
     from pathlib import Path
 
+    import numpy.typing as npt
+
 
 # If you're thinking about sub-classing this to update it for e.g. CMIP7,
 # please consider instead refactoring to use the builder pattern. That will
@@ -190,6 +199,130 @@ class Input4MIPsMetadataOptional:
         return out
 
 
+@define
+class Input4MIPsGrid:
+    """
+    Co-ordinates, with CF attributes and bounds, ready to be added to datasets
+
+    Guessing CF attributes and calculating bounds only depends on the
+    co-ordinates. When many datasets share the same co-ordinates (e.g. many
+    variables on the same time and latitude grid), this allows the work to
+    be done once and the result added to each dataset with
+    :meth:`add_to`.
+    """
+
+    coords: xr.Dataset
+    """
+    Co-ordinates, including their bounds, as a dataset without data variables
+    """
+
+    added: tuple[Hashable, ...]
+    """
+    Variables in :attr:`coords` which are added to datasets
+
+    These are the bounds (and their dimensions), rather than the co-ordinates
+    which datasets should already have.
+    """
+
+    @classmethod
+    def from_dataset(
+        cls,
+        ds: xr.Dataset,
+        dimensions: tuple[str, ...],
+        time_dimension: str = "time",
+        monthly_time_bounds: bool = True,
+    ) -> Input4MIPsGrid:
+        """
+        Create instance from the co-ordinates of a dataset
+
+        Parameters
+        ----------
+        ds
+            Dataset. Only its co-ordinates are used.
+
+        dimensions
+            Dimensions to which to add bounds
+
+        time_dimension
+            The name of the time dimension, see
+            :meth:`Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions`
+
+        monthly_time_bounds
+            Should added time bounds cover each month? See
+            :meth:`Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions`
+
+        Returns
+        -------
+            Prepared instance
+
+        Raises
+        ------
+        ValueError
+            One of ``dimensions`` (other than ``time_dimension``) isn't a
+            co-ordinate of ``ds``
+        """
+        coords = ds.coords.to_dataset().cf.guess_coord_axis()
+
+        for dim in dimensions:
+            if dim == time_dimension:
+                coords = add_time_bounds(coords, monthly_time_bounds)
+            else:
+                coords = coords.cf.add_bounds(dim)
+
+        added = tuple(k for k in coords.variables if k not in ds.coords)
+
+        return cls(coords, added=added)
+
+    def add_to(self, ds: xr.Dataset) -> xr.Dataset:
+        """
+        Add the co-ordinates' attributes and bounds to a dataset
+
+        Parameters
+        ----------
+        ds
+            Dataset. Its co-ordinates must be the same as those from which
+            the instance was created.
+
+        Returns
+        -------
+            Dataset with CF attributes on its co-ordinates and bounds. Only a
+            shallow copy of ``ds`` is made.
+
+        Raises
+        ------
+        ValueError
+            The co-ordinates of ``ds`` don't match :attr:`coords` or ``ds``
+            already has one of the bounds variables
+        """
+        coord_names = [k for k in self.coords.variables if k not in self.added]
+        if set(ds.coords) != set(coord_names):
+            raise ValueError(  # noqa: TRY003
+                "Co-ordinates don't match the grid. "
+                f"Co-ordinates of ds: {sorted(ds.coords, key=str)}. "
+                f"Co-ordinates of the grid: {sorted(coord_names, key=str)}"
+            )
+
+        for name in coord_names:
+            if name in ds.xindexes:
+                # Checks identity first so is very cheap for shared indexes
+                matches = ds.xindexes[name].equals(self.coords.xindexes[name])
+            else:
+                matches = ds[name].equals(self.coords[name])
+
+            if not matches:
+                raise ValueError(  # noqa: TRY003
+                    f"Values of {name!r} don't match the grid"
+                )
+
+        out = ds.copy(deep=False)
+        for name in coord_names:
+            out[name].attrs = {**out[name].attrs, **self.coords[name].attrs}
+
+        out = out.assign_coords({k: self.coords[k].variable for k in self.added})
+
+        return out
+
+
 # As above, if you're thinking about sub-classing this to update it for e.g.
 # CMIP7, please consider instead refactoring to use the builder pattern for
 # the same reasons as above.
@@ -267,6 +400,7 @@ class Input4MIPsDataset:
         time_dimension: str = "time",
         monthly_time_bounds: bool = True,
         copy: bool = True,
+        grid: Input4MIPsGrid | None = None,
         **kwargs: Any,
     ) -> Input4MIPsDataset:
         """
@@ -302,9 +436,19 @@ class Input4MIPsDataset:
             don't have the same number of days.
 
         copy
-            Should a copy of the dataset be made? If no, the data is modified
-            in place which can cause unexpected changes if references are not
-            appropriately managed.
+            Should a (deep) copy of the dataset be made? If no, only a shallow
+            copy is made: the co-ordinates, bounds and attributes of the
+            result are new objects (so ``ds`` itself isn't modified) but the
+            data is shared with ``ds``. This avoids duplicating the data in
+            memory, but means that modifying the values of one modifies the
+            values of the other.
+
+        grid
+            Co-ordinates, with CF attributes and bounds, to add to ``ds``. If
+            not supplied, they are created from ``ds`` (using ``dimensions``,
+            ``time_dimension`` and ``monthly_time_bounds``). Supply this when
+            preparing many datasets with the same co-ordinates to avoid
+            calculating the bounds for each dataset.
 
         **kwargs
             Other initialisation arguments for the instance. They are passed
@@ -318,11 +462,11 @@ class Input4MIPsDataset:
         ------
         AssertionError
             ``ds.attrs`` is already set or there is more than one variable in ``ds``
+
+        ValueError
+            The co-ordinates of ``ds`` don't match ``grid``
         """
-        if copy:
-            ds = ds.copy(deep=True)
-        else:
-            raise NotImplementedError(copy)
+        ds = ds.copy(deep=copy)
 
         if ds.attrs:
             raise AssertionError("All metadata should be autogenerated")  # noqa: TRY003
@@ -335,14 +479,16 @@ class Input4MIPsDataset:
         # add extra metadata following CF conventions, not really sure what
         # this does but it's free so we include it on the assumption that they
         # know more than we do (may be a bad assumption of course...)
-        ds = ds.cf.guess_coord_axis().cf.add_canonical_attributes()
+        # The grid also adds bounds to the dimensions
+        if grid is None:
+            grid = Input4MIPsGrid.from_dataset(
+                ds,
+                dimensions,
+                time_dimension=time_dimension,
+                monthly_time_bounds=monthly_time_bounds,
+            )
 
-        # add bounds to dimensions
-        for dim in dimensions:
-            if dim == time_dimension:
-                ds = add_time_bounds(ds, monthly_time_bounds)
-            else:
-                ds = ds.cf.add_bounds(dim)
+        ds = grid.add_to(ds).cf.add_canonical_attributes()
 
         # transpose to match dimensions
         ds = ds.transpose(*dimensions, ...)
@@ -356,11 +502,13 @@ class Input4MIPsDataset:
 
         return cls(ds, **kwargs)
 
-    def write(
+    def write(  # noqa: PLR0913
         self,
         root_data_dir: Path,
         unlimited_dims: tuple[str, ...] = ("time",),
         encoding_kwargs: dict[str, Any] | None = None,
+        creation_date: str | None = None,
+        dtype: npt.DTypeLike | None = None,
     ) -> Path:
         """
         Write to disk
@@ -377,6 +525,15 @@ class Input4MIPsDataset:
             Kwargs to use when encoding to disk. These are passed to
             :meth:`xr.Dataset.to_netcdf`
 
+        creation_date
+            Creation date to write in the file's metadata. See
+            :meth:`to_disk_ready`.
+
+        dtype
+            Data type with which to write the data variable (e.g.
+            ``np.float32``). If not supplied, the data's own type is used.
+            This is added to ``encoding_kwargs``.
+
         Returns
         -------
             Where the file was written
@@ -384,30 +541,365 @@ class Input4MIPsDataset:
         if encoding_kwargs is None:
             encoding_kwargs = {"zlib": True, "complevel": 5}
 
+        if dtype is not None:
+            encoding_kwargs = {**encoding_kwargs, "dtype": np.dtype(dtype)}
+
+        ds_disk = self.to_disk_ready(creation_date=creation_date)
+
+        out_path = self.get_filepath(
+            ds_disk,
+            root_data_dir,
+        )
+
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        ds_disk.to_netcdf(
+            out_path,
+            unlimited_dims=unlimited_dims,
+            encoding={ds_disk.attrs["variable_id"]: encoding_kwargs},
+        )
+
+        return out_path
+
+    def to_disk_ready(self, creation_date: str | None = None) -> xr.Dataset:
+        """
+        Convert to a disk-ready dataset
+
+        Parameters
+        ----------
+        creation_date
+            Creation date to use. If not supplied, the current time is used.
+            Supplying this is useful when writing many files which should
+            share the same version (the version is derived from the creation
+            date).
+
+        Returns
+        -------
+            Disk-ready dataset i.e. with units dequantified and the
+            file-specific metadata (tracking ID, creation date) added
+        """
         # Can shallow copy here as we don't need to worry about mangling the
         # data as the ref is not retured
-        ds_disk = self.ds.copy(deep=False).pint.dequantify(format="cf")
+        ds_disk: xr.Dataset = self.ds.copy(deep=False).pint.dequantify(format="cf")
 
         # Unique for every written file, so we don't provide a way for the
         # user to overwrite this at present
         ds_disk.attrs["tracking_id"] = generate_tracking_id()
-        ds_disk.attrs["creation_date"] = generate_creation_timestamp()
+
+        if creation_date is None:
+            creation_date = generate_creation_timestamp()
+
+        ds_disk.attrs["creation_date"] = creation_date
 
         verify_disk_ready(ds_disk)
 
+        return ds_disk
+
+    def append_to_netcdf(
+        self,
+        out_path: Path,
+        time_dimension: str = "time",
+    ) -> Path:
+        """
+        Append to an existing file along its (unlimited) time dimension
+
+        Only variables which have a time dimension are written, everything
+        else (e.g. latitude bounds, metadata) is assumed to already be in the
+        file.
+
+        Parameters
+        ----------
+        out_path
+            File to which to append. This would normally have been created by
+            :meth:`write`, with ``time_dimension`` in ``unlimited_dims``.
+
+        time_dimension
+            The name of the time dimension
+
+        Returns
+        -------
+            Where the data was written
+
+        Raises
+        ------
+        AssertionError
+            The dimensions of the data don't match the dimensions in the file
+            or the non-time co-ordinates of the data aren't the same as those
+            in the file
+
+        ValueError
+            The times aren't strictly increasing, don't come after the last
+            time in the file or can't be stored exactly with the file's
+            encoding of time (e.g. times part way through a day when the file
+            stores whole days as integers)
+        """
+        import netCDF4
+
+        # No need for the file-specific metadata so skip :meth:`to_disk_ready`
+        ds_disk: xr.Dataset = self.ds.copy(deep=False).pint.dequantify(format="cf")
+
+        with netCDF4.Dataset(out_path, "a") as nc:
+            time_var = nc.variables[time_dimension]
+            start = len(nc.dimensions[time_dimension])
+            end = start + ds_disk.sizes[time_dimension]
+
+            # Check before writing anything so the file isn't left half-written
+            times = ds_disk[time_dimension].values
+            if times.dtype == object:
+                times = _encode_times_like(times, time_var, time_var)
+
+            last_time = time_var[start - 1] if start > 0 else None
+            if (np.diff(times) <= 0).any() or (
+                last_time is not None and times[0] <= last_time
+            ):
+                raise ValueError(  # noqa: TRY003
+                    "Appended times must be strictly increasing and after the "
+                    f"last time in {out_path} ({last_time}). "
+                    f"Received (encoded as in the file): {times}"
+                )
+
+            for name, variable in ds_disk.variables.items():
+                if time_dimension not in variable.dims:
+                    if name in ds_disk.dims and not np.array_equal(
+                        variable.values, nc.variables[name][:]
+                    ):
+                        raise AssertionError(  # noqa: TRY003
+                            f"{name!r} values do not match those in {out_path}"
+                        )
+
+                    continue
+
+                nc_var = nc.variables[name]
+                if nc_var.dimensions != variable.dims:
+                    raise AssertionError(  # noqa: TRY003
+                        f"{name!r} has dimensions {variable.dims}, "
+                        f"but the dimensions in {out_path} are {nc_var.dimensions}"
+                    )
+
+                values = variable.values
+                if values.dtype == object:
+                    values = _encode_times_like(values, nc_var, time_var)
+
+                time_axis = variable.dims.index(time_dimension)
+                indexer = [slice(None)] * variable.ndim
+                indexer[time_axis] = slice(start, end)
+                nc_var[tuple(indexer)] = values
+
+        return out_path
+
+    def write_zarr(  # noqa: PLR0913
+        self,
+        root_data_dir: Path,
+        time_chunk_size: int = 600,
+        time_dimension: str = "time",
+        encoding_kwargs: dict[str, Any] | None = None,
+        creation_date: str | None = None,
+        dtype: npt.DTypeLike | None = None,
+        max_workers: int | None = None,
+    ) -> Path:
+        """
+        Write to disk as a zarr store
+
+        This is intended for staging, not publication. The store can be
+        appended to with :meth:`append_to_zarr` and then converted to a
+        compliant netCDF file with :func:`convert_zarr_to_netcdf`. Requires
+        `zarr <https://zarr.readthedocs.io>`_ to be installed.
+
+        Parameters
+        ----------
+        root_data_dir
+            Root directory in which to write the store. The store's path is
+            the same as the path of the netCDF file which :meth:`write` would
+            write, except for the extension (``.zarr``).
+
+        time_chunk_size
+            Number of time steps in each chunk of the store. Each chunk is
+            written by a separate thread.
+
+        time_dimension
+            The name of the time dimension
+
+        encoding_kwargs
+            Kwargs to use when encoding the data variable (e.g.
+            ``{"compressor": numcodecs.Zstd()}``). These are passed to
+            :meth:`xr.Dataset.to_zarr`
+
+        creation_date
+            Creation date to write in the store's metadata. See
+            :meth:`to_disk_ready`.
+
+        dtype
+            Data type with which to write the data variable (e.g.
+            ``np.float32``). If not supplied, the data's own type is used.
+            This is added to ``encoding_kwargs``.
+
+        max_workers
+            Maximum number of threads to use to write the chunks. Passed to
+            :class:`concurrent.futures.ThreadPoolExecutor`.
+
+        Returns
+        -------
+            Where the store was written
+        """
+        import zarr
+
+        if encoding_kwargs is None:
+            encoding_kwargs = {}
+
+        if dtype is not None:
+            encoding_kwargs = {**encoding_kwargs, "dtype": np.dtype(dtype)}
+
+        ds_disk = self.to_disk_ready(creation_date=creation_date)
+
         out_path = self.get_filepath(
             ds_disk,
             root_data_dir,
-        )
+        ).with_suffix(".zarr")
 
         out_path.parent.mkdir(parents=True, exist_ok=True)
 
-        ds_disk.to_netcdf(
-            out_path,
-            unlimited_dims=unlimited_dims,
-            encoding={ds_disk.attrs["variable_id"]: encoding_kwargs},
+        # Encoding the times ourselves is much faster than leaving it to
+        # xarray
+        time_encoding = ds_disk[time_dimension].encoding
+        first_time = ds_disk[time_dimension].values[0]
+        ds_disk = _encode_times(
+            ds_disk,
+            time_dimension,
+            units=time_encoding.get(
+                "units", f"days since {first_time.strftime('%Y-%m-%d')}"
+            ),
+            calendar=time_encoding.get("calendar", first_time.calendar),
         )
 
+        time_variables = [
+            k for k, v in ds_disk.variables.items() if time_dimension in v.dims
+        ]
+        encoding: dict[Any, dict[str, Any]] = {
+            k: {
+                "chunks": tuple(
+                    time_chunk_size if dim == time_dimension else size
+                    for dim, size in ds_disk[k].sizes.items()
+                )
+            }
+            for k in time_variables
+        }
+        variable_id = ds_disk.attrs["variable_id"]
+        encoding[variable_id] = {**encoding_kwargs, **encoding.get(variable_id, {})}
+
+        # Write the metadata, the variables without a time dimension and the
+        # first chunk, then grow the arrays to their full size
+        ds_disk.isel({time_dimension: slice(0, time_chunk_size)}).to_zarr(
+            out_path, mode="w", encoding=encoding, consolidated=False
+        )
+        group = zarr.open_group(str(out_path), mode="r+")
+        encoded = {}
+        for k in time_variables:
+            group[str(k)].resize(ds_disk[k].shape)
+
+            variable = ds_disk[k].variable.copy(deep=False)
+            variable.encoding = {**variable.encoding, **encoding[k]}
+            encoded[k] = xr.conventions.encode_cf_variable(variable, name=k)
+
+        # The remaining chunks are written straight into the arrays. The
+        # chunks don't overlap, so they can be written concurrently (and
+        # compression releases the GIL).
+        def write_chunk(start: int) -> None:
+            for k, variable in encoded.items():
+                indexer = tuple(
+                    slice(start, start + time_chunk_size)
+                    if dim == time_dimension
+                    else slice(None)
+                    for dim in variable.dims
+                )
+                group[str(k)][indexer] = variable[indexer].values
+
+        n_times = ds_disk.sizes[time_dimension]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Consume the results so any errors are raised
+            list(
+                executor.map(
+                    write_chunk, range(time_chunk_size, n_times, time_chunk_size)
+                )
+            )
+
+        zarr.consolidate_metadata(str(out_path))
+
+        return out_path
+
+    def append_to_zarr(
+        self,
+        out_path: Path,
+        time_dimension: str = "time",
+    ) -> Path:
+        """
+        Append to an existing zarr store along its time dimension
+
+        Only variables which have a time dimension are written, everything
+        else (e.g. latitude bounds, metadata) is assumed to already be in the
+        store. Like :meth:`append_to_netcdf`, the store's path is not changed
+        (so its name doesn't reflect the appended data).
+
+        Parameters
+        ----------
+        out_path
+            Store to which to append. This would normally have been created
+            by :meth:`write_zarr`.
+
+        time_dimension
+            The name of the time dimension
+
+        Returns
+        -------
+            Where the data was written
+
+        Raises
+        ------
+        AssertionError
+            The dimensions of the data don't match the dimensions in the store
+            or the non-time co-ordinates of the data aren't the same as those
+            in the store
+        """
+        # No need for the file-specific metadata so skip :meth:`to_disk_ready`
+        ds_disk: xr.Dataset = self.ds.copy(deep=False).pint.dequantify(format="cf")
+
+        with xr.open_zarr(out_path, chunks=None, decode_times=False) as existing:
+            for name, variable in ds_disk.variables.items():
+                if time_dimension not in variable.dims:
+                    if name in ds_disk.dims and not np.array_equal(
+                        variable.values, existing[name].values
+                    ):
+                        raise AssertionError(  # noqa: TRY003
+                            f"{name!r} values do not match those in {out_path}"
+                        )
+
+                    continue
+
+                if existing[name].dims != variable.dims:
+                    raise AssertionError(  # noqa: TRY003
+                        f"{name!r} has dimensions {variable.dims}, "
+                        f"but the dimensions in {out_path} are {existing[name].dims}"
+                    )
+
+            time_attrs = existing[time_dimension].attrs
+            # Appending overwrites the store's attributes
+            store_attrs = existing.attrs
+
+        ds_append = _encode_times(
+            ds_disk.drop_vars(
+                [
+                    k
+                    for k, v in ds_disk.variables.items()
+                    if time_dimension not in v.dims
+                ]
+            ),
+            time_dimension,
+            units=time_attrs["units"],
+            calendar=time_attrs["calendar"],
+        )
+        ds_append.attrs = store_attrs
+
+        ds_append.to_zarr(out_path, append_dim=time_dimension)
+
         return out_path
 
     def get_filepath(
@@ -447,6 +939,316 @@ class Input4MIPsDataset:
 
         return root_data_dir / out_dir / out_fname
 
+    def split_by_period(
+        self,
+        years_per_period: int,
+        time_dimension: str = "time",
+    ) -> list[Input4MIPsDataset]:
+        """
+        Split into datasets which each cover a period of years
+
+        Periods are aligned to multiples of ``years_per_period`` (e.g. with
+        ``years_per_period=50``, 1750-1799, 1800-1849 etc.), so the first and
+        last periods may be shorter than ``years_per_period``. Each dataset
+        is a slice of :attr:`ds`, so no data is copied.
+
+        Parameters
+        ----------
+        years_per_period
+            Number of years in each period
+
+        time_dimension
+            The name of the time dimension
+
+        Returns
+        -------
+            Dataset for each period, in time order. When written, each file's
+            name reflects its own time range.
+
+        Raises
+        ------
+        ValueError
+            ``years_per_period`` is less than one or the times are not sorted
+        """
+        if years_per_period < 1:
+            raise ValueError(  # noqa: TRY003
+                f"years_per_period must be at least one, received: {years_per_period}"
+            )
+
+        years = self.ds[time_dimension].dt.year.to_numpy()
+        if np.any(np.diff(years) < 0):
+            raise ValueError(f"{time_dimension!r} must be sorted")  # noqa: TRY003
+
+        periods = years // years_per_period
+
+        starts = np.flatnonzero(np.diff(periods)) + 1
+        edges = [0, *starts.tolist(), periods.size]
+
+        return [
+            Input4MIPsDataset(
+                self.ds.isel({time_dimension: slice(start, stop)}),
+                directory_template=self.directory_template,
+                filename_template=self.filename_template,
+            )
+            for start, stop in zip(edges[:-1], edges[1:])
+        ]
+
+
+def write_along_time(  # noqa: PLR0913
+    datasets: Iterable[Input4MIPsDataset],
+    root_data_dir: Path,
+    unlimited_dims: tuple[str, ...] = ("time",),
+    encoding_kwargs: dict[str, Any] | None = None,
+    time_dimension: str = "time",
+    dtype: npt.DTypeLike | None = None,
+    creation_date: str | None = None,
+) -> Path:
+    """
+    Write datasets, which together make up a single file, to disk one by one
+
+    The first dataset is written with :meth:`Input4MIPsDataset.write`, all
+    subsequent datasets are appended to it along the time dimension with
+    :meth:`Input4MIPsDataset.append_to_netcdf`. Hence only one dataset has to
+    be in memory at any time and ``datasets`` can be a generator which
+    creates each dataset only when it is needed.
+
+    Parameters
+    ----------
+    datasets
+        Datasets to write, in time order. The metadata written to disk is
+        taken from the first dataset.
+
+    root_data_dir
+        Root directory in which to write the file
+
+    unlimited_dims
+        Dimensions which should be unlimited. This must include
+        ``time_dimension``.
+
+    encoding_kwargs
+        Kwargs to use when encoding to disk. These are passed to
+        :meth:`Input4MIPsDataset.write`
+
+    time_dimension
+        The name of the time dimension
+
+    dtype
+        Data type with which to write the data variable. See
+        :meth:`Input4MIPsDataset.write`. Appended data is converted to this
+        type when it is written.
+
+    creation_date
+        Creation date to write in the file's metadata. See
+        :meth:`Input4MIPsDataset.to_disk_ready`.
+
+    Returns
+    -------
+        Where the file was written. The filename reflects the time range of
+        all the written data.
+
+    Raises
+    ------
+    ValueError
+        ``time_dimension`` is not in ``unlimited_dims`` or ``datasets`` is
+        empty
+    """
+    if time_dimension not in unlimited_dims:
+        raise ValueError(  # noqa: TRY003
+            f"Can only append along an unlimited dimension. {time_dimension!r} "
+            f"is not in {unlimited_dims!r}"
+        )
+
+    datasets_iter = iter(datasets)
+    try:
+        first = next(datasets_iter)
+    except StopIteration as exc:
+        raise ValueError("No datasets to write") from exc  # noqa: TRY003
+
+    first_path = first.write(
+        root_data_dir,
+        unlimited_dims=unlimited_dims,
+        encoding_kwargs=encoding_kwargs,
+        creation_date=creation_date,
+        dtype=dtype,
+    )
+    # Keep the file clearly marked until it is complete
+    in_progress_path = first_path.with_name(f"{first_path.name}.incomplete")
+    first_path.rename(in_progress_path)
+
+    for dataset in datasets_iter:
+        dataset.append_to_netcdf(in_progress_path, time_dimension=time_dimension)
+
+    with xr.open_dataset(in_progress_path, use_cftime=True) as written:
+        out_path = first.get_filepath(written, root_data_dir)
+
+    in_progress_path.rename(out_path)
+
+    return out_path
+
+
+_NETCDF_ENCODING_KEYS: tuple[str, ...] = ("units", "calendar", "dtype", "_FillValue")
+"""
+Encoding keys which are kept when converting from zarr to netCDF
+
+All other keys (e.g. chunks, compressor) are specific to zarr.
+"""
+
+
+def convert_zarr_to_netcdf(  # noqa: PLR0913
+    zarr_path: Path,
+    root_data_dir: Path,
+    time_chunk_size: int | None = None,
+    unlimited_dims: tuple[str, ...] = ("time",),
+    encoding_kwargs: dict[str, Any] | None = None,
+    time_dimension: str = "time",
+    dtype: npt.DTypeLike | None = None,
+) -> Path:
+    """
+    Convert a zarr store to a single netCDF file
+
+    The store is read and written piece by piece with
+    :func:`write_along_time`, hence it never has to be held in memory. The
+    store's creation date (and hence version) is kept, but the file gets its
+    own tracking ID.
+
+    Parameters
+    ----------
+    zarr_path
+        Store to convert, normally written by
+        :meth:`Input4MIPsDataset.write_zarr`
+
+    root_data_dir
+        Root directory in which to write the file
+
+    time_chunk_size
+        Number of time steps to read and write at once. If not supplied, the
+        size of the store's chunks along the time dimension is used.
+
+    unlimited_dims
+        Dimensions which should be unlimited. See :func:`write_along_time`.
+
+    encoding_kwargs
+        Kwargs to use when encoding to disk. See :func:`write_along_time`.
+
+    time_dimension
+        The name of the time dimension
+
+    dtype
+        Data type with which to write the data variable. See
+        :func:`write_along_time`.
+
+    Returns
+    -------
+        Where the file was written
+    """
+    with xr.open_zarr(zarr_path, chunks=None, use_cftime=True) as opened:
+        # Bounds which don't share the data variable's dimensions (e.g.
+        # latitude bounds) aren't restored as co-ordinates by xarray
+        stored = opened.set_coords(
+            [
+                v.attrs["bounds"]
+                for v in opened.variables.values()
+                if v.attrs.get("bounds") in opened.data_vars
+            ]
+        )
+        variable_id = stored.attrs["variable_id"]
+        if time_chunk_size is None:
+            time_chunk_size = stored[variable_id].encoding["chunks"][
+                stored[variable_id].dims.index(time_dimension)
+            ]
+
+        def get_datasets() -> Iterator[Input4MIPsDataset]:
+            for start in range(0, stored.sizes[time_dimension], time_chunk_size):
+                piece = stored.isel(
+                    {time_dimension: slice(start, start + time_chunk_size)}
+                ).load()
+
+                for variable in piece.variables.values():
+                    variable.encoding = {
+                        k: v
+                        for k, v in variable.encoding.items()
+                        if k in _NETCDF_ENCODING_KEYS
+                    }
+
+                # Added again when writing
+                piece.attrs = {
+                    k: v
+                    for k, v in piece.attrs.items()
+                    if k not in ("tracking_id", "creation_date")
+                }
+
+                yield Input4MIPsDataset(piece)
+
+        return write_along_time(
+            get_datasets(),
+            root_data_dir=root_data_dir,
+            unlimited_dims=unlimited_dims,
+            encoding_kwargs=encoding_kwargs,
+            time_dimension=time_dimension,
+            dtype=dtype,
+            creation_date=stored.attrs["creation_date"],
+        )
+
+
+def _encode_times(
+    ds: xr.Dataset, time_dimension: str, units: str, calendar: str
+) -> xr.Dataset:
+    """
+    Encode the time axis, and its bounds, as numbers
+
+    :func:`cftime.date2num` is much faster than xarray's encoding, which
+    converts each time individually.
+    """
+    names = [time_dimension]
+    if ds[time_dimension].attrs.get("bounds") in ds.variables:
+        names.append(ds[time_dimension].attrs["bounds"])
+
+    return ds.assign_coords(
+        {
+            name: xr.Variable(
+                ds[name].dims,
+                cftime.date2num(ds[name].values, units=units, calendar=calendar),
+                attrs={**ds[name].attrs, "units": units, "calendar": calendar},
+            )
+            for name in names
+        }
+    )
+
+
+def _encode_times_like(
+    values: npt.NDArray[np.object_],
+    nc_var: Any,
+    time_var: Any,
+) -> npt.NDArray[Any]:
+    """
+    Encode times as numbers in the same way as an existing netCDF variable
+
+    Time bounds normally have no units or calendar of their own, in which case
+    those of the time axis apply (see the CF conventions). The output has the
+    variable's dtype, so netCDF4 doesn't silently truncate it on writing.
+
+    Raises
+    ------
+    ValueError
+        The times can't be stored exactly with the variable's dtype
+    """
+    encoded = np.asarray(
+        cftime.date2num(
+            values,
+            units=getattr(nc_var, "units", time_var.units),
+            calendar=getattr(nc_var, "calendar", time_var.calendar),
+        )
+    )
+    if np.issubdtype(nc_var.dtype, np.integer) and not np.array_equal(
+        np.round(encoded), encoded
+    ):
+        raise ValueError(  # noqa: TRY003
+            f"{nc_var.name!r} is stored as {nc_var.dtype}, "
+            f"so these times can't be written exactly: {encoded}"
+        )
+
+    return encoded.astype(nc_var.dtype)
+
 
 def format_date(
     date: cftime.datetime | dt.datetime,
@@ -521,6 +1323,12 @@ def add_time_bounds(
     There is no copy here, ``ds`` is modified in place (call
     :meth:`xarray.Dataset.copy` before passing if you don't
     want this).
+
+    The bounds use the same calendar as the time axis. Previously, they
+    always used the standard calendar, which gave bounds that didn't match
+    the time axis for other calendars (e.g. a 29th of February in a
+    ``"noleap"`` calendar, or no 30th of February in a ``"360_day"``
+    calendar) and couldn't be encoded with the time axis' calendar.
     """
     # based on cf-xarray's implementation, to be pushed back upstream at some
     # point
@@ -535,18 +1343,23 @@ def add_time_bounds(
         )
 
     if monthly_time_bounds:
-        ds_ym = split_time_to_year_month(ds, time_axis=variable)
+        codes = get_year_month_codes(
+            ds[variable].dt.year.to_numpy(), ds[variable].dt.month.to_numpy()
+        )
+        check_year_month_codes_unique(codes)
 
+        # Bounds run from the start of each month to the start of the next,
+        # all created in one go
         # This may need to be refactored to allow the cftime_converter to be
         # injected, same idea as `convert_to_time`
         bounds = xr.DataArray(
-            [
-                [cftime.datetime(y, m, 1), get_start_of_next_month(y, m)]
-                for y, m in zip(ds_ym.year, ds_ym.month)
-            ],
+            convert_year_month_codes_to_datetimes(
+                np.stack([codes, codes + 1], axis=-1),
+                calendar=ds[variable].dt.calendar,
+            ),
             dims=(variable, "bounds"),
             coords={variable: ds[variable], "bounds": [0, 1]},
-        ).transpose(..., "bounds")
+        )
     else:
         # This will require some thinking because `ds.cf.add_bounds(dim)`
         # doesn't work with cftime.datetime objects. Probably needs an issue upstream
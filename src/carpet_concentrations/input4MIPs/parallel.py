@@ -0,0 +1,303 @@
+"""
+Writing of many input4MIPs files in parallel
+"""
+from __future__ import annotations
+
+import concurrent.futures
+from typing import TYPE_CHECKING, Any
+
+from attrs import define
+
+from carpet_concentrations.input4MIPs.dataset import (
+    Input4MIPsDataset,
+    Input4MIPsGrid,
+    generate_creation_timestamp,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+    from pathlib import Path
+
+    import xarray as xr
+
+    from carpet_concentrations.input4MIPs.dataset import (
+        Input4MIPsMetadata,
+        Input4MIPsMetadataOptional,
+    )
+
+
+@define
+class WriteResult:
+    """
+    Result of writing a single file
+    """
+
+    variable_id: str
+    """Variable which was written (or which we tried to write)"""
+
+    path: Path | None = None
+    """Where the file was written (``None`` if writing failed)"""
+
+    error: Exception | None = None
+    """Error raised while writing (``None`` if writing succeeded)"""
+
+    period: tuple[int, int] | None = None
+    """
+    First and last year in the file (``None`` if the file covers the whole
+    time axis)
+    """
+
+
+def _write_single_variable(  # noqa: PLR0913
+    ds: xr.Dataset,
+    dimensions: tuple[str, ...],
+    metadata: Input4MIPsMetadata,
+    metadata_optional: Input4MIPsMetadataOptional | None,
+    root_data_dir: Path,
+    creation_date: str,
+    from_metadata_kwargs: dict[str, Any],
+    write_kwargs: dict[str, Any],
+) -> Path:
+    # Imported here, rather than at the top of the module, as cf-xarray is an
+    # optional dependency. Importing it adds the cf accessors, which aren't
+    # there in worker processes unless we import it in each process.
+    import cf_xarray  # noqa: F401
+
+    # ds is a copy that only this process has, so there is no need to copy it
+    # again (unless the user asks)
+    from_metadata_kwargs = {"copy": False, **from_metadata_kwargs}
+
+    return Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+        ds,
+        dimensions,
+        metadata=metadata,
+        metadata_optional=metadata_optional,
+        **from_metadata_kwargs,
+    ).write(root_data_dir, creation_date=creation_date, **write_kwargs)
+
+
+def _write_period(
+    dataset: Input4MIPsDataset,
+    root_data_dir: Path,
+    creation_date: str,
+    write_kwargs: dict[str, Any],
+) -> Path:
+    # See :func:`_write_single_variable`
+    import cf_xarray  # noqa: F401
+
+    return dataset.write(root_data_dir, creation_date=creation_date, **write_kwargs)
+
+
+def write_variables_in_parallel(  # noqa: PLR0913
+    ds: xr.Dataset,
+    dimensions: tuple[str, ...],
+    metadata: Input4MIPsMetadata,
+    root_data_dir: Path,
+    metadata_optional: Input4MIPsMetadataOptional | None = None,
+    max_workers: int | None = None,
+    write_kwargs: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> list[WriteResult]:
+    """
+    Write each variable in a dataset to its own file, in parallel
+
+    Preparing each file (adding bounds, CF attributes etc.) and writing it
+    (compression is CPU-bound) is done in a pool of processes.
+
+    Parameters
+    ----------
+    ds
+        Dataset, containing one or more variables
+
+    dimensions
+        Dimensions of the dataset, these are checked for appropriate bounds.
+
+    metadata
+        Metadata (required)
+
+    root_data_dir
+        Root directory in which to write the files
+
+    metadata_optional
+        Optional metadata
+
+    max_workers
+        Maximum number of processes to use. Passed to
+        :class:`concurrent.futures.ProcessPoolExecutor`.
+
+    write_kwargs
+        Passed to :meth:`Input4MIPsDataset.write`
+
+    **kwargs
+        Passed to
+        :meth:`Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions`
+
+    Returns
+    -------
+        Result of writing each variable, in the same order as the variables
+        in ``ds``. Errors are captured in the results rather than raised so
+        that a failure for one variable doesn't stop the others being written.
+        This includes errors raised while creating the bounds of a variable's
+        co-ordinates (e.g. because one of ``dimensions`` isn't a co-ordinate
+        of the variable).
+
+    Notes
+    -----
+    All files share the same creation date, hence the same version. As a
+    result, the output paths depend only on the data and metadata, not on
+    the time at which each process happens to write.
+
+    Variables with the same co-ordinates share a single
+    :class:`Input4MIPsGrid`, so bounds are only calculated once for each set
+    of co-ordinates (unless a ``grid`` is supplied in ``kwargs``, in which case
+    it is used for all variables).
+    """
+    import cf_xarray  # noqa: F401
+
+    if write_kwargs is None:
+        write_kwargs = {}
+
+    creation_date = generate_creation_timestamp()
+
+    # Dequantify before sending to the workers. Plain arrays can be sent
+    # between processes without any worry about the unit registry in each
+    # process.
+    ds_dequantified = ds.pint.dequantify(format="cf")
+
+    # Variables with the same co-ordinates share the same grid, so its
+    # attributes and bounds are only calculated once rather than in every
+    # process
+    grid_kwargs = {
+        k: kwargs[k] for k in ("time_dimension", "monthly_time_bounds") if k in kwargs
+    }
+    grids: dict[tuple[Hashable, ...], Input4MIPsGrid | ValueError] = {}
+
+    results: dict[str, WriteResult] = {}
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for variable_id in ds_dequantified.data_vars:
+            ds_variable = ds_dequantified[[variable_id]]
+
+            variable_kwargs = kwargs
+            if "grid" not in kwargs:
+                grid_key = tuple(sorted(ds_variable.coords, key=str))
+                if grid_key not in grids:
+                    try:
+                        grids[grid_key] = Input4MIPsGrid.from_dataset(
+                            ds_variable, dimensions, **grid_kwargs
+                        )
+                    except ValueError as exc:
+                        # The variable doesn't have the co-ordinates we need,
+                        # writing it would fail in exactly the same way
+                        grids[grid_key] = exc
+
+                grid = grids[grid_key]
+                if isinstance(grid, ValueError):
+                    results[str(variable_id)] = WriteResult(
+                        str(variable_id), error=grid
+                    )
+                    continue
+
+                variable_kwargs = {"grid": grid, **kwargs}
+
+            futures[str(variable_id)] = executor.submit(
+                _write_single_variable,
+                ds_variable,
+                dimensions,
+                metadata,
+                metadata_optional,
+                root_data_dir,
+                creation_date,
+                variable_kwargs,
+                write_kwargs,
+            )
+
+        for variable_id, future in futures.items():
+            try:
+                results[variable_id] = WriteResult(variable_id, path=future.result())
+            except Exception as exc:
+                results[variable_id] = WriteResult(variable_id, error=exc)
+
+    return [results[str(variable_id)] for variable_id in ds_dequantified.data_vars]
+
+
+def write_periods_in_parallel(
+    dataset: Input4MIPsDataset,
+    root_data_dir: Path,
+    years_per_period: int,
+    time_dimension: str = "time",
+    max_workers: int | None = None,
+    **kwargs: Any,
+) -> list[WriteResult]:
+    """
+    Split a dataset into periods and write each period to its own file, in parallel
+
+    Parameters
+    ----------
+    dataset
+        Dataset to write
+
+    root_data_dir
+        Root directory in which to write the files
+
+    years_per_period
+        Number of years in each file. See
+        :meth:`Input4MIPsDataset.split_by_period`.
+
+    time_dimension
+        The name of the time dimension
+
+    max_workers
+        Maximum number of processes to use. Passed to
+        :class:`concurrent.futures.ProcessPoolExecutor`.
+
+    **kwargs
+        Passed to :meth:`Input4MIPsDataset.write`
+
+    Returns
+    -------
+        Result of writing each period, in time order. As in
+        :func:`write_variables_in_parallel`, errors are captured in the
+        results rather than raised so that a failure for one period doesn't
+        stop the others being written.
+
+    Notes
+    -----
+    As in :func:`write_variables_in_parallel`, all files share the same
+    creation date, hence the same version (and directory).
+    """
+    import cf_xarray  # noqa: F401
+
+    creation_date = generate_creation_timestamp()
+    variable_id = dataset.ds.attrs["variable_id"]
+
+    # Dequantify before sending to the workers, see
+    # :func:`write_variables_in_parallel`
+    dequantified = Input4MIPsDataset(
+        dataset.ds.pint.dequantify(format="cf"),
+        directory_template=dataset.directory_template,
+        filename_template=dataset.filename_template,
+    )
+
+    periods = dequantified.split_by_period(
+        years_per_period, time_dimension=time_dimension
+    )
+
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_write_period, period, root_data_dir, creation_date, kwargs)
+            for period in periods
+        ]
+
+        for period, future in zip(periods, futures):
+            years = period.ds[time_dimension].dt.year
+            period_years = (int(years[0]), int(years[-1]))
+            try:
+                results.append(
+                    WriteResult(variable_id, path=future.result(), period=period_years)
+                )
+            except Exception as exc:
+                results.append(WriteResult(variable_id, error=exc, period=period_years))
+
+    return results
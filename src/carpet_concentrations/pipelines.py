@@ -0,0 +1,116 @@
+"""
+Pipelines which combine gridding and writing to disk
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+from carpet_concentrations.input4MIPs.dataset import (
+    Input4MIPsDataset,
+    write_along_time,
+)
+from carpet_concentrations.time import convert_year_month_to_time
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import numpy.typing as npt
+    import xarray as xr
+
+    from carpet_concentrations.gridders.latitude_seasonality_gridder import (
+        LatitudeSeasonalityGridder,
+    )
+    from carpet_concentrations.input4MIPs.dataset import (
+        Input4MIPsMetadata,
+        Input4MIPsMetadataOptional,
+    )
+
+
+def grid_and_write_input4mips_file(  # noqa: PLR0913
+    gridder: LatitudeSeasonalityGridder,
+    global_means: xr.Dataset,
+    metadata: Input4MIPsMetadata,
+    root_data_dir: Path,
+    time_encoding: dict[str, str],
+    years_per_chunk: int = 50,
+    dimensions: tuple[str, ...] = ("time", "lat"),
+    metadata_optional: Input4MIPsMetadataOptional | None = None,
+    year_month_to_time: Callable[[xr.Dataset], xr.Dataset] = convert_year_month_to_time,
+    dtype: npt.DTypeLike | None = None,
+    **kwargs: Any,
+) -> Path:
+    """
+    Grid global-means and write the result to an input4MIPs file chunk by chunk
+
+    Each chunk of years is gridded, converted to a time axis and appended to
+    the file before the next chunk is gridded. Hence the full gridded output
+    is never held in memory.
+
+    Parameters
+    ----------
+    gridder
+        Gridder to use
+
+    global_means
+        Global-mean values to grid. This should contain a single variable
+        (the variable to write). See
+        :meth:`LatitudeSeasonalityGridder.calculate` for other requirements.
+
+    metadata
+        Metadata (required)
+
+    root_data_dir
+        Root directory in which to write the file
+
+    time_encoding
+        Encoding to use for the time axis (e.g.
+        ``{"calendar": "standard", "units": "days since 1750-01-01"}``)
+
+    years_per_chunk
+        Number of years to grid and write at once
+
+    dimensions
+        Dimensions of the output, these are checked for appropriate bounds.
+        See :meth:`Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions`.
+
+    metadata_optional
+        Optional metadata
+
+    year_month_to_time
+        Function to use to convert the ``("year", "month")`` dimensions of
+        the gridded output into a time axis
+
+    dtype
+        Data type to use for the gridded output, both when gridding (see
+        :meth:`LatitudeSeasonalityGridder.calculate`) and when writing (see
+        :func:`write_along_time`)
+
+    **kwargs
+        Passed to :func:`write_along_time`
+
+    Returns
+    -------
+        Where the file was written
+    """
+
+    def get_datasets() -> Iterator[Input4MIPsDataset]:
+        for gridded in gridder.calculate_chunked(
+            global_means, chunks={"year": years_per_chunk}, dtype=dtype
+        ):
+            gridded_time = year_month_to_time(gridded)
+            gridded_time["time"].encoding = time_encoding
+
+            yield Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+                gridded_time,
+                dimensions,
+                metadata=metadata,
+                metadata_optional=metadata_optional,
+                # The gridded data isn't used anywhere else, so there is
+                # no need to copy it
+                copy=False,
+            )
+
+    return write_along_time(
+        get_datasets(), root_data_dir=root_data_dir, dtype=dtype, **kwargs
+    )
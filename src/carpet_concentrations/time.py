@@ -3,17 +3,18 @@ Time handling
 """
 from __future__ import annotations
 
-from functools import partial
-from typing import TYPE_CHECKING, Protocol
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 import cftime
 import numpy as np
+import xarray as xr
+from attrs import define, field
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
-    from typing import Any
 
-    import xarray as xr
+    import numpy.typing as npt
 
 
 MONTHS_PER_YEAR: int = 12
@@ -61,7 +62,8 @@ def convert_year_month_to_time(
     """
     Convert year and month co-ordinates into a time axis
 
-    This is a facade to :func:`convert_to_time`
+    This is a facade to :func:`convert_to_time`, using
+    :class:`YearMonthCftimeConverter` so that the conversion is vectorised.
 
     Parameters
     ----------
@@ -81,7 +83,7 @@ def convert_year_month_to_time(
     return convert_to_time(
         inp,
         time_coords=("year", "month"),
-        cftime_converter=partial(cftime.datetime, day=day, **kwargs),
+        cftime_converter=YearMonthCftimeConverter(day=day, cftime_kwargs=kwargs),
     )
 
 
@@ -99,6 +101,62 @@ class CftimeConverter(Protocol):  # pylint: disable=too-few-public-methods
         """
 
 
+@runtime_checkable
+class VectorisedCftimeConverter(CftimeConverter, Protocol):
+    """
+    :class:`CftimeConverter` which can also convert whole arrays at once
+    """
+
+    def convert_vectorised(
+        self,
+        *args: npt.NDArray[np.float_ | np.int_],
+    ) -> npt.NDArray[np.object_]:
+        """
+        Convert arrays of input values to an array of :obj:`cftime.datetime`
+        """
+
+
+@define
+class YearMonthCftimeConverter:
+    """
+    Converter from year and month to :obj:`cftime.datetime`
+
+    Supports vectorised conversion (see :class:`VectorisedCftimeConverter`)
+    """
+
+    day: int = 1
+    """Day of the month to use"""
+
+    cftime_kwargs: dict[str, Any] = field(factory=dict)
+    """Passed to intialiser of :class:`cftime.datetime` (e.g. ``calendar``)"""
+
+    def __call__(
+        self,
+        *args: np.float_ | np.int_,
+    ) -> cftime.datetime:
+        """
+        Convert year and month to an :obj:`cftime.datetime`
+        """
+        year, month = args
+
+        return cftime.datetime(int(year), int(month), self.day, **self.cftime_kwargs)
+
+    def convert_vectorised(
+        self,
+        *args: npt.NDArray[np.float_ | np.int_],
+    ) -> npt.NDArray[np.object_]:
+        """
+        Convert arrays of years and months to an array of :obj:`cftime.datetime`
+
+        See :func:`convert_year_month_codes_to_datetimes`
+        """
+        years, months = args
+
+        return convert_year_month_codes_to_datetimes(
+            get_year_month_codes(years, months), day=self.day, **self.cftime_kwargs
+        )
+
+
 def convert_to_time(
     inp: xr.Dataset,
     time_coords: tuple[str, ...],
@@ -117,18 +175,26 @@ def convert_to_time(
 
     cftime_converter
         Callable that converts the stacked time co-ordinates to
-        :obj:`cftime.datetime`
+        :obj:`cftime.datetime`. If it is a
+        :class:`VectorisedCftimeConverter`, the conversion is done for all
+        values at once, otherwise it is called once for each value.
 
     Returns
     -------
         Data with time axis
     """
     inp = inp.stack(time=time_coords)
-    times = inp["time"].to_numpy()
 
-    inp = inp.drop_vars(("time", *time_coords)).assign_coords(
-        {"time": [cftime_converter(*t) for t in times]}
-    )
+    if isinstance(cftime_converter, VectorisedCftimeConverter):
+        times = cftime_converter.convert_vectorised(
+            *(inp[c].to_numpy() for c in time_coords)
+        )
+    else:
+        times = np.array(
+            [cftime_converter(*t) for t in inp["time"].to_numpy()], dtype=object
+        )
+
+    inp = inp.drop_vars(("time", *time_coords)).assign_coords({"time": times})
 
     return inp
 
@@ -157,19 +223,21 @@ def split_time_to_year_month(
     NonUniqueYearMonths
         The years and months are not unique
     """
-    out = inp.assign_coords(
-        {
-            "month": inp[time_axis].dt.month,
-            "year": inp[time_axis].dt.year,
-        }
-    ).set_index({time_axis: ("year", "month")})
+    years = inp[time_axis].dt.year
+    months = inp[time_axis].dt.month
 
     # Could be updated when https://github.com/pydata/xarray/issues/7104 is
     # closed
-    unique_vals, counts = np.unique(out[time_axis].values, return_counts=True)
+    check_year_month_codes_unique(
+        get_year_month_codes(years.to_numpy(), months.to_numpy())
+    )
 
-    if (counts > 1).any():
-        raise NonUniqueYearMonths(unique_vals, counts)
+    out = inp.assign_coords(
+        {
+            "month": months,
+            "year": years,
+        }
+    ).set_index({time_axis: ("year", "month")})
 
     return out
 
@@ -181,6 +249,12 @@ def convert_time_to_year_month(
     """
     Convert the time dimension to year and month co-ordinates
 
+    If the time axis is a complete, regular monthly series (i.e. every month
+    from January of the first year to December of the last year, in order),
+    the data is simply reshaped. Otherwise, we fall back to setting a
+    year-month index and unstacking it, which is much slower and needs more
+    memory.
+
     Parameters
     ----------
     inp
@@ -190,12 +264,60 @@ def convert_time_to_year_month(
     -------
         Data with year and month co-ordinates
     """
+    years = inp[time_axis].dt.year.to_numpy()
+    codes = get_year_month_codes(years, inp[time_axis].dt.month.to_numpy())
+
+    is_complete_monthly = (
+        codes.size > 0
+        and codes.size % MONTHS_PER_YEAR == 0
+        and codes[0] % MONTHS_PER_YEAR == 0
+        and (np.diff(codes) == 1).all()
+    )
+    if is_complete_monthly:
+        return _reshape_time_to_year_month(
+            inp, time_axis=time_axis, years=years[::MONTHS_PER_YEAR]
+        )
+
     return split_time_to_year_month(
         inp=inp,
         time_axis=time_axis,
     ).unstack(time_axis)
 
 
+def _reshape_time_to_year_month(
+    inp: xr.Dataset,
+    time_axis: str,
+    years: npt.NDArray[np.int_],
+) -> xr.Dataset:
+    # Same output as unstacking, i.e. year and month become the last
+    # dimensions, but the data is just reshaped so no MultiIndex is needed
+    # (and the reshape is a view wherever the memory layout allows it).
+    def reshape(variable: xr.Variable) -> xr.Variable:
+        if time_axis not in variable.dims:
+            return variable
+
+        variable = variable.transpose(..., time_axis)
+
+        return xr.Variable(
+            (*variable.dims[:-1], "year", "month"),
+            variable.data.reshape((*variable.shape[:-1], years.size, MONTHS_PER_YEAR)),
+            attrs=variable.attrs,
+            encoding=variable.encoding,
+        )
+
+    without_time = inp.drop_vars(time_axis)
+
+    return xr.Dataset(
+        data_vars={k: reshape(v.variable) for k, v in without_time.data_vars.items()},
+        coords={
+            **{k: reshape(v.variable) for k, v in without_time.coords.items()},
+            "year": years,
+            "month": np.arange(1, MONTHS_PER_YEAR + 1),
+        },
+        attrs=inp.attrs,
+    )
+
+
 def get_start_of_next_month(y: int, m: int) -> cftime.datetime:
     """
     Get start of next month
@@ -222,3 +344,541 @@ def get_start_of_next_month(y: int, m: int) -> cftime.datetime:
     # This may need to be refactored to allow the cftime_converter to be
     # injected, same idea as `convert_to_time`
     return cftime.datetime(y_out, m_out, 1)
+
+
+def get_year_month_codes(
+    years: npt.ArrayLike,
+    months: npt.ArrayLike,
+) -> npt.NDArray[np.int_]:
+    """
+    Get integer codes for year-month pairs
+
+    The codes increase by one from one month to the next, which makes it
+    cheap to check for uniqueness, contiguity etc. with integer arithmetic.
+
+    Parameters
+    ----------
+    years
+        Years
+
+    months
+        Months (January is 1)
+
+    Returns
+    -------
+        Year-month codes
+
+    Examples
+    --------
+    >>> get_year_month_codes([2010, 2010, 2011], [1, 12, 1])
+    array([24120, 24131, 24132])
+    """
+    codes: npt.NDArray[np.int_] = (
+        np.asarray(years) * MONTHS_PER_YEAR + np.asarray(months) - 1
+    )
+
+    return codes
+
+
+def check_year_month_codes_unique(codes: npt.NDArray[np.int_]) -> None:
+    """
+    Check that year-month codes are unique
+
+    Parameters
+    ----------
+    codes
+        Year-month codes, see :func:`get_year_month_codes`
+
+    Raises
+    ------
+    NonUniqueYearMonths
+        The year-month codes are not unique
+    """
+    unique_codes, counts = np.unique(codes, return_counts=True)
+
+    if (counts > 1).any():
+        unique_vals = [
+            (int(c // MONTHS_PER_YEAR), int(c % MONTHS_PER_YEAR + 1))
+            for c in unique_codes
+        ]
+        raise NonUniqueYearMonths(unique_vals, counts.tolist())
+
+
+def convert_year_month_codes_to_datetimes(
+    codes: npt.NDArray[np.int_],
+    day: int = 1,
+    **kwargs: Any,
+) -> npt.NDArray[np.object_]:
+    """
+    Convert year-month codes to :obj:`cftime.datetime`
+
+    This is vectorised. The datetimes are created once for the range of
+    codes, using a lookup table which is cached, then simply selected.
+    Repeated calls with the same range of codes (e.g. when processing many
+    variables on the same time axis) are therefore very cheap.
+
+    Parameters
+    ----------
+    codes
+        Year-month codes, see :func:`get_year_month_codes`. These can have
+        any shape.
+
+    day
+        Day of the month to use
+
+    **kwargs
+        Passed to intialiser of :class:`cftime.datetime` (e.g. ``calendar``)
+
+    Returns
+    -------
+        Datetimes, with the same shape as ``codes``
+    """
+    codes = np.asarray(codes)
+    if not codes.size:
+        return np.empty(codes.shape, dtype=object)
+
+    first_code = int(codes.min())
+    lookup_table = _get_year_month_datetime_lookup_table(
+        first_code,
+        int(codes.max()) - first_code + 1,
+        day,
+        tuple(sorted(kwargs.items())),
+    )
+
+    out: npt.NDArray[np.object_] = lookup_table[codes - first_code]
+
+    return out
+
+
+@lru_cache(maxsize=64)
+def _get_year_month_datetime_lookup_table(
+    first_code: int,
+    n_codes: int,
+    day: int,
+    cftime_kwargs: tuple[tuple[str, Any], ...],
+) -> npt.NDArray[np.object_]:
+    kwargs = dict(cftime_kwargs)
+
+    out = np.empty(n_codes, dtype=object)
+    out[:] = [
+        cftime.datetime(c // MONTHS_PER_YEAR, c % MONTHS_PER_YEAR + 1, day, **kwargs)
+        for c in range(first_code, first_code + n_codes)
+    ]
+    # The table is shared between calls so mustn't be modified
+    out.flags.writeable = False
+
+    return out
+
+
+MEAN_PRESERVING_BOUNDARY_CONDITIONS: tuple[str, ...] = ("linear", "flat")
+"""
+Boundary conditions supported by :func:`interpolate_annual_mean_to_monthly`
+"""
+
+
+def interpolate_annual_mean_to_monthly(
+    inp: xr.Dataset,
+    boundary: str = "linear",
+    year_dim: str = "year",
+    month_dim: str = "month",
+) -> xr.Dataset:
+    """
+    Interpolate annual-means onto monthly steps, preserving the annual-means
+
+    All data variables with a ``year_dim`` dimension are interpolated at
+    once, whatever their other dimensions (e.g. scenario, gas). Non-dimension
+    co-ordinates with a ``year_dim`` dimension (e.g. labels or bounds of each
+    year) aren't interpolated, their value for each year is repeated for
+    each month instead. Other variables are returned unchanged. See
+    :func:`interpolate_annual_mean_to_monthly_values` for details of the
+    algorithm.
+
+    Parameters
+    ----------
+    inp
+        Annual-mean data. The years must be consecutive.
+
+    boundary
+        Boundary condition to use, one of
+        :data:`MEAN_PRESERVING_BOUNDARY_CONDITIONS`
+
+    year_dim
+        Name of the year dimension
+
+    month_dim
+        Name of the month dimension in the output
+
+    Returns
+    -------
+        Monthly data. The ``month_dim`` dimension comes straight after
+        ``year_dim``.
+
+    Raises
+    ------
+    ValueError
+        The years are not consecutive
+    """
+    years = inp[year_dim].to_numpy()
+    if (np.diff(years) != 1).any():
+        raise ValueError(  # noqa: TRY003
+            f"Years must be consecutive, received: {years}"
+        )
+
+    def interpolate(variable: xr.Variable) -> xr.Variable:
+        if year_dim not in variable.dims:
+            return variable
+
+        dims = variable.dims
+        year_axis = dims.index(year_dim)
+        data = variable.data
+        units = getattr(data, "units", None)
+        magnitude = data.magnitude if units is not None else data
+
+        monthly = np.moveaxis(
+            interpolate_annual_mean_to_monthly_values(
+                np.moveaxis(magnitude, year_axis, 0), boundary=boundary
+            ),
+            (0, 1),
+            (year_axis, year_axis + 1),
+        )
+        if units is not None:
+            monthly = type(data)(monthly, units)
+
+        return xr.Variable(
+            (*dims[: year_axis + 1], month_dim, *dims[year_axis + 1 :]),
+            monthly,
+            attrs=variable.attrs,
+        )
+
+    def repeat(variable: xr.Variable) -> xr.Variable:
+        if year_dim not in variable.dims:
+            return variable
+
+        dims = variable.dims
+        year_axis = dims.index(year_dim)
+        data = variable.data
+        units = getattr(data, "units", None)
+        magnitude = data.magnitude if units is not None else data
+
+        monthly = np.repeat(
+            np.expand_dims(magnitude, year_axis + 1), MONTHS_PER_YEAR, year_axis + 1
+        )
+        if units is not None:
+            monthly = type(data)(monthly, units)
+
+        return xr.Variable(
+            (*dims[: year_axis + 1], month_dim, *dims[year_axis + 1 :]),
+            monthly,
+            attrs=variable.attrs,
+        )
+
+    return xr.Dataset(
+        data_vars={k: interpolate(v.variable) for k, v in inp.data_vars.items()},
+        coords={
+            **{k: repeat(v.variable) for k, v in inp.coords.items() if k != year_dim},
+            year_dim: years,
+            month_dim: np.arange(1, MONTHS_PER_YEAR + 1),
+        },
+        attrs=inp.attrs,
+    )
+
+
+def interpolate_annual_mean_to_monthly_values(
+    annual: npt.NDArray[np.float_],
+    boundary: str = "linear",
+) -> npt.NDArray[np.float_]:
+    r"""
+    Interpolate annual-mean values onto monthly steps, preserving the means
+
+    Parameters
+    ----------
+    annual
+        Annual-mean values. The first axis must be year, there can be any
+        number of other axes (all are interpolated at once).
+
+    boundary
+        Boundary condition to use, one of
+        :data:`MEAN_PRESERVING_BOUNDARY_CONDITIONS`. ``"linear"`` means that
+        the interpolated curve is a straight line in the first and last
+        years (so linear trends are reproduced exactly), ``"flat"`` means
+        that the curve has zero gradient at the start of the first year and
+        the end of the last year.
+
+    Returns
+    -------
+        Monthly values, with shape ``(n_years, 12, *annual.shape[1:])``
+
+    Raises
+    ------
+    ValueError
+        ``boundary`` is not supported or there are fewer than two years
+
+    Notes
+    -----
+    The interpolated curve, :math:`f`, is quadratic within each year and
+    continuous, with continuous gradient, across years. Writing :math:`x_i`
+    for the value at the start of year :math:`i` and :math:`a_i` for the
+    annual-mean, :math:`f` in year :math:`i` (with :math:`t \in [0, 1]`) is
+
+    .. math::
+
+        f_i(t) = x_i (1 - t) + x_{i + 1} t + c_i t (1 - t)
+
+    with :math:`c_i = 6 a_i - 3 (x_i + x_{i + 1})` so that :math:`f_i`
+    integrates to :math:`a_i`. Continuity of the gradient gives the banded
+    system
+
+    .. math::
+
+        x_{i - 1} + 4 x_i + x_{i + 1} = 3 (a_{i - 1} + a_i)
+
+    which is closed by the boundary conditions.
+
+    The result is linear in the annual-means so, rather than solving this
+    system each time, we apply the equivalent, cached, operator (see
+    :func:`get_mean_preserving_interpolation_operator`) to all the series
+    at once.
+
+    The monthly values are the means of :math:`f` over each month, taking
+    each month to be one twelfth of a year. Hence the mean of the monthly
+    values in each year is exactly the annual-mean.
+
+    Examples
+    --------
+    >>> monthly = interpolate_annual_mean_to_monthly_values(np.array([0.0, 1.0]))
+    >>> monthly.shape
+    (2, 12)
+    >>> np.round(monthly[0, :3], 4)
+    array([-0.4583, -0.375 , -0.2917])
+    >>> np.allclose(monthly.mean(axis=1), [0.0, 1.0])
+    True
+    """
+    if boundary not in MEAN_PRESERVING_BOUNDARY_CONDITIONS:
+        raise ValueError(  # noqa: TRY003
+            f"boundary must be one of {MEAN_PRESERVING_BOUNDARY_CONDITIONS}, "
+            f"received: {boundary!r}"
+        )
+
+    annual = np.asarray(annual)
+    n_years = annual.shape[0]
+    if n_years < 2:  # noqa: PLR2004
+        raise ValueError(  # noqa: TRY003
+            f"At least two years are required, received: {n_years}"
+        )
+
+    operator = get_mean_preserving_interpolation_operator(n_years, boundary)
+
+    return operator.apply(annual)
+
+
+MEAN_PRESERVING_OPERATOR_HALF_BANDWIDTH: int = 32
+"""
+Number of years either side of each year which affect its monthly values
+
+Strictly, every annual-mean affects every monthly value. However, the
+influence decays by a factor of :math:`2 - \\sqrt{3} \\approx 0.27` with each
+year so, beyond this many years, it is below floating point precision.
+"""
+
+_MEAN_PRESERVING_OPERATOR_BLOCK_SIZE: int = 64
+
+
+@define(frozen=True)
+class MeanPreservingInterpolationOperator:
+    """
+    Operator which does mean-preserving interpolation of annual-means
+
+    The operator is banded (see :data:`MEAN_PRESERVING_OPERATOR_HALF_BANDWIDTH`).
+    It is stored as dense blocks along its diagonal, so applying it is one
+    matrix-matrix product per block of years, whatever the number of series.
+    """
+
+    n_years: int
+    """Number of years the operator applies to"""
+
+    blocks: tuple[tuple[int, int, npt.NDArray[np.float_]], ...]
+    """
+    Blocks of the operator
+
+    Each block is the first output year, the first input year and the
+    matrix which maps the input years onto the months of the output years.
+    The matrix has shape ``(12 * n_output_years, n_input_years)``.
+    """
+
+    def apply(self, annual: npt.NDArray[np.float_]) -> npt.NDArray[np.float_]:
+        """
+        Apply the operator
+
+        Parameters
+        ----------
+        annual
+            Annual-mean values. The first axis must be year, there can be any
+            number of other axes (all are interpolated at once).
+
+        Returns
+        -------
+            Monthly values, with shape ``(n_years, 12, *annual.shape[1:])``
+
+        Raises
+        ------
+        ValueError
+            The number of years in ``annual`` doesn't match :attr:`n_years`
+        """
+        annual = np.asarray(annual)
+        if annual.shape[0] != self.n_years:
+            raise ValueError(  # noqa: TRY003
+                f"Expected {self.n_years} years, received: {annual.shape[0]}"
+            )
+
+        series = annual.reshape(self.n_years, -1)
+        out = np.empty(
+            (self.n_years, MONTHS_PER_YEAR, series.shape[1]),
+            dtype=np.result_type(series, 1.0),
+        )
+        for output_start, input_start, matrix in self.blocks:
+            output_stop = output_start + matrix.shape[0] // MONTHS_PER_YEAR
+            np.matmul(
+                matrix,
+                series[input_start : input_start + matrix.shape[1]],
+                out=out[output_start:output_stop].reshape(-1, series.shape[1]),
+            )
+
+        return out.reshape(self.n_years, MONTHS_PER_YEAR, *annual.shape[1:])
+
+
+@lru_cache(maxsize=16)
+def get_mean_preserving_interpolation_operator(
+    n_years: int, boundary: str = "linear"
+) -> MeanPreservingInterpolationOperator:
+    """
+    Get the operator for mean-preserving interpolation
+
+    The operator is cached, so it is only built once for each number of
+    years and boundary condition.
+
+    Parameters
+    ----------
+    n_years
+        Number of years
+
+    boundary
+        Boundary condition, see
+        :func:`interpolate_annual_mean_to_monthly_values`
+
+    Returns
+    -------
+        Operator
+    """
+    blocks = []
+    for output_start in range(0, n_years, _MEAN_PRESERVING_OPERATOR_BLOCK_SIZE):
+        output_stop = min(output_start + _MEAN_PRESERVING_OPERATOR_BLOCK_SIZE, n_years)
+        input_start = max(output_start - MEAN_PRESERVING_OPERATOR_HALF_BANDWIDTH, 0)
+        input_stop = min(output_stop + MEAN_PRESERVING_OPERATOR_HALF_BANDWIDTH, n_years)
+
+        # Response of the output years to a unit annual-mean in each input
+        # year. For the same reason that the operator is banded, we only need
+        # to solve over the years near the block. Where these don't reach the
+        # ends of the time axis, the boundary conditions we use have no
+        # effect at the precision we care about.
+        solve_start = max(input_start - MEAN_PRESERVING_OPERATOR_HALF_BANDWIDTH, 0)
+        solve_stop = min(input_stop + MEAN_PRESERVING_OPERATOR_HALF_BANDWIDTH, n_years)
+        unit_inputs = np.zeros((solve_stop - solve_start, input_stop - input_start))
+        unit_inputs[input_start - solve_start : input_stop - solve_start] = np.eye(
+            input_stop - input_start
+        )
+        matrix = _solve_mean_preserving(unit_inputs, boundary)[
+            output_start - solve_start : output_stop - solve_start
+        ]
+        matrix = np.ascontiguousarray(matrix.reshape(-1, input_stop - input_start))
+        # The operator is shared between calls so mustn't be modified
+        matrix.flags.writeable = False
+
+        blocks.append((output_start, input_start, matrix))
+
+    return MeanPreservingInterpolationOperator(n_years=n_years, blocks=tuple(blocks))
+
+
+def _solve_mean_preserving(
+    annual: npt.NDArray[np.float_], boundary: str
+) -> npt.NDArray[np.float_]:
+    n_years = annual.shape[0]
+    sub_diagonal, denominators, super_diagonal = _get_mean_preserving_factorisation(
+        n_years, boundary
+    )
+
+    # Right-hand side of the banded system
+    rhs = np.empty((n_years + 1, *annual.shape[1:]), dtype=np.result_type(annual, 1.0))
+    boundary_factor = 2.0 if boundary == "linear" else 3.0
+    rhs[0] = boundary_factor * annual[0]
+    rhs[1:-1] = 3.0 * (annual[:-1] + annual[1:])
+    rhs[-1] = boundary_factor * annual[-1]
+
+    # Forward and back substitution (Thomas algorithm)
+    rhs[0] /= denominators[0]
+    for i in range(1, n_years + 1):
+        rhs[i] = (rhs[i] - sub_diagonal[i] * rhs[i - 1]) / denominators[i]
+
+    knots = rhs
+    for i in range(n_years - 1, -1, -1):
+        knots[i] -= super_diagonal[i] * knots[i + 1]
+
+    curvature = 6.0 * annual - 3.0 * (knots[:-1] + knots[1:])
+
+    start_weights, end_weights, curvature_weights = _MONTHLY_MEAN_WEIGHTS
+    monthly: npt.NDArray[np.float_] = (
+        np.multiply.outer(knots[:-1], start_weights)
+        + np.multiply.outer(knots[1:], end_weights)
+        + np.multiply.outer(curvature, curvature_weights)
+    )
+
+    # Month straight after year
+    out: npt.NDArray[np.float_] = np.moveaxis(monthly, -1, 1)
+
+    return out
+
+
+def _get_monthly_mean_weights() -> tuple[npt.NDArray[np.float_], ...]:
+    # Means of the basis functions 1 - t, t and t (1 - t) over each month
+    month_edges = np.arange(MONTHS_PER_YEAR + 1) / MONTHS_PER_YEAR
+    t_start = month_edges[:-1]
+    t_end = month_edges[1:]
+
+    end_weights = (t_start + t_end) / 2
+    start_weights = 1 - end_weights
+    curvature_weights = end_weights - (t_start**2 + t_start * t_end + t_end**2) / 3
+
+    return start_weights, end_weights, curvature_weights
+
+
+_MONTHLY_MEAN_WEIGHTS = _get_monthly_mean_weights()
+
+
+@lru_cache(maxsize=64)
+def _get_mean_preserving_factorisation(
+    n_years: int, boundary: str
+) -> tuple[npt.NDArray[np.float_], ...]:
+    n_knots = n_years + 1
+
+    sub_diagonal = np.ones(n_knots)
+    diagonal = np.full(n_knots, 4.0)
+    super_diagonal = np.ones(n_knots)
+    sub_diagonal[0] = 0.0
+    super_diagonal[-1] = 0.0
+    # "linear": no curvature in the first and last years
+    # "flat": zero gradient at the start and end
+    diagonal[0] = diagonal[-1] = 1.0 if boundary == "linear" else 2.0
+
+    # Thomas algorithm factorisation
+    denominators = np.empty(n_knots)
+    super_diagonal_scaled = np.empty(n_knots)
+    denominators[0] = diagonal[0]
+    super_diagonal_scaled[0] = super_diagonal[0] / denominators[0]
+    for i in range(1, n_knots):
+        denominators[i] = diagonal[i] - sub_diagonal[i] * super_diagonal_scaled[i - 1]
+        super_diagonal_scaled[i] = super_diagonal[i] / denominators[i]
+
+    for arr in (sub_diagonal, denominators, super_diagonal_scaled):
+        # The factorisation is shared between calls so mustn't be modified
+        arr.flags.writeable = False
+
+    return sub_diagonal, denominators, super_diagonal_scaled
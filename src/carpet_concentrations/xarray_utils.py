@@ -3,10 +3,14 @@ Tools for helping with :mod:`xarray`
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import hashlib
+import itertools
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import xarray as xr
+from attrs import define, field
 
 from carpet_concentrations.attrs_utils import (
     make_attrs_validator_compatible_single_input,
@@ -15,9 +19,14 @@ from carpet_concentrations.exceptions import (
     CoordinateError,
     DatasetIncompatibleUnitsError,
 )
+from carpet_concentrations.xarray_pint_utils import check_pint_quantified_array
 
 if TYPE_CHECKING:
-    from collections.abc import Hashable
+    from collections.abc import Hashable, Iterator, Mapping
+
+    import attr
+    import numpy.typing as npt
+    import pint
 
 
 def check_dimensions(
@@ -54,12 +63,546 @@ def check_dimensions(
         raise CoordinateError(exp_dims, dims, inp, extras_ok)
 
 
-def calculate_weighted_area_mean_latitude_only(
+def get_chunk_indexers(
+    sizes: Mapping[Hashable, int],
+    chunks: Mapping[str, int],
+) -> Iterator[dict[str, slice]]:
+    """
+    Get indexers which split data into chunks
+
+    Parameters
+    ----------
+    sizes
+        Size of each dimension of the data (e.g. :attr:`xr.Dataset.sizes`)
+
+    chunks
+        Maximum size of each chunk along each dimension. Dimensions which
+        aren't in ``chunks`` aren't split.
+
+    Returns
+    -------
+        Iterator of indexers which can be passed to :meth:`xr.Dataset.isel`.
+        Iteration is over the dimensions in the order in which they appear
+        in ``chunks``, with the last dimension varying fastest.
+
+    Raises
+    ------
+    ValueError
+        Any of the chunk sizes are less than one. This is raised by the call
+        itself, not on the first iteration.
+
+    Examples
+    --------
+    >>> list(get_chunk_indexers({"year": 5, "month": 12}, {"year": 2}))
+    [{'year': slice(0, 2, None)}, {'year': slice(2, 4, None)}, {'year': slice(4, 5, None)}]
+    """
+    for dim, chunk_size in chunks.items():
+        if chunk_size < 1:
+            raise ValueError(  # noqa: TRY003
+                f"Chunk sizes must be at least one, received {dim}: {chunk_size}"
+            )
+
+    dim_slices = [
+        [
+            slice(start, min(start + chunk_size, sizes[dim]))
+            for start in range(0, sizes[dim], chunk_size)
+        ]
+        for dim, chunk_size in chunks.items()
+    ]
+
+    return (
+        dict(zip(chunks.keys(), slices)) for slices in itertools.product(*dim_slices)
+    )
+
+
+def get_dataset_fingerprint(ds: xr.Dataset) -> str:
+    """
+    Get a fingerprint of an :obj:`xr.Dataset`
+
+    The fingerprint is a hash of the name, dimensions, units, dtype and
+    values of every variable (data variables and co-ordinates) and their
+    shapes. Hence two
+    datasets with the same fingerprint can be treated as containing the same
+    data (metadata other than units is ignored).
+
+    Values are hashed in blocks, so memory-mapped arrays are never loaded
+    into memory all at once. For dask arrays (e.g. from files opened with
+    ``xr.open_dataset(..., chunks=...)``), the values aren't read at all.
+    Instead, the array's name is used, which dask derives from the source of
+    the data (for files opened by xarray, the path and modification time).
+
+    Parameters
+    ----------
+    ds
+        Dataset to fingerprint
+
+    Returns
+    -------
+        Fingerprint (hex digest of the hash)
+    """
+    hasher = hashlib.blake2b(digest_size=32)
+    for name in sorted(ds.variables, key=str):
+        variable = ds.variables[name]
+        data = variable.data
+        units = getattr(data, "units", variable.attrs.get("units"))
+        values = getattr(data, "magnitude", data)
+
+        hasher.update(
+            repr(
+                (str(name), variable.dims, values.shape, str(units), str(values.dtype))
+            ).encode()
+        )
+        if hasattr(values, "dask"):
+            hasher.update(values.name.encode())
+        elif values.dtype.hasobject:
+            # Raw bytes of object arrays are pointers, so hash the values
+            hasher.update(repr(np.asarray(values).tolist()).encode())
+        else:
+            _update_hash_in_blocks(hasher, values)
+
+    return hasher.hexdigest()
+
+
+_FINGERPRINT_BLOCK_BYTES: int = 2**26
+"""Approximate size of the blocks in which values are hashed"""
+
+
+def _update_hash_in_blocks(hasher: hashlib.blake2b, values: npt.NDArray[Any]) -> None:
+    if values.ndim == 0 or values.size == 0:
+        hasher.update(np.ascontiguousarray(values).tobytes())
+        return
+
+    block_length = max(
+        1, _FINGERPRINT_BLOCK_BYTES * values.shape[0] // max(values.nbytes, 1)
+    )
+    for start in range(0, values.shape[0], block_length):
+        hasher.update(np.ascontiguousarray(values[start : start + block_length]).data)
+
+
+@define(frozen=True)
+class AreaWeights:
+    """
+    Area weights of a grid
+
+    Use :func:`get_area_weights` to create these, as that caches the weights
+    for each grid.
+    """
+
+    weights: xr.DataArray
+    """
+    Normalised area weights (i.e. they sum to one) of each grid cell
+
+    The dimensions are the grid's spatial dimensions e.g. ``("lat",)`` or
+    ``("lat", "lon")``. There can also be other dimensions which aren't in
+    the data (e.g. ``"region"``, see :func:`get_latitude_band_weights`), in
+    which case the weights sum to one for each value of those dimensions and
+    the means are calculated for each value of those dimensions at once.
+    """
+
+    def area_mean(
+        self,
+        da: xr.DataArray,
+        mask: xr.DataArray | None = None,
+        skipna: bool = False,
+    ) -> xr.DataArray:
+        """
+        Calculate the area-weighted mean
+
+        The spatial dimensions of ``da`` are assumed to be in the same order
+        as :attr:`weights` (they are matched by position, not co-ordinate
+        value).
+
+        Parameters
+        ----------
+        da
+            Data of which to calculate the mean. It can have any number of
+            other dimensions.
+
+        mask
+            Boolean mask of the cells to include in the mean (e.g. to
+            calculate the mean over a region). Its dimensions must be a subset
+            of the dimensions of :attr:`weights`. If not supplied, all cells
+            are included.
+
+        skipna
+            If ``True``, NaN values in ``da`` are skipped when summing i.e.
+            they contribute nothing to the mean (the weights aren't
+            re-normalised over the remaining cells). If ``False``, NaN values
+            propagate to the output, which avoids a copy of ``da``.
+
+        Returns
+        -------
+            Area-weighted mean
+
+        Raises
+        ------
+        CoordinateError
+            ``mask`` has dimensions which aren't in :attr:`weights`
+        """
+        data = da.data
+        units = getattr(data, "units", None)
+        if units is not None:
+            # Work with the magnitude then reattach the units, pint adds a lot
+            # of overhead when handling large arrays
+            magnitude_mean = self.area_mean(
+                da.copy(data=data.magnitude), mask=mask, skipna=skipna
+            )
+
+            return magnitude_mean.copy(data=type(data)(magnitude_mean.data, units))
+
+        weights = self.weights
+        if mask is not None:
+            if not set(mask.dims).issubset(weights.dims):
+                raise CoordinateError(weights.dims, mask.dims, mask, False)
+
+            spatial_dims = [d for d in weights.dims if d in da.dims]
+            weights = weights.where(mask, 0.0)
+            weights = weights / weights.sum(spatial_dims)
+
+        if skipna:
+            da = da.fillna(0.0)
+
+        # The only dimensions in common are the spatial dimensions so we don't
+        # need to specify the dimensions to sum over
+        area_mean: xr.DataArray = xr.dot(da, weights)
+
+        return area_mean
+
+
+def get_area_weights(
+    lat_bounds: xr.DataArray,
+    lon_bounds: xr.DataArray | None = None,
+    bounds_dim_name: str = "bounds",
+) -> AreaWeights:
+    r"""
+    Get area weights for a rectilinear grid
+
+    The grid can be latitude-only or latitude-longitude. The cells don't have
+    to be evenly spaced. The weights are cached, keyed by the values, units
+    and shape of the bounds. Hence repeated calls with the same grid are very
+    cheap.
+
+    Parameters
+    ----------
+    lat_bounds
+        Latitude bounds. These must have been quantified with pint and have
+        two dimensions, the latitude dimension and ``bounds_dim_name``.
+
+    lon_bounds
+        Longitude bounds. If supplied, these must have been quantified with
+        pint and have two dimensions, the longitude dimension and
+        ``bounds_dim_name``. If not supplied, the grid is latitude-only.
+
+    bounds_dim_name
+        Name of the dimension which defines bounds
+
+    Returns
+    -------
+        Area weights
+
+    Raises
+    ------
+    NotPintQuantifiedError
+        ``lat_bounds`` or ``lon_bounds`` has not been quantified with pint
+
+    Notes
+    -----
+    See :footcite:t:`kelly_savric_2020_computation`. The area of a cell on a
+    sphere of radius :math:`r` is
+
+    .. math::
+
+        A = r^2 (\sin \phi_2 - \sin \phi_1) (\lambda_2 - \lambda_1)
+
+    where :math:`\phi` is latitude and :math:`\lambda` is longitude (in
+    radians). As the weights are normalised, :math:`r^2` drops out (as do the
+    longitude factors for latitude-only grids). Longitude bounds which wrap
+    around (e.g. from 355 to 5 degrees) are handled.
+    """
+    lat_key = _get_bounds_cache_key(lat_bounds, bounds_dim_name)
+    if lon_bounds is None:
+        return _get_area_weights(lat_key)
+
+    return _get_area_weights(
+        lat_key, _get_bounds_cache_key(lon_bounds, bounds_dim_name)
+    )
+
+
+_BoundsCacheKey = tuple[bytes, tuple[int, ...], str, float, "Hashable"]
+
+
+def _get_bounds_cache_key(
+    bounds: xr.DataArray, bounds_dim_name: str
+) -> _BoundsCacheKey:
+    check_pint_quantified_array(bounds)
+    check_dimensions(bounds, (bounds_dim_name,), extras_ok=True)
+
+    bounds = bounds.transpose(..., bounds_dim_name)
+    magnitude = np.asarray(bounds.data.magnitude)
+
+    return (
+        magnitude.tobytes(),
+        magnitude.shape,
+        magnitude.dtype.str,
+        _get_to_radians_factor(bounds.data.units),
+        bounds.dims[0],
+    )
+
+
+_TO_RADIANS_FACTORS: dict[tuple[str, int], float] = {}
+"""Cache of factors to convert to radians, keyed by units and unit registry"""
+
+
+def _get_to_radians_factor(units: pint.Unit) -> float:
+    # Units from different registries can't be compared, hence can't be
+    # used as keys directly
+    key = (str(units), id(units._REGISTRY))
+    if key not in _TO_RADIANS_FACTORS:
+        _TO_RADIANS_FACTORS[key] = float((1 * units).to("radian").magnitude)
+
+    return _TO_RADIANS_FACTORS[key]
+
+
+def _get_bounds_radians(
+    key: _BoundsCacheKey,
+) -> npt.NDArray[np.float64]:
+    bounds_bytes, shape, dtype, to_radians_factor, _ = key
+    bounds_radians: npt.NDArray[np.float64] = (
+        np.frombuffer(bounds_bytes, dtype=dtype).reshape(shape) * to_radians_factor
+    )
+
+    return bounds_radians
+
+
+@lru_cache(maxsize=32)
+def _get_area_weights(
+    lat_key: _BoundsCacheKey,
+    lon_key: _BoundsCacheKey | None = None,
+) -> AreaWeights:
+    lat_bounds_radians = _get_bounds_radians(lat_key)
+    weights = np.abs(np.diff(np.sin(lat_bounds_radians), axis=-1)).squeeze(axis=-1)
+    dims: tuple[Hashable, ...] = (lat_key[-1],)
+
+    if lon_key is not None:
+        weights = np.multiply.outer(weights, _get_lon_widths(lon_key))
+        dims = (*dims, lon_key[-1])
+
+    weights /= weights.sum()
+    # The weights are shared between calls so mustn't be modified
+    weights.flags.writeable = False
+
+    return AreaWeights(xr.DataArray(weights, dims=dims))
+
+
+def _get_lon_widths(lon_key: _BoundsCacheKey) -> npt.NDArray[np.float64]:
+    lon_widths: npt.NDArray[np.float64] = np.diff(
+        _get_bounds_radians(lon_key), axis=-1
+    ).squeeze(axis=-1)
+    # Handle cells which wrap around e.g. from 355 to 5 degrees
+    lon_widths[lon_widths < 0] += 2 * np.pi
+
+    return lon_widths
+
+
+@define(frozen=True)
+class LatitudeBand:
+    """
+    Region defined by a band of latitudes
+    """
+
+    name: str
+    """Name of the region"""
+
+    lower: float
+    """Southern edge of the band (degrees north)"""
+
+    upper: float = field()
+    """Northern edge of the band (degrees north)"""
+
+    @upper.validator
+    def _upper_validator(self, attribute: attr.Attribute[Any], value: float) -> None:
+        if value <= self.lower:
+            raise ValueError(  # noqa: TRY003
+                f"upper ({value}) must be greater than lower ({self.lower})"
+            )
+
+
+GMNHSH_REGIONS: tuple[LatitudeBand, ...] = (
+    LatitudeBand("World", -90.0, 90.0),
+    LatitudeBand("Northern Hemisphere", 0.0, 90.0),
+    LatitudeBand("Southern Hemisphere", -90.0, 0.0),
+)
+"""
+Global, northern hemisphere and southern hemisphere regions
+
+These are the regions used in input4MIPs' ``gr1-GMNHSH`` files
+"""
+
+
+def get_latitude_band_weights(
+    lat_bounds: xr.DataArray,
+    regions: tuple[LatitudeBand, ...] = GMNHSH_REGIONS,
+    lon_bounds: xr.DataArray | None = None,
+    bounds_dim_name: str = "bounds",
+    region_dim: str = "region",
+) -> AreaWeights:
+    r"""
+    Get area weights for the means over many latitude bands at once
+
+    The weights have a ``region_dim`` dimension, so the means over all the
+    regions are calculated in a single pass with
+    :meth:`AreaWeights.area_mean`. The weights are cached, see
+    :func:`get_area_weights`.
+
+    Parameters
+    ----------
+    lat_bounds
+        Latitude bounds. See :func:`get_area_weights`.
+
+    regions
+        Regions to calculate weights for
+
+    lon_bounds
+        Longitude bounds. See :func:`get_area_weights`.
+
+    bounds_dim_name
+        Name of the dimension which defines bounds
+
+    region_dim
+        Name of the region dimension in the output. The co-ordinate values
+        are the names of ``regions``.
+
+    Returns
+    -------
+        Area weights
+
+    Raises
+    ------
+    ValueError
+        One of the regions doesn't overlap with the grid
+
+    Notes
+    -----
+    Cells which are only partly in a band are weighted by the area of the
+    part which is in the band i.e. the cell from latitude :math:`\phi_1` to
+    :math:`\phi_2` has weight (before normalisation)
+
+    .. math::
+
+        \max(0, \sin(\min(\phi_2, u)) - \sin(\max(\phi_1, l)))
+
+    in the band from latitude :math:`l` to :math:`u`.
+    """
+    lat_key = _get_bounds_cache_key(lat_bounds, bounds_dim_name)
+    lon_key = (
+        None
+        if lon_bounds is None
+        else _get_bounds_cache_key(lon_bounds, bounds_dim_name)
+    )
+
+    return _get_latitude_band_weights(lat_key, lon_key, regions, region_dim)
+
+
+@lru_cache(maxsize=32)
+def _get_latitude_band_weights(
+    lat_key: _BoundsCacheKey,
+    lon_key: _BoundsCacheKey | None,
+    regions: tuple[LatitudeBand, ...],
+    region_dim: str,
+) -> AreaWeights:
+    lat_bounds_radians = _get_bounds_radians(lat_key)
+    cell_lower = lat_bounds_radians.min(axis=-1)
+    cell_upper = lat_bounds_radians.max(axis=-1)
+
+    band_lower = np.deg2rad([r.lower for r in regions])[:, np.newaxis]
+    band_upper = np.deg2rad([r.upper for r in regions])[:, np.newaxis]
+
+    # Overlap of each cell with each band, in sin-space so it is
+    # proportional to area
+    weights = np.clip(
+        np.sin(np.minimum(cell_upper, band_upper))
+        - np.sin(np.maximum(cell_lower, band_lower)),
+        0.0,
+        None,
+    )
+    dims: tuple[Hashable, ...] = (region_dim, lat_key[-1])
+
+    if lon_key is not None:
+        weights = weights[..., np.newaxis] * _get_lon_widths(lon_key)
+        dims = (*dims, lon_key[-1])
+
+    totals = weights.sum(axis=tuple(range(1, weights.ndim)), keepdims=True)
+    no_overlap = [r.name for r, t in zip(regions, totals.ravel()) if t == 0]
+    if no_overlap:
+        raise ValueError(  # noqa: TRY003
+            f"These regions don't overlap with the grid: {no_overlap}"
+        )
+
+    weights = weights / totals
+    # The weights are shared between calls so mustn't be modified
+    weights.flags.writeable = False
+
+    return AreaWeights(
+        xr.DataArray(weights, dims=dims, coords={region_dim: [r.name for r in regions]})
+    )
+
+
+def calculate_weighted_area_mean(  # noqa: PLR0913
+    inp: xr.Dataset,
+    variables: list[str],
+    mask: xr.DataArray | None = None,
+    bounds_dim_name: str = "bounds",
+    lat_bounds_name: str = "lat_bounds",
+    lon_bounds_name: str = "lon_bounds",
+) -> xr.Dataset:
+    """
+    Calculate area mean on a rectilinear grid
+
+    Uses longitude information if ``inp`` contains ``lon_bounds_name``,
+    otherwise only latitude information is used. See :func:`get_area_weights`.
+
+    Parameters
+    ----------
+    inp
+        :obj:`xr.Dataset` to process
+
+    variables
+        Variables of which to calculate the area-mean
+
+    mask
+        Boolean mask of the cells to include in the mean. See
+        :meth:`AreaWeights.area_mean`.
+
+    bounds_dim_name
+        Name of the dimension which defines bounds
+
+    lat_bounds_name
+        Name of the latitude bounds variable
+
+    lon_bounds_name
+        Name of the longitude bounds variable
+
+    Returns
+    -------
+        :obj:`xr.Dataset` with area-weighted mean of ``variables`` (only)
+    """
+    area_weights = get_area_weights(
+        inp[lat_bounds_name],
+        lon_bounds=inp[lon_bounds_name] if lon_bounds_name in inp else None,
+        bounds_dim_name=bounds_dim_name,
+    )
+
+    return xr.Dataset({v: area_weights.area_mean(inp[v], mask=mask) for v in variables})
+
+
+def calculate_weighted_area_mean_latitude_only(  # noqa: PLR0913
     inp: xr.Dataset,
     variables: list[str],
     bounds_dim_name: str = "bounds",
     lat_name: str = "lat",
     lat_bounds_name: str = "lat_bounds",
+    keep_other_variables: bool = True,
+    skipna: bool = True,
 ) -> xr.Dataset:
     """
     Calculate area mean based on only latitude information
@@ -83,20 +626,38 @@ def calculate_weighted_area_mean_latitude_only(
     lat_bounds_name
         Name of the latitude bounds variable
 
+    keep_other_variables
+        Should the other variables and co-ordinates in ``inp`` be merged into
+        the output? If ``False``, only the area-weighted means (and their
+        co-ordinates) are returned. This avoids merging, which copies and
+        aligns all of ``inp``, so is much faster for large datasets.
+
+    skipna
+        Should NaN values be skipped? If ``True`` (the default), NaN cells
+        contribute nothing to the weighted sum, which is still divided by the
+        total weight of all cells. If ``False``, NaN values propagate to the
+        output. See :meth:`AreaWeights.area_mean`.
+
     Returns
     -------
         :obj:`xr.Dataset` with area-weighted mean of ``variables``
     """
-    lat_bnds = inp[lat_bounds_name].pint.to("radian")
-
-    # as they are constants, r^2 and longitude factors drop out
-    # in area weights. Would have to be more careful with
-    # longitudes if on a non-uniform grid.
-    area_weighting = np.sin(lat_bnds).diff(dim=bounds_dim_name).squeeze()
-
-    area_weighted_mean = (inp[variables] * area_weighting).sum(
-        lat_name
-    ) / area_weighting.sum(lat_name)
+    area_weights = get_area_weights(
+        inp[lat_bounds_name], bounds_dim_name=bounds_dim_name
+    )
+    if area_weights.weights.dims != (lat_name,):
+        raise CoordinateError(
+            (lat_name, bounds_dim_name),
+            inp[lat_bounds_name].dims,
+            inp[lat_bounds_name],
+            False,
+        )
+
+    area_weighted_mean = xr.Dataset(
+        {v: area_weights.area_mean(inp[v], skipna=skipna) for v in variables}
+    )
+    if not keep_other_variables:
+        return area_weighted_mean
 
     # #8: allow dependency injection here
     keys_to_check = list(inp.data_vars.keys()) + list(inp.coords.keys())
@@ -139,3 +700,56 @@ def check_all_units_compatible(ds: xr.Dataset) -> None:
 check_all_units_compatible_attrs = make_attrs_validator_compatible_single_input(
     check_all_units_compatible
 )
+
+
+def calculate_regional_means(  # noqa: PLR0913
+    inp: xr.Dataset,
+    variables: list[str],
+    regions: tuple[LatitudeBand, ...] = GMNHSH_REGIONS,
+    region_dim: str = "region",
+    bounds_dim_name: str = "bounds",
+    lat_bounds_name: str = "lat_bounds",
+    lon_bounds_name: str = "lon_bounds",
+) -> xr.Dataset:
+    """
+    Calculate area means over many latitude bands in a single pass
+
+    Uses longitude information if ``inp`` contains ``lon_bounds_name``. See
+    :func:`get_latitude_band_weights`.
+
+    Parameters
+    ----------
+    inp
+        :obj:`xr.Dataset` to process
+
+    variables
+        Variables of which to calculate the regional means
+
+    regions
+        Regions over which to calculate the means
+
+    region_dim
+        Name of the region dimension in the output
+
+    bounds_dim_name
+        Name of the dimension which defines bounds
+
+    lat_bounds_name
+        Name of the latitude bounds variable
+
+    lon_bounds_name
+        Name of the longitude bounds variable
+
+    Returns
+    -------
+        :obj:`xr.Dataset` with the regional means of ``variables`` (only)
+    """
+    area_weights = get_latitude_band_weights(
+        inp[lat_bounds_name],
+        regions=regions,
+        lon_bounds=inp[lon_bounds_name] if lon_bounds_name in inp else None,
+        bounds_dim_name=bounds_dim_name,
+        region_dim=region_dim,
+    )
+
+    return xr.Dataset({v: area_weights.area_mean(inp[v]) for v in variables})
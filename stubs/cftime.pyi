@@ -1,3 +1,5 @@
+from typing import Any
+
 class datetime:
     def __init__(
         self,
@@ -16,3 +18,11 @@ class datetime:
     @property
     def format(self) -> str: ...
     def strftime(self, format: str | None = None) -> str: ...
+
+def date2num(
+    dates: Any,
+    units: str,
+    calendar: str | None = None,
+    has_year_zero: bool | None = None,
+    longdouble: bool = False,
+) -> Any: ...
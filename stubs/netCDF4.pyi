@@ -0,0 +1,24 @@
+from types import TracebackType
+from typing import Any
+
+class Dimension:
+    def __len__(self) -> int: ...
+
+class Variable:
+    dimensions: tuple[str, ...]
+    shape: tuple[int, ...]
+    def __getattr__(self, name: str) -> Any: ...
+    def __getitem__(self, elem: Any) -> Any: ...
+    def __setitem__(self, elem: Any, data: Any) -> None: ...
+
+class Dataset:
+    dimensions: dict[Any, Dimension]
+    variables: dict[Any, Variable]
+    def __init__(self, filename: Any, mode: str = "r", **kwargs: Any) -> None: ...
+    def __enter__(self) -> Dataset: ...
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None: ...
@@ -0,0 +1,11 @@
+from typing import Any
+
+class Array:
+    def resize(self, *args: Any) -> None: ...
+    def __setitem__(self, selection: Any, value: Any) -> None: ...
+
+class Group:
+    def __getitem__(self, item: str) -> Array: ...
+
+def open_group(store: Any = None, mode: str = "a", **kwargs: Any) -> Group: ...
+def consolidate_metadata(store: Any, **kwargs: Any) -> Any: ...
@@ -3,6 +3,9 @@ Re-useable fixtures etc. for tests
 
 See https://docs.pytest.org/en/7.1.x/reference/fixtures.html#conftest-py-sharing-fixtures-across-multiple-files
 """
+from functools import partial
+
+import dask
 import pandas as pd
 import pytest
 
@@ -18,3 +21,15 @@ def pandas_terminal_width():
     # Display as many columns as you want (i.e. let the display width do the
     # truncation)
     pd.set_option("display.max_columns", 1000)
+
+
+def _raise_on_compute(*args, **kwargs):
+    raise AssertionError("Dask computation triggered")  # noqa: TRY003
+
+
+@pytest.fixture
+def no_dask_compute():
+    """
+    Get a context manager in which any dask computation raises an error
+    """
+    return partial(dask.config.set, scheduler=_raise_on_compute)
@@ -9,17 +9,25 @@ import cf_xarray.units
 import cftime
 import numpy as np
 import pint_xarray  # noqa: F401 # required to enable pint accessors
+import pytest
 import xarray as xr
 
 from carpet_concentrations.input4MIPs.dataset import (
     Input4MIPsDataset,
+    Input4MIPsGrid,
     Input4MIPsMetadata,
     Input4MIPsMetadataOptional,
+    convert_zarr_to_netcdf,
+    write_along_time,
 )
 from carpet_concentrations.input4MIPs.metadata_options import (
     CREATION_DATE_REGEX,
     UUID_REGEX,
 )
+from carpet_concentrations.input4MIPs.parallel import (
+    write_periods_in_parallel,
+    write_variables_in_parallel,
+)
 from carpet_concentrations.time import (
     get_start_of_next_month,
 )
@@ -28,6 +36,73 @@ from carpet_concentrations.time import (
 cf_xarray.units.units.define("ppb = ppm / 1000")
 
 RNG = np.random.default_rng()
+DIMENSIONS = ("time", "lat")
+CO2 = "mole_fraction_of_carbon_dioxide_in_air"
+CH4 = "mole_fraction_of_methane_in_air"
+
+
+@pytest.fixture
+def metadata():
+    return Input4MIPsMetadata(
+        contact="contact test (test@address.com)",
+        dataset_category="GHGConcentrations",
+        frequency="mon",
+        further_info_url="cmip6.science.unimelb.edu.au",
+        grid_label="gn",
+        Conventions="CF-1.6",
+        activity_id="input4MIPs",
+        institution="Climate Resource",
+        institution_id="CR",
+        mip_era="CMIP6",
+        nominal_resolution="10000 km",
+        realm="atmos",
+        source_version="1.2.1",
+        source_id="CR-1-2-1",
+        source="CR 1.2.1: Test file",
+        target_mip="ScenarioMIP",
+        title="CR 1.2.1 test dataset for testing",
+    )
+
+
+def get_test_dataset(years, variable_units=None):
+    """
+    Get a monthly dataset on a latitudinal grid for testing
+
+    ``variable_units`` maps each variable's name to its units, by default
+    there is only a CO2 variable.
+    """
+    if variable_units is None:
+        variable_units = {CO2: "ppm"}
+
+    time = [cftime.datetime(y, m, 15) for y in years for m in range(1, 12 + 1)]
+    lat = np.arange(-82.5, 82.5 + 1, 15)
+
+    ds = xr.Dataset(
+        {
+            variable: (
+                DIMENSIONS,
+                280 + RNG.random(size=(len(time), len(lat))),
+                {"units": units},
+            )
+            for variable, units in variable_units.items()
+        },
+        coords={
+            "time": time,
+            "lat": lat,
+        },
+    ).pint.quantify(unit_registry=cf_xarray.units.units)
+    ds["time"].encoding = {
+        "calendar": "standard",
+        "units": "days since 2010-01-01",
+    }
+
+    return ds
+
+
+def get_input4mips_ds(ds, metadata, **kwargs):
+    return Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+        ds, DIMENSIONS, metadata=metadata, **kwargs
+    )
 
 
 def test_file_creation(tmpdir):
@@ -175,3 +250,306 @@ def test_file_creation(tmpdir):
             == read.attrs["tracking_id"]
         )
         assert read.attrs["variable_id"] == data_var
+
+
+def test_write_along_time(tmpdir, metadata):
+    ds = get_test_dataset(range(2010, 2015 + 1))
+
+    written_full = get_input4mips_ds(ds, metadata).write(
+        root_data_dir=Path(tmpdir) / "full"
+    )
+
+    chunks = (
+        get_input4mips_ds(ds.isel(time=slice(start, start + 30)), metadata)
+        for start in range(0, ds.sizes["time"], 30)
+    )
+    written_chunked = write_along_time(chunks, root_data_dir=Path(tmpdir) / "chunked")
+
+    assert written_chunked.name == written_full.name
+    assert not list(written_chunked.parent.glob("*.incomplete"))
+
+    read_full = xr.load_dataset(written_full, decode_times=False)
+    read_chunked = xr.load_dataset(written_chunked, decode_times=False)
+
+    for attr in ["creation_date", "tracking_id"]:
+        read_full.attrs.pop(attr)
+        read_chunked.attrs.pop(attr)
+
+    xr.testing.assert_identical(read_chunked, read_full)
+
+
+def test_append_to_netcdf_times_not_increasing(tmpdir, metadata):
+    ds = get_test_dataset(range(2010, 2012 + 1))
+    written = get_input4mips_ds(ds.isel(time=slice(12, 24)), metadata).write(
+        root_data_dir=Path(tmpdir), unlimited_dims=("time",)
+    )
+    before = xr.load_dataset(written, decode_times=False)
+
+    for error_time in (slice(0, 12), slice(12, 24), slice(23, 36)):
+        with pytest.raises(ValueError, match="must be strictly increasing"):
+            get_input4mips_ds(ds.isel(time=error_time), metadata).append_to_netcdf(
+                written
+            )
+
+    # Nothing was written
+    xr.testing.assert_identical(xr.load_dataset(written, decode_times=False), before)
+
+    get_input4mips_ds(ds.isel(time=slice(24, 36)), metadata).append_to_netcdf(written)
+    assert xr.load_dataset(written)["time"].size == 24
+
+
+def test_append_to_netcdf_integer_times(tmpdir, metadata):
+    ds = get_test_dataset(range(2010, 2011 + 1))
+    written = get_input4mips_ds(ds.isel(time=slice(0, 12)), metadata).write(
+        root_data_dir=Path(tmpdir), unlimited_dims=("time",)
+    )
+    # Times at midnight are encoded as whole days so stored as integers
+    read = xr.load_dataset(written, decode_times=False)
+    assert np.issubdtype(read["time"].dtype, np.integer)
+
+    # Times at midday can't be stored without truncation
+    midday = ds.isel(time=slice(12, 24))
+    midday["time"] = [
+        cftime.datetime(t.year, t.month, t.day, 12) for t in midday["time"].values
+    ]
+    with pytest.raises(ValueError, match="so these times can't be written exactly"):
+        get_input4mips_ds(midday, metadata).append_to_netcdf(written)
+
+    get_input4mips_ds(ds.isel(time=slice(12, 24)), metadata).append_to_netcdf(written)
+    read = xr.load_dataset(written, use_cftime=True)
+    np.testing.assert_equal(read["time"].values, ds["time"].values)
+
+
+def test_write_variables_in_parallel(tmpdir, metadata):
+    ds = get_test_dataset(range(2010, 2012 + 1), {CO2: "ppm", CH4: "ppb"})
+    # No latitude dimension so writing will fail
+    ds["mole_fraction_of_nitrous_oxide_in_air"] = ds[CH4].mean("lat")
+
+    results = write_variables_in_parallel(
+        ds,
+        DIMENSIONS,
+        metadata=metadata,
+        root_data_dir=Path(tmpdir),
+        max_workers=2,
+    )
+
+    assert [r.variable_id for r in results] == list(ds.data_vars)
+
+    failed = results[-1]
+    assert failed.path is None
+    assert isinstance(failed.error, ValueError)
+
+    written_paths = [r.path for r in results[:-1]]
+    # All files are written with the same version
+    assert len({p.parent.name for p in written_paths}) == 1
+
+    for result in results[:-1]:
+        assert result.error is None
+
+        read = xr.decode_cf(
+            xr.load_dataset(result.path, decode_times=False), use_cftime=True
+        ).pint.quantify(unit_registry=cf_xarray.units.units)
+
+        xr.testing.assert_equal(read[result.variable_id], ds[result.variable_id])
+        assert result.variable_id.replace("_", "-") in result.path.name
+
+
+def test_write_variables_in_parallel_grid_error(tmpdir, metadata):
+    ds = get_test_dataset([2010], {CO2: "ppm", CH4: "ppb"})
+
+    # Errors other than missing co-ordinates aren't hidden
+    with pytest.raises(NotImplementedError):
+        write_variables_in_parallel(
+            ds,
+            DIMENSIONS,
+            metadata=metadata,
+            root_data_dir=Path(tmpdir),
+            monthly_time_bounds=False,
+        )
+
+    assert not list(Path(tmpdir).rglob("*.nc"))
+
+
+def test_write_periods_in_parallel(tmpdir, metadata):
+    ds = get_test_dataset(range(2010, 2014 + 1))
+    dataset = get_input4mips_ds(ds, metadata)
+
+    results = write_periods_in_parallel(
+        dataset,
+        root_data_dir=Path(tmpdir),
+        years_per_period=2,
+        max_workers=2,
+        dtype=np.float32,
+    )
+
+    assert all(r.error is None for r in results)
+    assert all(r.variable_id == CO2 for r in results)
+    assert [r.period for r in results] == [(2010, 2011), (2012, 2013), (2014, 2014)]
+
+    written = [r.path for r in results]
+    assert ["_".join(p.name.split("_")[-2:]) for p in written] == [
+        "201001_201112.nc",
+        "201201_201312.nc",
+        "201401_201412.nc",
+    ]
+    # All files are written with the same version
+    assert len({p.parent for p in written}) == 1
+
+    read = [
+        xr.load_dataset(p, use_cftime=True).pint.quantify(
+            unit_registry=cf_xarray.units.units
+        )
+        for p in written
+    ]
+    assert len({r.attrs["creation_date"] for r in read}) == 1
+    assert len({r.attrs["tracking_id"] for r in read}) == len(read)
+    assert all(r[CO2].dtype == np.float32 for r in read)
+
+    read_combined = xr.concat([r[CO2] for r in read], dim="time")
+    xr.testing.assert_allclose(read_combined, ds[CO2].astype(np.float32))
+    xr.testing.assert_equal(
+        xr.concat([r["time_bounds"] for r in read], dim="time"),
+        dataset.ds["time_bounds"],
+    )
+
+
+def test_write_periods_in_parallel_error(tmpdir, metadata):
+    dataset = get_input4mips_ds(get_test_dataset(range(2010, 2013 + 1)), metadata)
+
+    results = write_periods_in_parallel(
+        dataset,
+        root_data_dir=Path(tmpdir),
+        years_per_period=2,
+        max_workers=2,
+        dtype="not-a-dtype",
+    )
+
+    # Errors are reported, not raised
+    assert [r.period for r in results] == [(2010, 2011), (2012, 2013)]
+    assert all(r.path is None for r in results)
+    assert all(isinstance(r.error, TypeError) for r in results)
+
+
+def test_write_dtype(tmpdir, metadata):
+    ds = get_test_dataset(range(2010, 2015 + 1))
+
+    written_full = get_input4mips_ds(ds, metadata).write(
+        root_data_dir=Path(tmpdir) / "full", dtype=np.float32
+    )
+    written_chunked = write_along_time(
+        (
+            get_input4mips_ds(ds.isel(time=slice(start, start + 30)), metadata)
+            for start in range(0, ds.sizes["time"], 30)
+        ),
+        root_data_dir=Path(tmpdir) / "chunked",
+        dtype=np.float32,
+    )
+
+    exp = ds[CO2].data.magnitude.astype(np.float32)
+    for written in [written_full, written_chunked]:
+        read = xr.load_dataset(written, decode_times=False)
+
+        assert read[CO2].dtype == np.float32
+        np.testing.assert_equal(read[CO2].to_numpy(), exp)
+        # Bounds etc. are unaffected
+        assert read["lat_bounds"].dtype == np.float64
+
+
+def test_from_metadata_autoadd_bounds_to_dimensions_no_copy(metadata):
+    ds = get_test_dataset(range(2010, 2012 + 1))
+    ds_before = ds.copy(deep=True)
+
+    res = {copy: get_input4mips_ds(ds, metadata, copy=copy) for copy in [True, False]}
+
+    input_magnitude = ds[CO2].data.magnitude
+    assert np.shares_memory(res[False].ds[CO2].data.magnitude, input_magnitude)
+    assert not np.shares_memory(res[True].ds[CO2].data.magnitude, input_magnitude)
+
+    # The input is untouched
+    xr.testing.assert_identical(ds, ds_before)
+    assert "lat_bounds" not in ds
+    assert "bounds" not in ds["time"].attrs
+
+    # The result is the same either way
+    xr.testing.assert_identical(res[True].ds, res[False].ds)
+
+
+def test_from_metadata_autoadd_bounds_to_dimensions_shared_grid(metadata):
+    ds = get_test_dataset(range(2010, 2012 + 1), {CO2: "ppm", CH4: "ppb"})
+
+    grid = Input4MIPsGrid.from_dataset(ds, DIMENSIONS)
+
+    for variable_id in ds.data_vars:
+        res = get_input4mips_ds(ds[[variable_id]], metadata, grid=grid)
+        exp = get_input4mips_ds(ds[[variable_id]], metadata)
+
+        xr.testing.assert_identical(res.ds, exp.ds)
+        for k in exp.ds.variables:
+            assert res.ds[k].attrs == exp.ds[k].attrs
+            assert res.ds[k].encoding == exp.ds[k].encoding
+
+    # The grid is untouched
+    assert "units" not in grid.coords["time"].attrs
+    assert "variable_id" not in grid.coords.attrs
+
+
+def test_write_zarr_append_and_convert(tmpdir, metadata):
+    pytest.importorskip("zarr")
+
+    ds = get_test_dataset(range(2010, 2013 + 1))
+
+    full = get_input4mips_ds(ds, metadata)
+    creation_date = "2023-05-18T12:13:14Z"
+
+    # Chunks which don't divide the number of times, so the last chunk of
+    # each write is partial
+    zarr_path = get_input4mips_ds(ds.isel(time=slice(0, 30)), metadata).write_zarr(
+        Path(tmpdir) / "zarr",
+        time_chunk_size=7,
+        creation_date=creation_date,
+        max_workers=2,
+    )
+    assert zarr_path.suffix == ".zarr"
+    assert zarr_path.name.endswith("_201001_201206.zarr")
+
+    get_input4mips_ds(ds.isel(time=slice(30, None)), metadata).append_to_zarr(zarr_path)
+
+    stored = xr.open_zarr(zarr_path, use_cftime=True).load()
+    assert stored.attrs["creation_date"] == creation_date
+    assert stored["time"].encoding["units"] == "days since 2010-01-01"
+    exp = full.to_disk_ready(creation_date=creation_date)
+    stored.attrs["tracking_id"] = exp.attrs["tracking_id"]
+    xr.testing.assert_identical(stored.set_coords("lat_bounds"), exp)
+
+    written_zarr = convert_zarr_to_netcdf(zarr_path, Path(tmpdir) / "converted")
+    written_full = full.write(Path(tmpdir) / "full", creation_date=creation_date)
+
+    assert written_zarr.name == written_full.name
+    assert written_zarr.name.endswith("_201001_201312.nc")
+    assert not list(written_zarr.parent.glob("*.incomplete"))
+
+    read_zarr = xr.load_dataset(written_zarr, decode_times=False)
+    read_full = xr.load_dataset(written_full, decode_times=False)
+    assert read_zarr.attrs["creation_date"] == creation_date
+    assert read_zarr.attrs["tracking_id"] != stored.attrs["tracking_id"]
+
+    for attr in ["tracking_id"]:
+        read_zarr.attrs.pop(attr)
+        read_full.attrs.pop(attr)
+
+    xr.testing.assert_identical(read_zarr, read_full)
+
+
+def test_append_to_zarr_mismatch(tmpdir, metadata):
+    pytest.importorskip("zarr")
+
+    zarr_path = get_input4mips_ds(get_test_dataset([2010]), metadata).write_zarr(
+        Path(tmpdir)
+    )
+
+    to_append = get_input4mips_ds(
+        get_test_dataset([2011]).assign_coords(lat=np.arange(-80, 80 + 1, 160 / 11)),
+        metadata,
+    )
+    with pytest.raises(AssertionError, match="'lat' values do not match those in"):
+        to_append.append_to_zarr(zarr_path)
@@ -0,0 +1,97 @@
+"""
+Integration tests of gridding with file-backed gridding values
+"""
+import cf_xarray  # noqa: F401 # required to add cf accessors
+import numpy as np
+import pint_xarray
+import pytest
+import xarray as xr
+from openscm_units import unit_registry
+
+from carpet_concentrations.gridders import LatitudeSeasonalityGridder
+
+pint_xarray.accessors.default_registry = pint_xarray.setup_registry(unit_registry)
+
+RNG = np.random.default_rng()
+
+
+@pytest.fixture
+def gridding_values_file(tmp_path):
+    years = np.arange(1750, 1770)
+    lats = np.array([-67.5, -22.5, 22.5, 67.5])
+
+    seasonality = RNG.random((years.size, 12, lats.size))
+    seasonality -= seasonality.mean(axis=1, keepdims=True)
+    # Symmetric about the equator, with equal-area cells either side, so
+    # the area-weighted mean is zero
+    latitudinal_gradient = np.broadcast_to(
+        [-2.0, -1.0, 1.0, 2.0], (years.size, 12, lats.size)
+    )
+
+    ds = xr.Dataset(
+        {
+            "seasonality": (
+                ("year", "month", "lat"),
+                seasonality,
+                {"units": "ppm"},
+            ),
+            "latitudinal_gradient": (
+                ("year", "month", "lat"),
+                latitudinal_gradient,
+                {"units": "ppb"},
+            ),
+        },
+        coords={"year": years, "month": np.arange(1, 13), "lat": lats},
+    ).cf.add_bounds("lat")
+    ds["lat_bounds"].attrs["units"] = "degree"
+
+    out = tmp_path / "gridding_values.nc"
+    ds.to_netcdf(out)
+
+    return out
+
+
+def test_file_backed_gridding_values(gridding_values_file, no_dask_compute):
+    lazy = xr.open_dataset(gridding_values_file, chunks={"year": 5}).pint.quantify()
+    loaded = xr.load_dataset(gridding_values_file).pint.quantify()
+    global_means = xr.Dataset(
+        {
+            "co2": (
+                ("scenario", "year", "month"),
+                280 + RNG.random((2, lazy.sizes["year"], 12)),
+                {"units": "ppm"},
+            )
+        },
+        coords={"scenario": ["a", "b"], "year": lazy["year"], "month": lazy["month"]},
+    ).pint.quantify()
+
+    gridder = LatitudeSeasonalityGridder(lazy, validation="trusted")
+    exp = LatitudeSeasonalityGridder(loaded).calculate(global_means)
+
+    with no_dask_compute():
+        # Already validated, so no need to read the file again
+        LatitudeSeasonalityGridder(lazy, validation="trusted")
+
+        perturbation = gridder.perturbation
+        assert hasattr(perturbation.data.magnitude, "dask")
+
+        res = gridder.calculate(global_means)
+        assert hasattr(res["co2"].data.magnitude, "dask")
+
+        chunks = list(gridder.calculate_chunked(global_means, chunks={"year": 7}))
+
+    xr.testing.assert_allclose(res.compute(), exp)
+    xr.testing.assert_allclose(
+        xr.concat([c.compute() for c in chunks], dim="year").transpose(
+            *exp["co2"].dims
+        ),
+        exp,
+    )
+
+
+def test_file_backed_gridding_values_invalid(gridding_values_file):
+    lazy = xr.open_dataset(gridding_values_file, chunks={"year": 5}).pint.quantify()
+    lazy["seasonality"] = lazy["seasonality"] + unit_registry.Quantity(1, "ppm")
+
+    with pytest.raises(AssertionError, match="annual-mean of zero"):
+        LatitudeSeasonalityGridder(lazy)
@@ -0,0 +1,116 @@
+"""
+Integration tests of :mod:`carpet_concentrations.pipelines`
+"""
+from functools import partial
+from pathlib import Path
+
+import cf_xarray.units
+import numpy as np
+import pint_xarray  # noqa: F401 # required to enable pint accessors
+import xarray as xr
+
+from carpet_concentrations.gridders import LatitudeSeasonalityGridder
+from carpet_concentrations.input4MIPs.dataset import (
+    Input4MIPsDataset,
+    Input4MIPsMetadata,
+)
+from carpet_concentrations.pipelines import grid_and_write_input4mips_file
+from carpet_concentrations.time import convert_year_month_to_time
+
+RNG = np.random.default_rng()
+
+
+def test_grid_and_write_input4mips_file(tmpdir):
+    metadata = Input4MIPsMetadata(
+        contact="contact test (test@address.com)",
+        dataset_category="GHGConcentrations",
+        frequency="mon",
+        further_info_url="cmip6.science.unimelb.edu.au",
+        grid_label="gn",
+        Conventions="CF-1.6",
+        activity_id="input4MIPs",
+        institution="Climate Resource",
+        institution_id="CR",
+        mip_era="CMIP6",
+        nominal_resolution="10000 km",
+        realm="atmos",
+        source_version="1.2.1",
+        source_id="CR-1-2-1",
+        source="CR 1.2.1: Test file",
+        target_mip="ScenarioMIP",
+        title="CR 1.2.1 test dataset for testing",
+    )
+    time_encoding = {"calendar": "standard", "units": "days since 1750-01-01"}
+
+    years = np.arange(1750, 1760)
+    months = np.arange(1, 13)
+    lats = np.array([-60, 0, 60])
+
+    seasonality = np.broadcast_to(
+        [0, 1, 2, 2, 1, 0, 0, -1, -2, -2, -1, 0], (years.size, lats.size, 12)
+    ).transpose([0, 2, 1])
+    latitudinal_gradient = np.broadcast_to(
+        [-1, 0, 1], (years.size, months.size, lats.size)
+    )
+    gridding_values = (
+        xr.Dataset(
+            {
+                "seasonality": (
+                    ("year", "month", "lat"),
+                    seasonality,
+                    {"units": "ppm"},
+                ),
+                "latitudinal_gradient": (
+                    ("year", "month", "lat"),
+                    latitudinal_gradient,
+                    {"units": "ppm"},
+                ),
+            },
+            coords={"year": years, "month": months, "lat": lats},
+        )
+        .cf.add_bounds("lat")
+        .pint.quantify({"lat_bounds": "deg"}, unit_registry=cf_xarray.units.units)
+    )
+
+    data_var = "mole_fraction_of_carbon_dioxide_in_air"
+    global_means = xr.Dataset(
+        {
+            data_var: (
+                ("year", "month"),
+                280 + RNG.random(size=(years.size, months.size)),
+                {"units": "ppm"},
+            )
+        },
+        coords={"year": years, "month": months},
+    ).pint.quantify(unit_registry=cf_xarray.units.units)
+
+    gridder = LatitudeSeasonalityGridder(gridding_values)
+    year_month_to_time = partial(convert_year_month_to_time, day=15)
+
+    written = grid_and_write_input4mips_file(
+        gridder,
+        global_means,
+        metadata=metadata,
+        root_data_dir=Path(tmpdir) / "chunked",
+        time_encoding=time_encoding,
+        years_per_chunk=3,
+        year_month_to_time=year_month_to_time,
+    )
+
+    exp = year_month_to_time(gridder.calculate(global_means))
+    exp["time"].encoding = time_encoding
+    written_exp = Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
+        exp,
+        ("time", "lat"),
+        metadata=metadata,
+    ).write(root_data_dir=Path(tmpdir) / "full")
+
+    assert written.name == written_exp.name
+
+    read = xr.load_dataset(written, decode_times=False)
+    read_exp = xr.load_dataset(written_exp, decode_times=False)
+    for attr in ["creation_date", "tracking_id"]:
+        read.attrs.pop(attr)
+        read_exp.attrs.pop(attr)
+
+    xr.testing.assert_identical(read, read_exp)
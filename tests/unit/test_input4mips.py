@@ -3,17 +3,21 @@ Test :mod:`carpet_concentrations.input4mips`
 """
 import re
 
+import cf_xarray  # noqa: F401 # required to add cf accessors
 import cftime
+import numpy as np
 import pytest
 import xarray as xr
 
 from carpet_concentrations.input4MIPs.dataset import (
     Input4MIPsDataset,
+    Input4MIPsGrid,
     Input4MIPsMetadata,
     add_time_bounds,
     format_date,
     verify_disk_ready,
 )
+from carpet_concentrations.time import NonUniqueYearMonths
 
 
 # The valid inputs are derived based on a check of https://docs.google.com/document/d/1pU9IiJvPJwRvIgVaSDdJ4O0Jeorv_2ekEtted34K9cA/edit#
@@ -121,18 +125,6 @@ def test_invalid_input_input4mips_metadata(
 #   registry can be passed to e.g. quantify)
 
 
-def test_from_metadata_autoadd_bounds_to_dimensions_no_copy_raises():
-    # Would want to refactor to make testing easier here I suspect
-    # (dependency injection would help)
-    with pytest.raises(NotImplementedError, match="False"):
-        Input4MIPsDataset.from_metadata_autoadd_bounds_to_dimensions(
-            "mock",
-            "mock",
-            "mock",
-            copy=False,
-        )
-
-
 def test_from_metadata_autoadd_bounds_to_dimensions_prexexsting_attrs():
     inp = xr.Dataset(
         {
@@ -174,6 +166,114 @@ def test_from_metadata_autoadd_bounds_to_dimensions_multivar():
         )
 
 
+def get_grid_test_dataset(variable, lat=np.arange(-82.5, 82.5 + 1, 15)):
+    time = [
+        cftime.datetime(y, m, 15)
+        for y in range(2010, 2011 + 1)
+        for m in range(1, 12 + 1)
+    ]
+
+    return xr.Dataset(
+        {variable: (("time", "lat"), np.ones((len(time), len(lat))))},
+        coords={"time": time, "lat": lat},
+    )
+
+
+def test_grid_add_to():
+    dimensions = ("time", "lat")
+    ds_co2 = get_grid_test_dataset("co2")
+    ds_ch4 = get_grid_test_dataset("ch4")
+
+    grid = Input4MIPsGrid.from_dataset(ds_co2, dimensions)
+    assert set(grid.added) == {"bounds", "time_bounds", "lat_bounds"}
+
+    for ds, variable in ((ds_co2, "co2"), (ds_ch4, "ch4")):
+        res = grid.add_to(ds)
+
+        exp = add_time_bounds(
+            ds.copy().cf.guess_coord_axis(), monthly_time_bounds=True
+        ).cf.add_bounds("lat")
+        xr.testing.assert_identical(res, exp)
+        for k in exp.variables:
+            assert res[k].attrs == exp[k].attrs
+
+        # The input is untouched
+        assert "lat_bounds" not in ds
+        assert "bounds" not in ds["time"].attrs
+        assert "standard_name" not in ds["lat"].attrs
+
+
+@pytest.mark.parametrize(
+    "ds, exp_msg",
+    (
+        pytest.param(
+            get_grid_test_dataset("co2", lat=np.arange(-80, 80 + 1, 20)),
+            "Values of 'lat' don't match the grid",
+            id="different-values",
+        ),
+        pytest.param(
+            get_grid_test_dataset("co2").assign_coords(scenario="ssp119"),
+            re.escape(
+                "Co-ordinates don't match the grid. "
+                "Co-ordinates of ds: ['lat', 'scenario', 'time']. "
+                "Co-ordinates of the grid: ['lat', 'time']"
+            ),
+            id="extra-coordinate",
+        ),
+        pytest.param(
+            add_time_bounds(get_grid_test_dataset("co2"), monthly_time_bounds=True),
+            "Co-ordinates don't match the grid",
+            id="bounds-already-present",
+        ),
+    ),
+)
+def test_grid_add_to_mismatch(ds, exp_msg):
+    grid = Input4MIPsGrid.from_dataset(get_grid_test_dataset("co2"), ("time", "lat"))
+
+    with pytest.raises(ValueError, match=exp_msg):
+        grid.add_to(ds)
+
+
+def test_split_by_period():
+    ds = get_grid_test_dataset("co2")
+    time = [
+        cftime.datetime(y, m, 15) for y in range(1748, 1802 + 1) for m in range(1, 13)
+    ]
+    ds = xr.Dataset(
+        {"co2": (("time",), np.arange(len(time), dtype=float))},
+        coords={"time": time},
+    )
+    dataset = Input4MIPsDataset(ds, filename_template="{variable_id}.nc")
+
+    res = dataset.split_by_period(25)
+
+    assert [
+        (p.ds["time"].dt.year.values[0], p.ds["time"].dt.year.values[-1]) for p in res
+    ] == [(1748, 1749), (1750, 1774), (1775, 1799), (1800, 1802)]
+    for period in res:
+        assert period.filename_template == "{variable_id}.nc"
+        # Slices, not copies
+        assert np.shares_memory(period.ds["co2"].values, ds["co2"].values)
+
+    xr.testing.assert_identical(xr.concat([p.ds for p in res], dim="time"), ds)
+
+
+@pytest.mark.parametrize(
+    "years_per_period, reverse, exp_msg",
+    (
+        (0, False, "years_per_period must be at least one, received: 0"),
+        (10, True, "'time' must be sorted"),
+    ),
+)
+def test_split_by_period_errors(years_per_period, reverse, exp_msg):
+    ds = get_grid_test_dataset("co2")
+    if reverse:
+        ds = ds.isel(time=slice(None, None, -1))
+
+    with pytest.raises(ValueError, match=exp_msg):
+        Input4MIPsDataset(ds).split_by_period(years_per_period)
+
+
 @pytest.mark.parametrize(
     "date, freq, exp",
     (
@@ -297,3 +397,78 @@ def test_verify_no_time_encoding():
         match="Not specifying a time encoding will cause all sorts of headaches",
     ):
         verify_disk_ready(inp)
+
+
+@pytest.mark.parametrize("calendar", ("standard", "noleap", "360_day"))
+def test_add_time_bounds_monthly(calendar):
+    time = [
+        cftime.datetime(y, m, 15, calendar=calendar)
+        for y in range(1849, 1851 + 1)
+        for m in range(1, 12 + 1)
+    ]
+    inp = xr.Dataset(
+        {"var": (("time",), np.arange(len(time)))},
+        coords={"time": time},
+    )
+
+    res = add_time_bounds(inp, monthly_time_bounds=True)
+
+    exp = np.array(
+        [
+            [
+                cftime.datetime(t.year, t.month, 1, calendar=calendar),
+                cftime.datetime(
+                    t.year + t.month // 12, t.month % 12 + 1, 1, calendar=calendar
+                ),
+            ]
+            for t in time
+        ]
+    )
+
+    assert res["time"].attrs["bounds"] == "time_bounds"
+    assert res["time_bounds"].dims == ("time", "bounds")
+    np.testing.assert_equal(res["time_bounds"].values, exp)
+
+
+@pytest.mark.parametrize(
+    "calendar, exp_february_days",
+    (
+        ("standard", 29),
+        ("noleap", 28),
+        ("360_day", 30),
+    ),
+)
+def test_add_time_bounds_monthly_encoded(calendar, exp_february_days, tmp_path):
+    time = [cftime.datetime(2012, m, 15, calendar=calendar) for m in range(1, 13)]
+    inp = xr.Dataset(
+        {"var": (("time",), np.arange(len(time)))},
+        coords={"time": time},
+    )
+
+    res = add_time_bounds(inp, monthly_time_bounds=True)
+    res["time"].encoding = {"calendar": calendar, "units": "days since 2012-01-01"}
+
+    res.to_netcdf(tmp_path / "out.nc")
+    read = xr.load_dataset(tmp_path / "out.nc", decode_times=False)
+    lengths = np.diff(read["time_bounds"].values).squeeze()
+
+    # Bounds are in the time axis' calendar, so the length of February
+    # follows the calendar
+    assert lengths[1] == exp_february_days
+    assert lengths.sum() == {"standard": 366, "noleap": 365, "360_day": 360}[calendar]
+
+
+def test_add_time_bounds_monthly_not_unique():
+    inp = xr.Dataset(
+        {"var": (("time",), [1, 2, 3])},
+        coords={
+            "time": [
+                cftime.datetime(2010, 1, 1),
+                cftime.datetime(2010, 1, 15),
+                cftime.datetime(2010, 2, 1),
+            ]
+        },
+    )
+
+    with pytest.raises(NonUniqueYearMonths):
+        add_time_bounds(inp, monthly_time_bounds=True)
@@ -2,6 +2,7 @@
 Test :class:`carpet_concentrations.gridders.LatitudeSeasonalityGridder`
 """
 import re
+from unittest.mock import patch
 
 import cf_xarray  # noqa: F401 # required to add cf accessors
 import numpy as np
@@ -16,7 +17,17 @@ from carpet_concentrations.exceptions import (
     DatasetIncompatibleUnitsError,
     NotPintQuantifiedError,
 )
-from carpet_concentrations.gridders import LatitudeSeasonalityGridder
+from carpet_concentrations.gridders import (
+    LatitudeSeasonalityGridder,
+    LazyGriddedResult,
+)
+from carpet_concentrations.gridders.latitude_seasonality_gridder import (
+    VALIDATED_FINGERPRINTS,
+    ValidatedFingerprintCache,
+)
+from carpet_concentrations.xarray_utils import (
+    calculate_weighted_area_mean_latitude_only,
+)
 
 pint_xarray.accessors.default_registry = pint_xarray.setup_registry(unit_registry)
 
@@ -428,3 +439,629 @@ def test_incompatible_units(valid_input, valid_global_means):
     )
     with pytest.raises(pint.errors.DimensionalityError, match=error_msg):
         LatitudeSeasonalityGridder(valid_input).calculate(global_means)
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    (
+        pytest.param({"year": 1}, id="year"),
+        pytest.param({"scenario": 2}, id="scenario"),
+        pytest.param({"year": 1, "scenario": 2}, id="year-scenario"),
+        pytest.param({"year": 10}, id="chunk-bigger-than-dim"),
+    ),
+)
+def test_calculate_chunked(chunks, valid_input, valid_global_means):
+    scenarios = xr.DataArray(
+        [1, 0.8, 2],
+        coords={"scenario": ["ssp126", "ssp245", "ssp370"]},
+        attrs={"units": "dimensionless"},
+    ).pint.quantify()
+
+    global_means = valid_global_means * scenarios
+    gridder = LatitudeSeasonalityGridder(valid_input)
+
+    exp = gridder.calculate(global_means)
+
+    res_chunks = list(gridder.calculate_chunked(global_means, chunks=chunks))
+    res = xr.combine_by_coords(res_chunks)
+
+    exp_n_chunks = np.prod(
+        [np.ceil(global_means.sizes[k] / v) for k, v in chunks.items()]
+    )
+    assert len(res_chunks) == exp_n_chunks
+    xr.testing.assert_equal(res.transpose(*exp.dims), exp)
+
+
+def test_calculate_chunked_missing_chunk_dim(valid_input, valid_global_means):
+    error_msg = re.escape(
+        "Expected dimensions: `('year', 'month', 'scenario')`. These are not a "
+        "subset of the found dimensions: `('year', 'month')`"
+    )
+    with pytest.raises(CoordinateError, match=error_msg):
+        LatitudeSeasonalityGridder(valid_input).calculate_chunked(
+            valid_global_means, chunks={"scenario": 1}
+        )
+
+
+def test_calculate_chunked_invalid_chunk_size(valid_input, valid_global_means):
+    with pytest.raises(ValueError, match="Chunk sizes must be at least one"):
+        # Raised by the call, not on the first iteration
+        LatitudeSeasonalityGridder(valid_input).calculate_chunked(
+            valid_global_means, chunks={"year": 0}
+        )
+
+
+def test_validation_invalid_level(valid_input):
+    with pytest.raises(ValueError, match="'validation' must be in"):
+        LatitudeSeasonalityGridder(valid_input, validation="none")
+
+
+def test_validation_sampled(valid_input):
+    inp = valid_input.copy()
+    # Only break the last year
+    inp["seasonality"] = inp["seasonality"] + xr.DataArray(
+        [0, 1], dims="year", coords={"year": inp["year"]}
+    ) * unit_registry.Quantity(1, "ppm")
+
+    # Only the first year is sampled so the problem isn't found
+    LatitudeSeasonalityGridder(inp, validation="sampled", n_validation_samples=1)
+
+    error_msg = re.escape("seasonality must have an annual-mean of zero in all years")
+    with pytest.raises(AssertionError, match=error_msg):
+        LatitudeSeasonalityGridder(inp, validation="sampled", n_validation_samples=2)
+
+
+@pytest.fixture
+def clear_validated_fingerprints():
+    VALIDATED_FINGERPRINTS.clear()
+    yield
+    VALIDATED_FINGERPRINTS.clear()
+
+
+@pytest.mark.usefixtures("clear_validated_fingerprints")
+def test_validation_trusted(valid_input):
+    inp = valid_input.copy()
+
+    gridder_module = "carpet_concentrations.gridders.latitude_seasonality_gridder"
+    with patch(
+        f"{gridder_module}._seasonality_annual_mean_zero",
+    ) as mock_check:
+        # Not validated before so the checks are run
+        LatitudeSeasonalityGridder(inp, validation="trusted")
+        mock_check.assert_called_once()
+
+        mock_check.reset_mock()
+        # Same values as have already passed validation so the checks are skipped
+        LatitudeSeasonalityGridder(inp.copy(deep=True), validation="trusted")
+        mock_check.assert_not_called()
+
+        # Full validation always runs the checks
+        LatitudeSeasonalityGridder(inp, validation="full")
+        mock_check.assert_called_once()
+
+        mock_check.reset_mock()
+        # Other variables don't affect whether the values are trusted
+        inp["other"] = inp["seasonality"] * 3.0
+        LatitudeSeasonalityGridder(inp, validation="trusted")
+        mock_check.assert_not_called()
+
+        VALIDATED_FINGERPRINTS.clear()
+        # After clearing, the checks are run again
+        LatitudeSeasonalityGridder(inp, validation="trusted")
+        mock_check.assert_called_once()
+
+
+@pytest.mark.usefixtures("clear_validated_fingerprints")
+def test_validation_full_not_recorded(valid_input):
+    LatitudeSeasonalityGridder(valid_input, validation="full")
+
+    assert not len(VALIDATED_FINGERPRINTS)
+
+
+@pytest.mark.usefixtures("clear_validated_fingerprints")
+def test_validation_trusted_different_variables(valid_input):
+    inp = valid_input.copy()
+    inp["bad_seasonality"] = inp["seasonality"] + unit_registry.Quantity(5, "ppm")
+
+    LatitudeSeasonalityGridder(inp, validation="trusted")
+
+    # The same dataset, but checks of a different variable, so the values
+    # aren't trusted
+    error_msg = re.escape("seasonality must have an annual-mean of zero in all years")
+    with pytest.raises(AssertionError, match=error_msg):
+        LatitudeSeasonalityGridder(
+            inp, seasonality_name="bad_seasonality", validation="trusted"
+        )
+
+
+def test_validated_fingerprint_cache_max_size():
+    cache = ValidatedFingerprintCache(max_size=2)
+
+    cache.add("a")
+    cache.add("b")
+    # Mark "a" as most recently used
+    assert "a" in cache
+    cache.add("c")
+
+    assert len(cache) == 2
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+
+    cache.clear()
+    assert not len(cache)
+
+
+@pytest.mark.usefixtures("clear_validated_fingerprints")
+def test_validation_trusted_invalid_not_trusted(valid_input):
+    inp = valid_input.copy()
+    inp["latitudinal_gradient"] += unit_registry.Quantity(1, "ppm")
+
+    error_msg = re.escape(
+        "latitudinal gradient must have an area-weighted spatial-mean of "
+        "zero in all timesteps"
+    )
+    for _ in range(2):
+        # Invalid values are never recorded as validated
+        with pytest.raises(AssertionError, match=error_msg):
+            LatitudeSeasonalityGridder(inp, validation="trusted")
+
+
+def test_perturbation(valid_input):
+    inp = valid_input.copy()
+    inp["latitudinal_gradient"] = inp["latitudinal_gradient"].pint.to("ppb")
+    gridder = LatitudeSeasonalityGridder(inp)
+
+    res = gridder.perturbation
+
+    assert res.dims == ("year", "month", "lat")
+    assert res.data.magnitude.flags.c_contiguous
+    assert str(res.data.units) == "ppm"
+    xr.testing.assert_allclose(
+        res,
+        (inp["seasonality"] + inp["latitudinal_gradient"])
+        .transpose(*res.dims)
+        .rename(None),
+    )
+
+    # Cached
+    assert gridder.perturbation is res
+
+    # Cache invalidated if the gridding values are replaced
+    gridder.gridding_values = inp.copy()
+    assert gridder.perturbation is not res
+    xr.testing.assert_identical(gridder.perturbation, res)
+
+
+def test_calculate_custom_variable_names(valid_input, valid_global_means):
+    exp = LatitudeSeasonalityGridder(valid_input).calculate(valid_global_means)
+
+    res = LatitudeSeasonalityGridder(
+        valid_input.rename({"seasonality": "seas", "latitudinal_gradient": "lat_grad"}),
+        seasonality_name="seas",
+        latitudinal_gradient_name="lat_grad",
+    ).calculate(valid_global_means)
+
+    xr.testing.assert_equal(res, exp)
+
+
+@pytest.mark.parametrize(
+    "global_means_units",
+    (
+        pytest.param("ppm", id="same-units"),
+        pytest.param("ppb", id="unit-conversion"),
+    ),
+)
+@pytest.mark.parametrize(
+    "sel",
+    (
+        pytest.param({}, id="all-timepoints"),
+        pytest.param({"month": [1, 3, 6, 12]}, id="missing-timepoints"),
+    ),
+)
+def test_calculate_strip_units(
+    global_means_units, sel, valid_input, valid_global_means
+):
+    global_means = (
+        xr.concat(
+            [valid_global_means, valid_global_means * 2],
+            dim=xr.DataArray(["a", "b"], dims="scenario", name="scenario"),
+        )
+        .pint.to(global_means_units)
+        .sel(sel)
+    )
+    global_means["Atmospheric Concentrations|CH4"] = global_means[
+        "Atmospheric Concentrations|CO2"
+    ].pint.to("ppt")
+
+    gridder = LatitudeSeasonalityGridder(valid_input)
+
+    res = gridder.calculate(global_means, strip_units=True)
+    exp = gridder.calculate(global_means)
+
+    xr.testing.assert_identical(res, exp)
+    for name, darray in res.data_vars.items():
+        assert darray.data.units == global_means[name].data.units
+
+
+def test_calculate_strip_units_coord_with_units(valid_input, valid_global_means):
+    # Coordinates' units attributes are left as they are, not parsed
+    global_means = valid_global_means.assign_coords(
+        year_mid=("year", valid_global_means["year"].data + 0.5, {"units": "yr"})
+    )
+    gridder = LatitudeSeasonalityGridder(valid_input)
+
+    res = gridder.calculate(global_means, strip_units=True)
+    exp = gridder.calculate(global_means)
+
+    xr.testing.assert_identical(res, exp)
+    assert res["year_mid"].attrs == {"units": "yr"}
+    assert isinstance(res["year_mid"].data, np.ndarray)
+
+
+def test_incompatible_units_strip_units(valid_input, valid_global_means):
+    global_means = valid_global_means.pint.to("ppm").pint.dequantify()
+    for k in global_means.data_vars:
+        global_means[k].attrs["units"] = "kg"
+
+    global_means = global_means.pint.quantify()
+
+    error_msg = re.escape(
+        "Cannot convert from 'ppm' ([concentrations]) to 'kilogram' ([mass])"
+    )
+    with pytest.raises(pint.errors.DimensionalityError, match=error_msg):
+        LatitudeSeasonalityGridder(valid_input).calculate(
+            global_means, strip_units=True
+        )
+
+
+@pytest.mark.parametrize("strip_units", (False, True))
+def test_calculate_dtype(strip_units, valid_input, valid_global_means):
+    global_means = valid_global_means.pint.to("ppb")
+    gridder = LatitudeSeasonalityGridder(valid_input)
+
+    res = gridder.calculate(global_means, strip_units=strip_units, dtype=np.float32)
+    exp = gridder.calculate(global_means, strip_units=strip_units)
+
+    for name, darray in res.data_vars.items():
+        assert darray.data.magnitude.dtype == np.float32
+        assert darray.data.units == global_means[name].data.units
+
+    xr.testing.assert_allclose(res, exp.astype(np.float32))
+
+
+@pytest.fixture
+def multi_scenario_global_means(valid_global_means):
+    return xr.concat(
+        [valid_global_means, valid_global_means * 2],
+        dim=xr.DataArray(["a", "b"], dims="scenario", name="scenario"),
+    ).pint.to("ppb")
+
+
+def assert_allclose_any_dim_order(res, exp):
+    assert set(res.data_vars) == set(exp.data_vars)
+    for name, darray in res.data_vars.items():
+        xr.testing.assert_allclose(darray, exp[name].transpose(*darray.dims))
+
+
+@pytest.mark.parametrize("dtype", (None, np.float32))
+def test_calculate_lazy_compute(dtype, valid_input, multi_scenario_global_means):
+    gridder = LatitudeSeasonalityGridder(valid_input)
+
+    res = gridder.calculate_lazy(multi_scenario_global_means, dtype=dtype)
+
+    assert isinstance(res, LazyGriddedResult)
+    assert set(res.dims) == {"scenario", "year", "month", "lat"}
+    xr.testing.assert_identical(
+        res.compute(), gridder.calculate(multi_scenario_global_means, dtype=dtype)
+    )
+
+
+@pytest.mark.parametrize(
+    "method, indexers",
+    (
+        ("isel", {"lat": slice(1, None)}),
+        ("isel", {"lat": 0, "scenario": 1}),
+        ("sel", {"scenario": "a", "year": [1751]}),
+        ("sel", {"lat": [-60, 60], "month": 6}),
+    ),
+)
+def test_lazy_result_selection(
+    method, indexers, valid_input, multi_scenario_global_means
+):
+    gridder = LatitudeSeasonalityGridder(valid_input)
+    exp = getattr(gridder.calculate(multi_scenario_global_means), method)(indexers)
+
+    res = getattr(gridder.calculate_lazy(multi_scenario_global_means), method)(
+        **indexers
+    ).compute()
+
+    assert_allclose_any_dim_order(res, exp)
+
+
+def test_lazy_result_selection_missing_dim(valid_input, valid_global_means):
+    res = LatitudeSeasonalityGridder(valid_input).calculate_lazy(valid_global_means)
+
+    with pytest.raises(ValueError, match=re.escape("Dimensions ['scenario']")):
+        res.isel(scenario=0)
+
+
+def test_lazy_result_reductions(valid_input, multi_scenario_global_means):
+    gridder = LatitudeSeasonalityGridder(valid_input)
+    eager = gridder.calculate(multi_scenario_global_means)
+    lazy = gridder.calculate_lazy(multi_scenario_global_means)
+    variables = list(multi_scenario_global_means.data_vars)
+
+    def area_mean(ds):
+        return calculate_weighted_area_mean_latitude_only(
+            ds.assign_coords(lat_bounds=valid_input["lat_bounds"]),
+            variables,
+            keep_other_variables=False,
+        )
+
+    res = lazy.area_mean()
+    assert_allclose_any_dim_order(res, area_mean(eager))
+
+    res = lazy.annual_mean().compute()
+    assert_allclose_any_dim_order(res, eager.mean("month"))
+
+    res = lazy.sel(scenario="b", lat=[0, 60]).annual_mean().area_mean()
+    exp = area_mean(eager.sel(scenario="b", lat=[0, 60]).mean("month"))
+    assert_allclose_any_dim_order(res, exp)
+
+
+@pytest.mark.parametrize(
+    "reduce",
+    (
+        pytest.param(lambda r: r.mean("lat"), id="mean-lat"),
+        pytest.param(lambda r: r.isel(lat=0), id="isel-scalar-lat"),
+        pytest.param(lambda r: r.sel(lat=60), id="sel-scalar-lat"),
+    ),
+)
+def test_lazy_result_area_mean_no_lat(reduce, valid_input, valid_global_means):
+    lazy = LatitudeSeasonalityGridder(valid_input).calculate_lazy(valid_global_means)
+
+    res = reduce(lazy)
+
+    with pytest.raises(ValueError, match="gridded values have no latitude dimension"):
+        res.area_mean()
+
+    # The values themselves are still fine
+    res.compute()
+
+
+def test_lazy_result_area_mean_no_lat_bounds(valid_input, valid_global_means):
+    gridder = LatitudeSeasonalityGridder(valid_input)
+    lazy = LazyGriddedResult(
+        global_means=valid_global_means, perturbation=gridder.perturbation
+    )
+
+    with pytest.raises(ValueError, match="without latitude bounds"):
+        lazy.area_mean()
+
+    xr.testing.assert_identical(lazy.compute(), gridder.calculate(valid_global_means))
+
+
+def test_calculate_reductions_invariants(valid_input, multi_scenario_global_means):
+    inp = valid_input.copy()
+    inp["latitudinal_gradient"] = inp["latitudinal_gradient"].pint.to("ppb")
+    gridder = LatitudeSeasonalityGridder(inp)
+    eager = gridder.calculate(multi_scenario_global_means)
+    variables = list(multi_scenario_global_means.data_vars)
+
+    def area_mean(ds):
+        return calculate_weighted_area_mean_latitude_only(
+            ds.assign_coords(lat_bounds=inp["lat_bounds"]),
+            variables,
+            keep_other_variables=False,
+        )
+
+    res = gridder.calculate_area_mean(multi_scenario_global_means)
+    assert_allclose_any_dim_order(res, area_mean(eager))
+    # The seasonality doesn't average out within each month
+    assert not np.allclose(
+        res[variables[0]].data.magnitude,
+        multi_scenario_global_means[variables[0]].data.magnitude,
+    )
+
+    res = gridder.calculate_annual_mean(multi_scenario_global_means)
+    assert_allclose_any_dim_order(res, eager.mean("month"))
+
+    res = gridder.calculate_annual_area_mean(multi_scenario_global_means)
+    assert_allclose_any_dim_order(res, area_mean(eager.mean("month")))
+    for name, darray in res.data_vars.items():
+        assert darray.data.units == multi_scenario_global_means[name].data.units
+
+
+@pytest.mark.parametrize(
+    "method",
+    ("calculate_area_mean", "calculate_annual_mean", "calculate_annual_area_mean"),
+)
+def test_calculate_reductions_errors(method, valid_input, valid_global_means):
+    gridder = LatitudeSeasonalityGridder(valid_input)
+
+    with pytest.raises(NotPintQuantifiedError):
+        getattr(gridder, method)(valid_global_means.pint.dequantify())
+
+    with pytest.raises(CoordinateError):
+        getattr(gridder, method)(valid_global_means.mean("month"))
+
+
+@pytest.fixture
+def gas_gridding_values(valid_input):
+    ch4 = valid_input.copy()
+    ch4["seasonality"] = (ch4["seasonality"] * 3).pint.to("ppb")
+    ch4["latitudinal_gradient"] = ch4["latitudinal_gradient"] * 5
+
+    return {"co2": valid_input, "ch4": ch4}
+
+
+@pytest.fixture
+def gas_global_means(multi_scenario_global_means):
+    co2 = multi_scenario_global_means["Atmospheric Concentrations|CO2"]
+
+    return xr.Dataset({"co2": co2.pint.to("ppm"), "ch4": (co2 * 0.005).pint.to("ppb")})
+
+
+@pytest.mark.parametrize("dtype", (None, np.float32))
+def test_calculate_gases(dtype, gas_gridding_values, gas_global_means):
+    gridder = LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+    assert gridder.perturbation.dims == ("year", "month", "lat", "gas")
+
+    res = gridder.calculate_gases(gas_global_means, dtype=dtype)
+
+    for gas, gridding_values in gas_gridding_values.items():
+        exp = LatitudeSeasonalityGridder(gridding_values).calculate(
+            gas_global_means[[gas]], dtype=dtype
+        )[gas]
+
+        assert res[gas].data.units == gas_global_means[gas].data.units
+        if dtype is not None:
+            assert res[gas].data.magnitude.dtype == dtype
+        xr.testing.assert_allclose(res[gas], exp)
+
+
+@pytest.mark.parametrize("dtype", (None, np.float32))
+def test_calculate_gases_data_array(dtype, gas_gridding_values, gas_global_means):
+    gridder = LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+    stacked = (
+        gas_global_means.pint.to("ppb")
+        .pint.dequantify()
+        .to_array("gas")
+        .assign_attrs(units="ppb")
+        .pint.quantify()
+    )
+
+    res = gridder.calculate_gases(stacked, dtype=dtype)
+
+    assert res.dims[0] == "gas"
+    assert res.data.units == stacked.data.units
+    if dtype is not None:
+        assert res.data.magnitude.dtype == dtype
+    xr.testing.assert_allclose(
+        res,
+        gridder.calculate_gases(gas_global_means.pint.to("ppb"), dtype=dtype)
+        .to_array("gas")
+        .transpose(*res.dims),
+    )
+
+
+def test_calculate_gases_data_array_errors(gas_gridding_values, gas_global_means):
+    gridder = LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+    with pytest.raises(CoordinateError):
+        gridder.calculate_gases(gas_global_means["co2"])
+
+    with pytest.raises(NotPintQuantifiedError):
+        gridder.calculate_gases(
+            gas_global_means.pint.dequantify().to_array("gas"),
+        )
+
+
+def test_lat_bounds_name(valid_input, multi_scenario_global_means):
+    gridder = LatitudeSeasonalityGridder(valid_input)
+    renamed = LatitudeSeasonalityGridder(
+        valid_input.rename({"lat_bounds": "latitude_bounds"}),
+        lat_bounds_name="latitude_bounds",
+    )
+
+    xr.testing.assert_identical(
+        renamed.calculate(multi_scenario_global_means),
+        gridder.calculate(multi_scenario_global_means),
+    )
+    xr.testing.assert_identical(
+        renamed.calculate_lazy(multi_scenario_global_means).area_mean(),
+        gridder.calculate_lazy(multi_scenario_global_means).area_mean(),
+    )
+    xr.testing.assert_identical(
+        renamed.calculate_area_mean(multi_scenario_global_means),
+        gridder.calculate_area_mean(multi_scenario_global_means),
+    )
+
+
+def test_from_gases_lat_bounds_name(gas_gridding_values, gas_global_means):
+    gridder = LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+    renamed = LatitudeSeasonalityGridder.from_gases(
+        {
+            gas: gridding_values.rename({"lat_bounds": "latitude_bounds"})
+            for gas, gridding_values in gas_gridding_values.items()
+        },
+        lat_bounds_name="latitude_bounds",
+    )
+
+    assert renamed.lat_bounds_name == "latitude_bounds"
+    xr.testing.assert_identical(
+        renamed.calculate_gases(gas_global_means),
+        gridder.calculate_gases(gas_global_means),
+    )
+
+
+def test_from_gases_validates(gas_gridding_values):
+    gas_gridding_values["ch4"]["seasonality"] = gas_gridding_values["ch4"][
+        "seasonality"
+    ] + unit_registry.Quantity(1, "ppb")
+
+    with pytest.raises(AssertionError, match="annual-mean of zero"):
+        LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+
+def test_from_gases_validates_low_concentration(valid_input, gas_gridding_values):
+    sf6 = valid_input.copy()
+    sf6["seasonality"] = (sf6["seasonality"] * 1e-6).pint.to("ppt")
+    sf6["latitudinal_gradient"] = (sf6["latitudinal_gradient"] * 1e-6).pint.to("ppt")
+    gas_gridding_values["sf6"] = sf6
+
+    LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+    # Once converted to ppm (the units of the first gas), this offset is
+    # tiny in absolute terms. It is still large relative to the values of
+    # SF6 so must be caught.
+    sf6["seasonality"] = sf6["seasonality"] + unit_registry.Quantity(0.005, "ppt")
+    with pytest.raises(AssertionError, match="annual-mean of zero"):
+        LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+
+def test_from_gases_different_grids(gas_gridding_values):
+    gas_gridding_values["ch4"] = gas_gridding_values["ch4"].assign_coords(
+        lat=[-50, 0, 50]
+    )
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "The 'lat_bounds' of these gases differ from those of 'co2': ['ch4']"
+        ),
+    ):
+        LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+
+def test_from_gases_different_lat_bounds(gas_gridding_values):
+    gas_gridding_values["ch4"] = gas_gridding_values["ch4"].assign_coords(
+        lat_bounds=gas_gridding_values["ch4"]["lat_bounds"] * 0.5
+    )
+
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            "The 'lat_bounds' of these gases differ from those of 'co2': ['ch4']"
+        ),
+    ):
+        LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+
+
+def test_from_gases_empty():
+    with pytest.raises(ValueError, match="No gridding values supplied"):
+        LatitudeSeasonalityGridder.from_gases({})
+
+
+def test_calculate_gases_errors(valid_input, gas_gridding_values, gas_global_means):
+    with pytest.raises(CoordinateError):
+        LatitudeSeasonalityGridder(valid_input).calculate_gases(gas_global_means)
+
+    gridder = LatitudeSeasonalityGridder.from_gases(gas_gridding_values)
+    gas_global_means["n2o"] = gas_global_means["ch4"]
+    with pytest.raises(
+        ValueError, match=re.escape("No gridding values for these gases: ['n2o']")
+    ):
+        gridder.calculate_gases(gas_global_means)
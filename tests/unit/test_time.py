@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 
 import cftime
 import numpy as np
+import pint_xarray  # noqa: F401 # required to enable pint accessors
 import pytest
 import xarray as xr
 import xarray.testing as xrt
@@ -13,9 +14,18 @@ import xarray.testing as xrt
 from carpet_concentrations.testing import get_call_kwargs
 from carpet_concentrations.time import (
     NonUniqueYearMonths,
+    VectorisedCftimeConverter,
+    YearMonthCftimeConverter,
+    check_year_month_codes_unique,
     convert_time_to_year_month,
     convert_to_time,
+    convert_year_month_codes_to_datetimes,
     convert_year_month_to_time,
+    get_mean_preserving_interpolation_operator,
+    get_year_month_codes,
+    interpolate_annual_mean_to_monthly,
+    interpolate_annual_mean_to_monthly_values,
+    split_time_to_year_month,
 )
 
 RNG = np.random.default_rng()
@@ -64,13 +74,11 @@ def test_roundtrip_from_time():
     "extra_kwargs, extra_kwargs_exp",
     ((None, {}), ({"calendar": "julian"}, {"calendar": "julian"})),
 )
-@patch("carpet_concentrations.time.partial")
 @patch("carpet_concentrations.time.convert_to_time")
-def test_convert_year_month_to_time(  # noqa: PLR0913
-    mock_convert_to_time, mock_partial, day, day_exp, extra_kwargs, extra_kwargs_exp
+def test_convert_year_month_to_time(
+    mock_convert_to_time, day, day_exp, extra_kwargs, extra_kwargs_exp
 ):
     inp = Mock()
-    mock_partial.return_value = "partial func"
 
     call_kwargs = get_call_kwargs(
         (("day", day),),
@@ -79,15 +87,41 @@ def test_convert_year_month_to_time(  # noqa: PLR0913
 
     convert_year_month_to_time(inp, **call_kwargs)
 
-    mock_partial.assert_called_once_with(
-        cftime.datetime, day=day_exp, **extra_kwargs_exp
-    )
     mock_convert_to_time.assert_called_once_with(
         inp,
         time_coords=("year", "month"),
-        cftime_converter=mock_partial.return_value,
+        cftime_converter=YearMonthCftimeConverter(
+            day=day_exp, cftime_kwargs=extra_kwargs_exp
+        ),
+    )
+
+
+@pytest.mark.parametrize("day", (1, 15))
+@pytest.mark.parametrize("cftime_kwargs", ({}, {"calendar": "360_day"}))
+def test_convert_year_month_to_time_vectorised_matches_loop(day, cftime_kwargs):
+    inp = xr.Dataset(
+        {"co2": (["lat", "year", "month"], RNG.random(size=(3, 5, 12)))},
+        coords={
+            "lat": [-60, 0, 60],
+            "year": range(1848, 1853),
+            "month": range(1, 12 + 1),
+        },
+    )
+
+    converter = YearMonthCftimeConverter(day=day, cftime_kwargs=cftime_kwargs)
+    assert isinstance(converter, VectorisedCftimeConverter)
+
+    res = convert_year_month_to_time(inp, day=day, **cftime_kwargs)
+    # Plain callables use the loop
+    res_loop = convert_to_time(
+        inp,
+        time_coords=("year", "month"),
+        cftime_converter=lambda y, m: converter(y, m),
     )
 
+    xrt.assert_identical(res, res_loop)
+    assert res["time"].values[0] == cftime.datetime(1848, 1, day, **cftime_kwargs)
+
 
 @pytest.mark.parametrize(
     ", ".join(
@@ -212,3 +246,294 @@ def test_convert_time_to_year_month_not_unique():
     )
     with pytest.raises(NonUniqueYearMonths, match=error_msg):
         convert_time_to_year_month(inp)
+
+
+@pytest.mark.parametrize("day", (1, 15))
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"calendar": "noleap"},
+        {"calendar": "julian", "has_year_zero": True},
+    ),
+)
+def test_convert_year_month_codes_to_datetimes(day, kwargs):
+    years = np.repeat(np.arange(1, 2101, 3), 12)
+    months = np.tile(np.arange(1, 13), years.size // 12)
+
+    codes = get_year_month_codes(years, months)
+    # Arbitrary shape is fine
+    codes = np.stack([codes[::-1], codes + 1], axis=-1)
+
+    res = convert_year_month_codes_to_datetimes(codes, day=day, **kwargs)
+
+    exp = np.array(
+        [
+            [cftime.datetime(c // 12, c % 12 + 1, day, **kwargs) for c in codes_row]
+            for codes_row in codes
+        ]
+    )
+
+    assert res.shape == codes.shape
+    np.testing.assert_equal(res, exp)
+    assert all(v.calendar == exp[0, 0].calendar for v in res.flat)
+
+
+def test_convert_year_month_codes_to_datetimes_empty():
+    res = convert_year_month_codes_to_datetimes(np.array([], dtype=int))
+
+    assert res.shape == (0,)
+
+
+def test_convert_year_month_codes_to_datetimes_result_independent():
+    codes = get_year_month_codes([2010, 2011], [1, 1])
+
+    res = convert_year_month_codes_to_datetimes(codes)
+    res[0] = "junk"
+
+    # Modifying the output doesn't affect later calls
+    res_again = convert_year_month_codes_to_datetimes(codes)
+    assert res_again[0] == cftime.datetime(2010, 1, 1)
+
+
+def test_check_year_month_codes_unique():
+    codes = get_year_month_codes([2010, 2010, 2010, 2011], [1, 2, 2, 1])
+
+    error_msg = re.escape(
+        "Your year-month axis is not unique. Year-month values with a "
+        "count > 1: [((2010, 2), 2)]"
+    )
+    with pytest.raises(NonUniqueYearMonths, match=error_msg):
+        check_year_month_codes_unique(codes)
+
+
+@pytest.mark.parametrize(
+    "years, months",
+    (
+        pytest.param(range(2010, 2013), range(1, 12 + 1), id="complete"),
+        pytest.param(range(2010, 2013), range(1, 11 + 1), id="missing-december"),
+        pytest.param(range(2010, 2011), range(2, 12 + 1), id="starts-in-february"),
+    ),
+)
+def test_convert_time_to_year_month_same_as_unstack(years, months):
+    time_axis = [cftime.datetime(y, m, 15) for y in years for m in months]
+
+    inp = xr.Dataset(
+        {
+            "co2": (
+                ["time", "lat", "scenario"],
+                RNG.random(size=(len(time_axis), 3, 2)),
+                {"units": "ppm"},
+            ),
+            "lat_only": (["lat"], RNG.random(size=3)),
+        },
+        coords={
+            "lat": [-60, 0, 60],
+            "scenario": ["a", "b"],
+            "time": time_axis,
+            "time_aux": ("time", np.arange(len(time_axis))),
+        },
+        attrs={"source": "test"},
+    ).pint.quantify()
+
+    res = convert_time_to_year_month(inp)
+    exp = split_time_to_year_month(inp).unstack("time")
+
+    xrt.assert_identical(res, exp)
+    for k in exp.variables:
+        assert res[k].dims == exp[k].dims
+
+
+@pytest.mark.parametrize("boundary", ("linear", "flat"))
+def test_interpolate_annual_mean_to_monthly_values_mean_preserving(boundary):
+    annual = RNG.random((20, 3, 2))
+
+    res = interpolate_annual_mean_to_monthly_values(annual, boundary=boundary)
+
+    assert res.shape == (20, 12, 3, 2)
+    np.testing.assert_allclose(res.mean(axis=1), annual)
+
+
+@pytest.mark.parametrize("boundary", ("linear", "flat"))
+def test_interpolate_annual_mean_to_monthly_values_smooth(boundary):
+    annual = np.array([1.0, 3.0, 2.0, 5.0, 4.0])
+
+    res = interpolate_annual_mean_to_monthly_values(annual, boundary=boundary)
+
+    # No steps at the year boundaries i.e. the jump from December to January
+    # is no bigger than the largest jump within a year
+    jumps = np.abs(np.diff(res.ravel()))
+    year_boundary_jumps = jumps[11::12]
+    assert year_boundary_jumps.max() <= jumps.max()
+    # A step interpolation would have jumps of 2 or more
+    assert year_boundary_jumps.max() < 1
+
+
+def test_interpolate_annual_mean_to_monthly_values_linear():
+    annual = 280.0 + 2.0 * np.arange(10)
+
+    res = interpolate_annual_mean_to_monthly_values(annual, boundary="linear")
+
+    exp = 280.0 - 1.0 + 2.0 * (np.arange(10 * 12) + 0.5) / 12
+    np.testing.assert_allclose(res.ravel(), exp)
+
+
+def test_interpolate_annual_mean_to_monthly_values_flat():
+    annual = np.full(4, 3.2)
+
+    res = interpolate_annual_mean_to_monthly_values(annual, boundary="flat")
+
+    np.testing.assert_allclose(res, 3.2)
+
+
+def test_interpolate_annual_mean_to_monthly_values_errors():
+    with pytest.raises(ValueError, match="boundary must be one of"):
+        interpolate_annual_mean_to_monthly_values(np.arange(3.0), boundary="cubic")
+
+    with pytest.raises(ValueError, match="At least two years"):
+        interpolate_annual_mean_to_monthly_values(np.arange(1.0))
+
+
+def test_interpolate_annual_mean_to_monthly():
+    years = np.arange(2000, 2010)
+    inp = xr.Dataset(
+        {
+            "co2": (
+                ("scenario", "year"),
+                RNG.random((2, years.size)),
+                {"units": "ppm"},
+            ),
+            "ch4": (("year",), RNG.random(years.size), {"units": "ppm"}),
+            "other": (("scenario",), [1.0, 2.0]),
+        },
+        coords={"scenario": ["a", "b"], "year": years},
+    ).pint.quantify()
+
+    res = interpolate_annual_mean_to_monthly(inp)
+
+    assert res["co2"].dims == ("scenario", "year", "month")
+    assert res["ch4"].dims == ("year", "month")
+    np.testing.assert_equal(res["month"].to_numpy(), np.arange(1, 13))
+    np.testing.assert_equal(res["year"].to_numpy(), years)
+    xrt.assert_identical(res["other"], inp["other"])
+    for variable in ["co2", "ch4"]:
+        assert res[variable].data.units == inp[variable].data.units
+        xrt.assert_allclose(res[variable].mean("month"), inp[variable])
+
+    np.testing.assert_allclose(
+        res["co2"].sel(scenario="b").pint.dequantify().to_numpy(),
+        interpolate_annual_mean_to_monthly_values(
+            inp["co2"].sel(scenario="b").pint.dequantify().to_numpy()
+        ),
+    )
+
+
+def test_interpolate_annual_mean_to_monthly_non_dimension_coords():
+    years = np.arange(2000, 2005)
+    labels = np.array([f"y{y}" for y in years])
+    inp = xr.Dataset(
+        {"co2": (("year", "scenario"), RNG.random((years.size, 2)))},
+        coords={
+            "scenario": ["a", "b"],
+            "year": years,
+            "label": (("year",), labels),
+            "weight": (
+                ("scenario", "year"),
+                RNG.random((2, years.size)),
+                {"units": "kg"},
+            ),
+        },
+    ).pint.quantify()
+
+    res = interpolate_annual_mean_to_monthly(inp)
+
+    # Co-ordinates are repeated for each month, not interpolated
+    assert res["label"].dims == ("year", "month")
+    np.testing.assert_equal(
+        res["label"].to_numpy(), np.repeat(labels[:, np.newaxis], 12, axis=1)
+    )
+    assert res["weight"].dims == ("scenario", "year", "month")
+    assert res["weight"].data.units == inp["weight"].data.units
+    for month in range(1, 13):
+        xrt.assert_equal(res["weight"].sel(month=month, drop=True), inp["weight"])
+
+    assert res["co2"].dims == ("year", "month", "scenario")
+    xrt.assert_allclose(
+        res["co2"].mean("month"), inp["co2"].drop_vars(["label", "weight"])
+    )
+
+
+def test_interpolate_annual_mean_to_monthly_non_consecutive_years():
+    inp = xr.Dataset(
+        {"co2": (("year",), [1.0, 2.0, 3.0])}, coords={"year": [2000, 2001, 2003]}
+    )
+
+    with pytest.raises(ValueError, match="Years must be consecutive"):
+        interpolate_annual_mean_to_monthly(inp)
+
+
+def get_mean_preserving_reference(annual, boundary):
+    # Dense solve of the knot system, independent of the implementation
+    n_years = annual.size
+    boundary_diagonal = 1.0 if boundary == "linear" else 2.0
+    boundary_factor = 2.0 if boundary == "linear" else 3.0
+
+    system = (
+        np.diag(np.full(n_years + 1, 4.0))
+        + np.diag(np.ones(n_years), 1)
+        + np.diag(np.ones(n_years), -1)
+    )
+    system[0, :2] = [boundary_diagonal, 1.0]
+    system[-1, -2:] = [1.0, boundary_diagonal]
+    rhs = np.concatenate(
+        [
+            [boundary_factor * annual[0]],
+            3.0 * (annual[:-1] + annual[1:]),
+            [boundary_factor * annual[-1]],
+        ]
+    )
+    knots = np.linalg.solve(system, rhs)
+    curvature = 6.0 * annual - 3.0 * (knots[:-1] + knots[1:])
+
+    # Monthly means by (exact) Simpson's rule integration of each quadratic
+    t = np.arange(12 * 2 + 1) / (12 * 2)
+    values = (
+        np.outer(knots[:-1], 1 - t)
+        + np.outer(knots[1:], t)
+        + np.outer(curvature, t * (1 - t))
+    )
+
+    return (values[:, :-1:2] + 4 * values[:, 1::2] + values[:, 2::2]) / 6
+
+
+@pytest.mark.parametrize("n_years", (2, 3, 64, 65, 200))
+@pytest.mark.parametrize("boundary", ("linear", "flat"))
+def test_interpolate_annual_mean_to_monthly_values_reference(n_years, boundary):
+    annual = 280 + RNG.random(n_years)
+
+    res = interpolate_annual_mean_to_monthly_values(annual, boundary=boundary)
+
+    np.testing.assert_allclose(
+        res, get_mean_preserving_reference(annual, boundary), rtol=1e-13
+    )
+
+
+def test_get_mean_preserving_interpolation_operator():
+    operator = get_mean_preserving_interpolation_operator(150, "flat")
+
+    assert get_mean_preserving_interpolation_operator(150, "flat") is operator
+    assert get_mean_preserving_interpolation_operator(150, "linear") is not operator
+    with pytest.raises(ValueError, match="read-only"):
+        operator.blocks[0][-1][0, 0] = 1.0
+
+    annual = RNG.random((150, 4, 3))
+    res = operator.apply(annual)
+    assert res.shape == (150, 12, 4, 3)
+    np.testing.assert_allclose(
+        res[:, :, 2, 1],
+        get_mean_preserving_reference(annual[:, 2, 1], "flat"),
+        atol=1e-13,
+    )
+
+    with pytest.raises(ValueError, match="Expected 150 years, received: 149"):
+        operator.apply(annual[1:])
@@ -2,12 +2,30 @@
 Test :mod:`carpet_concentrations.xarray_utils`
 """
 import re
+from unittest.mock import patch
 
+import cf_xarray  # noqa: F401 # required to add cf accessors
+import numpy as np
+import pint_xarray
 import pytest
 import xarray as xr
+from openscm_units import unit_registry
 
-from carpet_concentrations.exceptions import CoordinateError
-from carpet_concentrations.xarray_utils import check_dimensions
+from carpet_concentrations.exceptions import CoordinateError, NotPintQuantifiedError
+from carpet_concentrations.xarray_utils import (
+    GMNHSH_REGIONS,
+    LatitudeBand,
+    calculate_regional_means,
+    calculate_weighted_area_mean,
+    calculate_weighted_area_mean_latitude_only,
+    check_dimensions,
+    get_area_weights,
+    get_chunk_indexers,
+    get_dataset_fingerprint,
+    get_latitude_band_weights,
+)
+
+pint_xarray.accessors.default_registry = pint_xarray.setup_registry(unit_registry)
 
 
 @pytest.mark.parametrize(
@@ -70,3 +88,346 @@ def test_check_dimensions(inp, exp_dims, extras_ok, exp_error_msg):
             check_dimensions(inp, exp_dims, extras_ok)
     else:
         assert check_dimensions(inp, exp_dims, extras_ok) is None
+
+
+@pytest.mark.parametrize(
+    "sizes, chunks, exp",
+    (
+        (
+            {"year": 3, "month": 12},
+            {"year": 2},
+            [{"year": slice(0, 2)}, {"year": slice(2, 3)}],
+        ),
+        (
+            {"year": 2, "scenario": 3},
+            {"year": 1, "scenario": 2},
+            [
+                {"year": slice(0, 1), "scenario": slice(0, 2)},
+                {"year": slice(0, 1), "scenario": slice(2, 3)},
+                {"year": slice(1, 2), "scenario": slice(0, 2)},
+                {"year": slice(1, 2), "scenario": slice(2, 3)},
+            ],
+        ),
+        (
+            {"year": 2},
+            {},
+            [{}],
+        ),
+    ),
+)
+def test_get_chunk_indexers(sizes, chunks, exp):
+    assert list(get_chunk_indexers(sizes, chunks)) == exp
+
+
+def test_get_chunk_indexers_invalid_chunk_size():
+    with pytest.raises(ValueError, match="Chunk sizes must be at least one"):
+        # Raised by the call, not on the first iteration
+        get_chunk_indexers({"year": 2}, {"year": 0})
+
+
+def test_get_dataset_fingerprint():
+    ds = xr.Dataset(
+        {"co2": (("year", "lat"), np.arange(6.0).reshape(2, 3), {"units": "ppm"})},
+        coords={"year": [2010, 2011], "lat": [-45, 0, 45]},
+    )
+
+    fingerprint = get_dataset_fingerprint(ds)
+    assert get_dataset_fingerprint(ds.copy(deep=True)) == fingerprint
+
+    changed = ds.copy(deep=True)
+    changed["co2"][0, 0] = 10.0
+    assert get_dataset_fingerprint(changed) != fingerprint
+
+    assert get_dataset_fingerprint(ds.rename({"co2": "ch4"})) != fingerprint
+
+    changed_units = ds.copy()
+    changed_units["co2"].attrs["units"] = "ppb"
+    assert get_dataset_fingerprint(changed_units) != fingerprint
+
+    assert get_dataset_fingerprint(ds.assign_coords(year=[2011, 2012])) != fingerprint
+
+
+def test_get_dataset_fingerprint_blocks():
+    ds = xr.Dataset(
+        {"co2": (("year", "lat"), np.arange(60.0).reshape(20, 3).T.T)},
+        coords={"year": np.arange(2000, 2020), "lat": [-45, 0, 45]},
+    )
+    ds_transposed = ds.copy(
+        data={"co2": np.asfortranarray(ds["co2"].to_numpy())}  # non-contiguous
+    )
+
+    fingerprint = get_dataset_fingerprint(ds)
+    with patch("carpet_concentrations.xarray_utils._FINGERPRINT_BLOCK_BYTES", 50):
+        assert get_dataset_fingerprint(ds) == fingerprint
+        assert get_dataset_fingerprint(ds_transposed) == fingerprint
+
+
+def test_get_dataset_fingerprint_dask(no_dask_compute):
+    ds = xr.Dataset(
+        {"co2": (("year", "lat"), np.arange(6.0).reshape(2, 3), {"units": "ppm"})},
+        coords={"year": [2010, 2011], "lat": [-45, 0, 45]},
+    )
+    ds_dask = ds.chunk({"year": 1})
+
+    fingerprint = get_dataset_fingerprint(ds_dask)
+    # The values aren't read
+    with no_dask_compute():
+        assert get_dataset_fingerprint(ds_dask.pint.quantify()) == fingerprint
+    assert get_dataset_fingerprint(ds.chunk({"year": 1})) == fingerprint
+    assert get_dataset_fingerprint((ds + 1).chunk({"year": 1})) != fingerprint
+
+
+@pytest.fixture
+def latitude_only_ds():
+    rng = np.random.default_rng(0)
+    lat = np.array([-67.5, -22.5, 22.5, 67.5])
+
+    return (
+        xr.Dataset(
+            {
+                "co2": (
+                    ("scenario", "lat"),
+                    rng.random((3, lat.size)),
+                    {"units": "ppm"},
+                ),
+                "ch4": (("lat",), rng.random(lat.size), {"units": "ppb"}),
+            },
+            coords={"scenario": ["a", "b", "c"], "lat": lat},
+        )
+        .cf.add_bounds("lat")
+        .pint.quantify({"lat_bounds": "deg"})
+    )
+
+
+def test_get_area_weights_latitude_only(latitude_only_ds):
+    res = get_area_weights(latitude_only_ds["lat_bounds"])
+
+    sin_bounds = np.sin(np.deg2rad([-90, -45, 0, 45, 90]))
+    exp = np.diff(sin_bounds) / 2
+    assert res.weights.dims == ("lat",)
+    np.testing.assert_allclose(res.weights.to_numpy(), exp)
+
+    # Cached
+    assert get_area_weights(latitude_only_ds["lat_bounds"].copy()) is res
+    with pytest.raises(ValueError, match="read-only"):
+        res.weights.data[0] = 1.0
+
+    # Units are taken into account
+    res_radians = get_area_weights(latitude_only_ds["lat_bounds"].pint.to("radian"))
+    np.testing.assert_allclose(res_radians.weights.to_numpy(), exp)
+
+
+def test_get_latitude_area_weights_not_quantified(latitude_only_ds):
+    with pytest.raises(NotPintQuantifiedError):
+        get_area_weights(latitude_only_ds["lat_bounds"].pint.dequantify())
+
+
+def test_calculate_weighted_area_mean_latitude_only(latitude_only_ds):
+    res = calculate_weighted_area_mean_latitude_only(latitude_only_ds, ["co2", "ch4"])
+
+    lat_bounds = latitude_only_ds["lat_bounds"].pint.to("radian").pint.dequantify()
+    area_weights = np.sin(lat_bounds).diff("bounds").squeeze()
+    for variable in ["co2", "ch4"]:
+        exp = (latitude_only_ds[variable] * area_weights).sum("lat") / area_weights.sum(
+            "lat"
+        )
+        xr.testing.assert_allclose(res[variable], exp)
+        assert res[variable].data.units == latitude_only_ds[variable].data.units
+
+    # Other variables are kept
+    xr.testing.assert_identical(res["lat_bounds"], latitude_only_ds["lat_bounds"])
+
+
+def test_calculate_weighted_area_mean_latitude_only_nan(latitude_only_ds):
+    latitude_only_ds["co2"].data.magnitude[:, 0] = np.nan
+
+    res = calculate_weighted_area_mean_latitude_only(latitude_only_ds, ["co2"])
+
+    # By default, NaN cells are skipped by the weighted sum, as in the
+    # original (sum-based) implementation
+    lat_bounds = latitude_only_ds["lat_bounds"].pint.to("radian").pint.dequantify()
+    area_weights = np.sin(lat_bounds).diff("bounds").squeeze()
+    exp = (latitude_only_ds["co2"] * area_weights).sum("lat") / area_weights.sum("lat")
+    assert not np.isnan(res["co2"].data.magnitude).any()
+    xr.testing.assert_allclose(res["co2"], exp)
+
+    res_propagated = calculate_weighted_area_mean_latitude_only(
+        latitude_only_ds, ["co2"], skipna=False
+    )
+    assert np.isnan(res_propagated["co2"].data.magnitude).all()
+    assert res_propagated["co2"].data.units == latitude_only_ds["co2"].data.units
+
+
+def test_calculate_weighted_area_mean_latitude_only_no_other_variables(
+    latitude_only_ds,
+):
+    res = calculate_weighted_area_mean_latitude_only(
+        latitude_only_ds, ["co2"], keep_other_variables=False
+    )
+    exp = calculate_weighted_area_mean_latitude_only(latitude_only_ds, ["co2"])
+
+    assert list(res.data_vars) == ["co2"]
+    assert "lat_bounds" not in res
+    assert "lat" not in res.dims
+    xr.testing.assert_identical(res["co2"], exp["co2"])
+
+
+@pytest.fixture
+def lat_lon_ds():
+    rng = np.random.default_rng(0)
+    # Irregular grid, with the last longitude cell wrapping around
+    lat_bounds = np.array([[-90, -30], [-30, 10], [10, 90]])
+    lon_bounds = np.array([[5, 100], [100, 270], [270, 360], [0, 5]])
+
+    return xr.Dataset(
+        {
+            "co2": (
+                ("scenario", "lat", "lon"),
+                rng.random((2, lat_bounds.shape[0], lon_bounds.shape[0])),
+                {"units": "ppm"},
+            ),
+        },
+        coords={
+            "scenario": ["a", "b"],
+            "lat": lat_bounds.mean(axis=1),
+            "lon": [52.5, 185, 315, 2.5],
+            "lat_bounds": (("lat", "bounds"), lat_bounds, {"units": "deg"}),
+            "lon_bounds": (("lon", "bounds"), lon_bounds, {"units": "deg"}),
+        },
+    ).pint.quantify()
+
+
+def get_exp_lat_lon_weights(lat_lon_ds):
+    lat_bounds = np.deg2rad(lat_lon_ds["lat_bounds"].pint.dequantify())
+    lon_bounds = np.deg2rad(lat_lon_ds["lon_bounds"].pint.dequantify())
+
+    areas = np.sin(lat_bounds).diff("bounds").squeeze() * (
+        lon_bounds.diff("bounds").squeeze() % (2 * np.pi)
+    )
+
+    return xr.DataArray(areas.transpose("lat", "lon").to_numpy(), dims=("lat", "lon"))
+
+
+def test_get_area_weights_lat_lon(lat_lon_ds):
+    res = get_area_weights(lat_lon_ds["lat_bounds"], lat_lon_ds["lon_bounds"])
+
+    exp = get_exp_lat_lon_weights(lat_lon_ds)
+    assert res.weights.dims == ("lat", "lon")
+    xr.testing.assert_allclose(res.weights, exp / exp.sum())
+
+    assert (
+        get_area_weights(lat_lon_ds["lat_bounds"], lat_lon_ds["lon_bounds"].copy())
+        is res
+    )
+
+
+def test_calculate_weighted_area_mean_lat_lon(lat_lon_ds):
+    res = calculate_weighted_area_mean(lat_lon_ds, ["co2"])
+
+    areas = get_exp_lat_lon_weights(lat_lon_ds)
+    exp = (lat_lon_ds["co2"] * areas).sum(["lat", "lon"]) / areas.sum()
+
+    assert res["co2"].dims == ("scenario",)
+    assert res["co2"].data.units == lat_lon_ds["co2"].data.units
+    xr.testing.assert_allclose(res["co2"], exp)
+
+
+def test_calculate_weighted_area_mean_mask(lat_lon_ds):
+    mask = lat_lon_ds["lat"] > 0
+    res = calculate_weighted_area_mean(lat_lon_ds, ["co2"], mask=mask)
+
+    areas = get_exp_lat_lon_weights(lat_lon_ds).where(mask, 0)
+    exp = (lat_lon_ds["co2"] * areas).sum(["lat", "lon"]) / areas.sum()
+
+    xr.testing.assert_allclose(res["co2"], exp)
+
+
+def test_calculate_weighted_area_mean_mask_invalid_dims(lat_lon_ds):
+    mask = lat_lon_ds["co2"].pint.dequantify() > 0.5
+
+    with pytest.raises(CoordinateError):
+        calculate_weighted_area_mean(lat_lon_ds, ["co2"], mask=mask)
+
+
+def test_calculate_weighted_area_mean_latitude_only_grid(latitude_only_ds):
+    res = calculate_weighted_area_mean(latitude_only_ds, ["co2", "ch4"])
+    exp = calculate_weighted_area_mean_latitude_only(
+        latitude_only_ds, ["co2", "ch4"], keep_other_variables=False
+    )
+
+    xr.testing.assert_identical(res, exp)
+
+
+def test_calculate_regional_means_gmnhsh(latitude_only_ds):
+    res = calculate_regional_means(latitude_only_ds, ["co2", "ch4"])
+
+    assert res["co2"].dims == ("scenario", "region")
+    assert res["region"].to_numpy().tolist() == [r.name for r in GMNHSH_REGIONS]
+    for region, mask in (
+        ("World", None),
+        ("Northern Hemisphere", latitude_only_ds["lat"] > 0),
+        ("Southern Hemisphere", latitude_only_ds["lat"] < 0),
+    ):
+        exp = calculate_weighted_area_mean(latitude_only_ds, ["co2", "ch4"], mask=mask)
+        for variable in ["co2", "ch4"]:
+            xr.testing.assert_allclose(
+                res[variable].sel(region=region, drop=True), exp[variable]
+            )
+            assert res[variable].data.units == latitude_only_ds[variable].data.units
+
+
+def test_get_latitude_band_weights_partial_overlap(latitude_only_ds):
+    regions = (LatitudeBand("30N-90N", 30.0, 90.0),)
+    res = get_latitude_band_weights(latitude_only_ds["lat_bounds"], regions=regions)
+
+    # Only the part of the 0-45N cell north of 30N counts
+    exp = np.array([0, 0, np.sin(np.pi / 4) - 0.5, 1 - np.sin(np.pi / 4)])
+    assert res.weights.dims == ("region", "lat")
+    np.testing.assert_allclose(res.weights.to_numpy()[0], exp / exp.sum())
+
+    # Cached
+    assert (
+        get_latitude_band_weights(
+            latitude_only_ds["lat_bounds"].copy(), regions=regions
+        )
+        is res
+    )
+
+
+def test_calculate_regional_means_lat_lon(lat_lon_ds):
+    regions = (LatitudeBand("World", -90.0, 90.0), LatitudeBand("10N-90N", 10.0, 90.0))
+    res = calculate_regional_means(lat_lon_ds, ["co2"], regions=regions)
+
+    # The band's edge is a cell edge so we can compare with the masked mean
+    exp_band = calculate_weighted_area_mean(
+        lat_lon_ds, ["co2"], mask=lat_lon_ds["lat"] > 10
+    )
+    xr.testing.assert_allclose(
+        res["co2"].sel(region="10N-90N", drop=True), exp_band["co2"]
+    )
+    exp_gm = calculate_weighted_area_mean(lat_lon_ds, ["co2"])
+    xr.testing.assert_allclose(res["co2"].sel(region="World", drop=True), exp_gm["co2"])
+
+
+def test_calculate_regional_means_mask(lat_lon_ds):
+    mask = lat_lon_ds["lon"] < 100
+    area_weights = get_latitude_band_weights(
+        lat_lon_ds["lat_bounds"], lon_bounds=lat_lon_ds["lon_bounds"]
+    )
+    res = area_weights.area_mean(lat_lon_ds["co2"], mask=mask)
+
+    exp = calculate_weighted_area_mean(lat_lon_ds, ["co2"], mask=mask)
+    xr.testing.assert_allclose(res.sel(region="World", drop=True), exp["co2"])
+
+
+def test_latitude_band_invalid():
+    with pytest.raises(ValueError, match="upper"):
+        LatitudeBand("invalid", 10.0, -10.0)
+
+
+def test_get_latitude_band_weights_no_overlap(latitude_only_ds):
+    with pytest.raises(ValueError, match="don't overlap"):
+        get_latitude_band_weights(
+            latitude_only_ds["lat_bounds"].isel(lat=slice(2, None)),
+            regions=GMNHSH_REGIONS,
+        )